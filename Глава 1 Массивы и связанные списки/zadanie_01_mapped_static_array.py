@@ -0,0 +1,288 @@
+"""
+Задание 1 (дополнение). Статический массив в файле, отображенном в память
+Массив фиксированной ёмкости хранится в бинарном файле и отображается в
+память через mmap. Данные переживают перезапуск программы, а объем массива
+может превышать объем оперативной памяти (ОС подгружает страницы по запросу).
+
+Формат файла:
+    заголовок (32 байта): магическое число, код типа, ёмкость, размер
+    данные: capacity элементов фиксированной ширины (код типа модуля array)
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+import time
+from array import array
+
+from zadanie_01_static_array import StaticArray
+
+
+# Магическое число, код типа, 3 байта выравнивания, ёмкость, размер, резерв
+HEADER_FORMAT = "<4sc3xQQQ"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+MAGIC = b"SARR"
+
+# Сколько элементов копировать за раз при поиске
+FIND_CHUNK = 1 << 16
+
+
+class MappedStaticArray(StaticArray):
+    """
+    Статический массив поверх файла, отображенного в память.
+    
+    API совпадает с StaticArray: pushBack, pushFront, insert, remove, get,
+    find, а также групповые операции. Все сдвиги выполняются срезами
+    memoryview прямо в отображенной памяти.
+    """
+    
+    def __init__(self, path, capacity=None, dtype='q'):
+        """
+        Открытие или создание массива в файле.
+        Трудоемкость: O(1) - файл не читается целиком, данные
+        отображаются в память без копирования.
+        
+        Args:
+            path: путь к файлу
+            capacity: ёмкость нового массива. Если None - открывается
+                      существующий файл, иначе файл создается заново.
+            dtype: код типа модуля array для нового массива
+        
+        Raises:
+            ValueError: если файл имеет неверный формат
+        """
+        self.path = path
+        
+        if capacity is None:
+            self._file = open(path, "r+b")
+            header = self._file.read(HEADER_SIZE)
+            if len(header) < HEADER_SIZE:
+                self._file.close()
+                raise ValueError(f"Файл {path} слишком короткий для заголовка")
+            magic, code, capacity, size, _ = struct.unpack(HEADER_FORMAT, header)
+            if magic != MAGIC:
+                self._file.close()
+                raise ValueError(f"Файл {path} не является MappedStaticArray")
+            dtype = code.decode("ascii")
+        else:
+            self._file = open(path, "w+b")
+            size = 0
+            # truncate создает разреженный файл - O(1), без записи нулей
+            self._file.truncate(HEADER_SIZE + capacity * array(dtype).itemsize)
+        
+        self.capacity = capacity
+        self.size = size
+        self.dtype = dtype
+        self._empty = 0
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        self.data = memoryview(self._mm)[HEADER_SIZE:].cast(dtype)
+        self._dirty_pages = set()
+        self._write_header()
+    
+    def _write_header(self):
+        """Запись заголовка (размер и ёмкость) в первую страницу."""
+        struct.pack_into(HEADER_FORMAT, self._mm, 0, MAGIC,
+                         self.dtype.encode("ascii"), self.capacity, self.size, 0)
+        self._dirty_pages.add(0)
+    
+    def _mark_dirty(self, start, stop):
+        """
+        Пометка страниц, содержащих элементы [start, stop), как измененных.
+        Трудоемкость: O(число страниц в диапазоне).
+        """
+        if start >= stop:
+            return
+        itemsize = self.data.itemsize
+        first = (HEADER_SIZE + start * itemsize) // mmap.PAGESIZE
+        last = (HEADER_SIZE + stop * itemsize - 1) // mmap.PAGESIZE
+        self._dirty_pages.update(range(first, last + 1))
+    
+    def pushBack(self, value):
+        """Добавление в конец. O(1), помечается одна страница."""
+        super().pushBack(value)
+        self._mark_dirty(self.size - 1, self.size)
+        self._write_header()
+    
+    def pushFront(self, value):
+        """Добавление в начало. O(n), помечаются страницы сдвинутой части."""
+        super().pushFront(value)
+        self._mark_dirty(0, self.size)
+        self._write_header()
+    
+    def insert(self, index, value):
+        """Вставка на позицию. O(n), помечаются страницы от index до конца."""
+        super().insert(index, value)
+        self._mark_dirty(index, self.size)
+        self._write_header()
+    
+    def remove(self, index):
+        """Удаление по индексу. O(n), помечаются страницы от index до конца."""
+        removed_value = super().remove(index)
+        self._mark_dirty(index, self.size + 1)
+        self._write_header()
+        return removed_value
+    
+    def insert_many(self, index, iterable):
+        """Групповая вставка. O(n + k)."""
+        super().insert_many(index, iterable)
+        self._mark_dirty(index, self.size)
+        self._write_header()
+    
+    def remove_range(self, start, stop):
+        """Удаление диапазона [start, stop). O(n)."""
+        old_size = self.size
+        removed = super().remove_range(start, stop)
+        self._mark_dirty(start, old_size)
+        self._write_header()
+        return removed
+    
+    def find(self, value):
+        """
+        Поиск элемента по значению.
+        Трудоемкость: O(n). Живая часть просматривается блоками по
+        FIND_CHUNK элементов: каждый блок копируется в array и
+        проверяется встроенным index, поэтому память на поиск ограничена.
+        """
+        for start in range(0, self.size, FIND_CHUNK):
+            stop = min(start + FIND_CHUNK, self.size)
+            chunk = array(self.dtype)
+            chunk.frombytes(self.data[start:stop].cast("B"))
+            try:
+                return start + chunk.index(value)
+            except ValueError:
+                pass
+        return -1
+    
+    def flush(self):
+        """
+        Запись измененных страниц на диск.
+        Трудоемкость: O(d), d - число измененных страниц. Соседние
+        страницы объединяются в один вызов mmap.flush.
+        
+        Returns:
+            Количество записанных страниц
+        """
+        pages = sorted(self._dirty_pages)
+        i = 0
+        while i < len(pages):
+            j = i
+            while j + 1 < len(pages) and pages[j + 1] == pages[j] + 1:
+                j += 1
+            offset = pages[i] * mmap.PAGESIZE
+            length = min((pages[j] + 1) * mmap.PAGESIZE, len(self._mm)) - offset
+            self._mm.flush(offset, length)
+            i = j + 1
+        self._dirty_pages.clear()
+        return len(pages)
+    
+    @classmethod
+    def from_buffer(cls, buffer, dtype, capacity=None, *, path):
+        """
+        Создание массива в файле path из объекта с буферным протоколом.
+        Трудоемкость: O(n) - одно копирование прямо в отображенную
+        память (data - memoryview нужного типа), без промежуточного array.
+        
+        Raises:
+            ValueError: если длина буфера не кратна размеру элемента
+            OverflowError: если данные не помещаются в capacity
+        """
+        with memoryview(buffer) as view:
+            raw = view.cast('B')
+            itemsize = array(dtype).itemsize
+            if raw.nbytes % itemsize:
+                raise ValueError(f"Длина буфера {raw.nbytes} не кратна размеру элемента {itemsize}")
+            n = raw.nbytes // itemsize
+            if capacity is None:
+                capacity = n
+            if n > capacity:
+                raise OverflowError(f"Недостаточно места: нужно {n}, свободно {capacity}")
+            arr = cls(path, capacity, dtype)
+            arr.data[:n] = raw.cast(dtype)
+        arr.size = n
+        arr._mark_dirty(0, n)
+        arr._write_header()
+        return arr
+    
+    def close(self):
+        """
+        Сброс изменений на диск и закрытие файла.
+        Все представления из as_memoryview() должны быть освобождены
+        (view.release()), иначе mmap не может быть закрыт (BufferError).
+        """
+        if self._mm.closed:
+            return
+        self.flush()
+        self.data.release()
+        self._mm.close()
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def __str__(self):
+        """Строковое представление массива."""
+        if self.size > 10:
+            head = ', '.join(map(str, self.data[:5].tolist()))
+            tail = ', '.join(map(str, self.data[self.size - 5:self.size].tolist()))
+            return (f"MappedStaticArray([{head} ... {tail}], "
+                    f"size={self.size}, capacity={self.capacity})")
+        return f"MappedStaticArray({self.data[:self.size].tolist()})"
+
+
+# Тестирование
+if __name__ == "__main__":
+    print("=== Тестирование MappedStaticArray ===\n")
+    
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "numbers.bin")
+    
+    print("1. Создание массива в файле и базовые операции:")
+    with MappedStaticArray(path, capacity=10, dtype='q') as arr:
+        for i in range(5):
+            arr.pushBack(i * 10)
+        arr.pushFront(100)
+        arr.insert(3, 999)
+        print(f"   Массив: {arr}")
+        print(f"   Удален элемент: {arr.remove(2)}")
+        print(f"   Поиск 30: индекс {arr.find(30)}")
+        print(f"   Записано страниц при flush: {arr.flush()}")
+        print(f"   Повторный flush без изменений: {arr.flush()} страниц")
+    
+    print("\n2. Повторное открытие файла (данные сохранились):")
+    with MappedStaticArray(path) as arr:
+        print(f"   Массив: {arr}, get(0) = {arr.get(0)}")
+        view = arr.as_memoryview()
+        print(f"   as_memoryview() прямо в отображенный файл: {view.tolist()}")
+        view.release()
+    
+    N = 10**6
+    print(f"\n3. Большой массив ({N} элементов):")
+    with MappedStaticArray(path, capacity=N, dtype='q') as arr:
+        arr.extend(range(N))
+        arr.flush()
+        arr.remove(N - 1)
+        print(f"   Изменение в конце -> записано страниц: {arr.flush()}")
+    
+    start_time = time.perf_counter()
+    arr = MappedStaticArray(path)
+    open_time = time.perf_counter() - start_time
+    print(f"   Открытие файла: {open_time * 1000:.3f} мс (без чтения данных)")
+    start_time = time.perf_counter()
+    index = arr.find(N - 2)
+    find_time = time.perf_counter() - start_time
+    print(f"   find({N - 2}) = {index} за {find_time:.4f} сек")
+    arr.close()
+    
+    os.remove(path)
+    os.rmdir(directory)
+    
+    print("\n=== Анализ трудоемкости ===")
+    print("Открытие:      O(1) - отображение файла без чтения")
+    print("pushBack/get:  O(1)")
+    print("insert/remove: O(n) - сдвиг срезом в отображенной памяти")
+    print("find:          O(n) - поиск блоками")
+    print("flush:         O(d) - только измененные страницы")
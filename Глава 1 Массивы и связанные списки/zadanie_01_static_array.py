@@ -2,20 +2,45 @@
 Задание 1. Статический массив
 Реализовать функции: pushBack, pushFront, insert(index, value), remove(index), find(value).
 Оценить трудоемкость каждой операции (в комментариях).
+
+Дополнительно: типизированный режим хранения (параметр dtype) на основе
+модуля array - компактный буфер из 4-8 байт на элемент вместо ссылки
+на упакованный объект Python; отсортированный вариант SortedStaticArray
+с бинарным поиском; экспорт содержимого без копирования (memoryview).
 """
 
+import sys
+import time
+import tracemalloc
+from array import array
+from bisect import bisect_left, bisect_right
+
+# array.index принимает границы start/stop только с Python 3.10
+ARRAY_INDEX_BOUNDS = sys.version_info >= (3, 10)
+
 
 class StaticArray:
-    def __init__(self, capacity):
+    def __init__(self, capacity, dtype=None):
         """
         Инициализация статического массива с фиксированной ёмкостью.
         
         Args:
             capacity: максимальная вместимость массива
+            dtype: код типа модуля array ('i', 'q', 'd' и т.д.).
+                   None - обычный список Python (любые объекты).
+                   С dtype элементы хранятся в компактном буфере
+                   (4-8 байт на элемент вместо указателя и объекта).
         """
         self.capacity = capacity
         self.size = 0
-        self.data = [None] * capacity
+        self.dtype = dtype
+        if dtype is None:
+            self._empty = None
+            self.data = [None] * capacity
+        else:
+            # Пустые ячейки типизированного буфера заполнены нулями
+            self._empty = 0
+            self.data = array(dtype, [0]) * capacity
     
     def pushBack(self, value):
         """
@@ -38,6 +63,7 @@ class StaticArray:
         """
         Добавление элемента в начало массива.
         Трудоемкость: O(n) - требуется сдвинуть все существующие элементы вправо.
+        Сдвиг выполняется одним присваиванием среза (копирование на C).
         
         Args:
             value: значение для добавления
@@ -48,9 +74,8 @@ class StaticArray:
         if self.size >= self.capacity:
             raise OverflowError("Массив заполнен, невозможно добавить элемент")
         
-        # Сдвигаем все элементы вправо
-        for i in range(self.size, 0, -1):
-            self.data[i] = self.data[i - 1]
+        # Сдвигаем все элементы вправо одним срезом
+        self.data[1:self.size + 1] = self.data[0:self.size]
         
         self.data[0] = value
         self.size += 1
@@ -74,9 +99,8 @@ class StaticArray:
         if index < 0 or index > self.size:
             raise IndexError(f"Индекс {index} выходит за границы [0, {self.size}]")
         
-        # Сдвигаем элементы вправо от позиции вставки
-        for i in range(self.size, index, -1):
-            self.data[i] = self.data[i - 1]
+        # Сдвигаем элементы вправо от позиции вставки одним срезом
+        self.data[index + 1:self.size + 1] = self.data[index:self.size]
         
         self.data[index] = value
         self.size += 1
@@ -100,19 +124,95 @@ class StaticArray:
         
         removed_value = self.data[index]
         
-        # Сдвигаем элементы влево
-        for i in range(index, self.size - 1):
-            self.data[i] = self.data[i + 1]
+        # Сдвигаем элементы влево одним срезом
+        self.data[index:self.size - 1] = self.data[index + 1:self.size]
         
-        self.data[self.size - 1] = None
+        self.data[self.size - 1] = self._empty
         self.size -= 1
         
         return removed_value
     
+    def _pack(self, values):
+        """Упаковка значений в контейнер того же типа, что и буфер."""
+        if self.dtype is None:
+            return list(values)
+        if isinstance(values, array) and values.typecode == self.dtype:
+            return values  # Уже нужного типа - без лишней копии
+        return array(self.dtype, values)
+    
+    def insert_many(self, index, iterable):
+        """
+        Вставка группы элементов начиная с позиции index.
+        Трудоемкость: O(n + k) - один сдвиг хвоста на k позиций
+        и одна запись блока (оба - присваивания срезов).
+        
+        Args:
+            index: индекс, на который встанет первый элемент группы
+            iterable: вставляемые значения (порядок сохраняется)
+        
+        Raises:
+            OverflowError: если группа не помещается в массив
+            IndexError: если индекс выходит за границы
+        """
+        if index < 0 or index > self.size:
+            raise IndexError(f"Индекс {index} выходит за границы [0, {self.size}]")
+        
+        values = self._pack(iterable)
+        k = len(values)
+        if self.size + k > self.capacity:
+            raise OverflowError(
+                f"Недостаточно места: нужно {k}, свободно {self.capacity - self.size}"
+            )
+        
+        self.data[index + k:self.size + k] = self.data[index:self.size]
+        self.data[index:index + k] = values
+        self.size += k
+    
+    def extend(self, iterable):
+        """
+        Добавление группы элементов в конец массива.
+        Трудоемкость: O(k).
+        """
+        self.insert_many(self.size, iterable)
+    
+    def pushFront_many(self, iterable):
+        """
+        Добавление группы элементов в начало массива.
+        Группа вставляется блоком в исходном порядке:
+        pushFront_many([1, 2]) для [3] даёт [1, 2, 3].
+        Трудоемкость: O(n + k) - один сдвиг вместо k сдвигов.
+        """
+        self.insert_many(0, iterable)
+    
+    def remove_range(self, start, stop):
+        """
+        Удаление элементов с индексами [start, stop).
+        Трудоемкость: O(n) - один сдвиг хвоста влево на (stop - start) позиций.
+        
+        Returns:
+            Список удаленных значений
+        
+        Raises:
+            IndexError: если диапазон выходит за границы
+        """
+        if start < 0 or stop > self.size or start > stop:
+            raise IndexError(f"Диапазон [{start}, {stop}) выходит за границы [0, {self.size}]")
+        
+        removed = list(self.data[start:stop])
+        k = stop - start
+        self.data[start:self.size - k] = self.data[stop:self.size]
+        self.data[self.size - k:self.size] = self._pack([self._empty] * k)
+        self.size -= k
+        
+        return removed
+    
     def find(self, value):
         """
         Поиск элемента по значению.
         Трудоемкость: O(n) - требуется последовательный перебор всех элементов.
+        Перебор выполняется встроенным методом index прямо по буферу
+        (в пределах живой части [0, size)), без цикла на Python; для
+        типизированного буфера до Python 3.10 - циклом по [0, size).
         
         Args:
             value: значение для поиска
@@ -120,10 +220,15 @@ class StaticArray:
         Returns:
             Индекс первого найденного элемента или -1, если не найден
         """
-        for i in range(self.size):
-            if self.data[i] == value:
-                return i
-        return -1
+        if self.dtype is not None and not ARRAY_INDEX_BOUNDS:
+            for i in range(self.size):
+                if self.data[i] == value:
+                    return i
+            return -1
+        try:
+            return self.data.index(value, 0, self.size)
+        except ValueError:
+            return -1
     
     def get(self, index):
         """
@@ -134,14 +239,242 @@ class StaticArray:
             raise IndexError(f"Индекс {index} выходит за границы [0, {self.size - 1}]")
         return self.data[index]
     
+    def as_memoryview(self):
+        """
+        Представление живой части [0, size) без копирования.
+        Трудоемкость: O(1). Подходит для struct.unpack_from,
+        socket.send, numpy.frombuffer, записи в shared_memory и т.д.
+        Изменения через представление видны в массиве (и наоборот).
+        
+        Raises:
+            TypeError: для массива на списке (dtype=None) - у списка
+                       объектов нет непрерывного буфера с числами
+        """
+        try:
+            view = memoryview(self.data)
+        except TypeError:
+            raise TypeError("Экспорт буфера доступен только для типизированного "
+                            "массива (dtype)") from None
+        return view[:self.size]
+    
+    def to_bytes(self):
+        """
+        Копия живой части в bytes (машинный порядок байтов).
+        Трудоемкость: O(n) - одно копирование на C.
+        """
+        return self.as_memoryview().tobytes()
+    
+    @classmethod
+    def from_buffer(cls, buffer, dtype, capacity=None):
+        """
+        Создание типизированного массива из объекта с буферным
+        протоколом (bytes, bytearray, memoryview, mmap, array, ndarray).
+        Трудоемкость: O(n) - одно копирование на C прямо в буфер data,
+        без промежуточного array.
+        
+        Args:
+            buffer: исходные данные в машинном формате dtype
+            dtype: код типа модуля array
+            capacity: ёмкость (по умолчанию - число элементов в буфере)
+        
+        Raises:
+            ValueError: если длина буфера не кратна размеру элемента
+            OverflowError: если данные не помещаются в capacity
+        """
+        with memoryview(buffer) as view:
+            raw = view.cast('B')
+            itemsize = array(dtype).itemsize
+            if raw.nbytes % itemsize:
+                raise ValueError(f"Длина буфера {raw.nbytes} не кратна размеру элемента {itemsize}")
+            n = raw.nbytes // itemsize
+            arr = cls(n if capacity is None else capacity, dtype=dtype)
+            if n > arr.capacity:
+                raise OverflowError(f"Недостаточно места: нужно {n}, свободно {arr.capacity}")
+            # Срез array принимает только array, поэтому запись идет
+            # через memoryview над data - это та же память
+            with memoryview(arr.data) as target:
+                target[:n] = raw.cast(dtype)
+        arr.size = n
+        return arr
+    
     def __str__(self):
         """Строковое представление массива."""
-        return f"StaticArray({self.data[:self.size]})"
+        return f"StaticArray({list(self.data[:self.size])})"
     
     def __repr__(self):
         return self.__str__()
 
 
+class SortedStaticArray(StaticArray):
+    """
+    Статический массив, элементы которого всегда упорядочены по возрастанию.
+    Поиск выполняется бинарным поиском по живой части data[0:size]
+    (через параметр hi модуля bisect, без копирования среза).
+    """
+    
+    def _check_order(self, index, values):
+        """
+        Проверка, что вставка values на позицию index не нарушит порядок.
+        
+        Raises:
+            ValueError: если порядок будет нарушен
+        """
+        if not values:
+            return
+        for i in range(1, len(values)):
+            if values[i] < values[i - 1]:
+                raise ValueError("Вставляемые значения не упорядочены")
+        if index > 0 and values[0] < self.data[index - 1]:
+            raise ValueError(f"Вставка на позицию {index} нарушит порядок")
+        if index < self.size and self.data[index] < values[-1]:
+            raise ValueError(f"Вставка на позицию {index} нарушит порядок")
+    
+    def add(self, value):
+        """
+        Вставка элемента с сохранением порядка.
+        Трудоемкость: O(log n) на поиск позиции + O(n) на сдвиг срезом.
+        
+        Returns:
+            Индекс, на который встал элемент
+        """
+        index = self.upper_bound(value)
+        StaticArray.insert(self, index, value)
+        return index
+    
+    def pushBack(self, value):
+        """Добавление в конец. Допустимо, только если не нарушает порядок."""
+        self._check_order(self.size, [value])
+        super().pushBack(value)
+    
+    def pushFront(self, value):
+        """Добавление в начало. Допустимо, только если не нарушает порядок."""
+        self._check_order(0, [value])
+        super().pushFront(value)
+    
+    def insert(self, index, value):
+        """Вставка на позицию. Допустима, только если не нарушает порядок."""
+        if 0 <= index <= self.size:
+            self._check_order(index, [value])
+        super().insert(index, value)
+    
+    def insert_many(self, index, iterable):
+        """Групповая вставка. Допустима, только если не нарушает порядок."""
+        values = self._pack(iterable)
+        if 0 <= index <= self.size:
+            self._check_order(index, values)
+        super().insert_many(index, values)
+    
+    @classmethod
+    def from_buffer(cls, buffer, dtype, capacity=None):
+        """
+        Как StaticArray.from_buffer, но данные буфера должны быть
+        упорядочены по возрастанию. Трудоемкость: O(n).
+        
+        Raises:
+            ValueError: если данные не упорядочены
+        """
+        arr = super().from_buffer(buffer, dtype, capacity)
+        data = arr.data
+        for i in range(1, arr.size):
+            if data[i] < data[i - 1]:
+                raise ValueError("Данные буфера не упорядочены")
+        return arr
+    
+    def lower_bound(self, value):
+        """
+        Индекс первого элемента >= value (или size, если таких нет).
+        Трудоемкость: O(log n).
+        """
+        return bisect_left(self.data, value, 0, self.size)
+    
+    def upper_bound(self, value):
+        """
+        Индекс первого элемента > value (или size, если таких нет).
+        Трудоемкость: O(log n).
+        """
+        return bisect_right(self.data, value, 0, self.size)
+    
+    def find(self, value):
+        """
+        Поиск элемента бинарным поиском.
+        Трудоемкость: O(log n).
+        
+        Returns:
+            Индекс первого вхождения или -1, если не найден
+        """
+        index = self.lower_bound(value)
+        if index < self.size and self.data[index] == value:
+            return index
+        return -1
+    
+    def count_range(self, lo, hi):
+        """
+        Количество элементов x, для которых lo <= x <= hi.
+        Трудоемкость: O(log n) - два бинарных поиска.
+        """
+        if hi < lo:
+            return 0
+        return self.upper_bound(hi) - self.lower_bound(lo)
+    
+    def __str__(self):
+        """Строковое представление массива."""
+        return f"SortedStaticArray({list(self.data[:self.size])})"
+
+
+def compare_typed_vs_list(N=100000):
+    """
+    Сравнение памяти и времени: массив на списке vs типизированный буфер.
+    Память измеряется через tracemalloc (пиковое выделение при заполнении).
+    """
+    print(f"\n=== Список vs типизированный буфер ({N} элементов) ===\n")
+    print(f"   {'Хранилище':<14}{'Память, байт':>14}{'Байт/элем':>11}"
+          f"{'pushBack, с':>13}{'find, с':>10}")
+    
+    for dtype in (None, 'i', 'q', 'd'):
+        tracemalloc.start()
+        arr = StaticArray(N, dtype=dtype)
+        start_time = time.perf_counter()
+        for i in range(N):
+            # Значения вне кэша малых целых, как в реальных данных
+            arr.pushBack(i + 1000)
+        push_time = time.perf_counter() - start_time
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        start_time = time.perf_counter()
+        arr.find(-1)  # Худший случай: элемент отсутствует
+        find_time = time.perf_counter() - start_time
+        
+        name = "list" if dtype is None else f"array('{dtype}')"
+        print(f"   {name:<14}{peak:>14}{peak / N:>11.1f}"
+              f"{push_time:>13.4f}{find_time:>10.4f}")
+    
+    print("\n   Список хранит указатель (8 байт) + объект int/float (28-32 байта)")
+    print("   на каждый элемент; типизированный буфер - только 4-8 байт.")
+
+
+def compare_export(N=10**7):
+    """
+    Сравнение способов передать содержимое массива дальше:
+    срез data[:size] (копия) против as_memoryview() (без копирования).
+    """
+    print(f"\n=== Экспорт {N} элементов array('q') ===\n")
+    arr = StaticArray(N, dtype='q')
+    arr.extend(range(N))
+    
+    start_time = time.perf_counter()
+    arr.data[:arr.size]
+    slice_time = time.perf_counter() - start_time
+    
+    start_time = time.perf_counter()
+    view = arr.as_memoryview()
+    view_time = time.perf_counter() - start_time
+    
+    print(f"   Срез data[:size]: {slice_time * 1000:8.3f} мс (копия {view.nbytes / 2**20:.0f} МБ)")
+    print(f"   as_memoryview():  {view_time * 1000:8.3f} мс (без копирования)")
+    view.release()
+
+
 # Тестирование
 if __name__ == "__main__":
     print("=== Тестирование статического массива ===\n")
@@ -190,9 +523,64 @@ if __name__ == "__main__":
     index = arr.find(777)
     print(f"   Результат: {index} (не найден)")
     
+    # Типизированный режим
+    print("\n8. Типизированный массив (dtype='q'):")
+    typed = StaticArray(5, dtype='q')
+    for i in range(3):
+        typed.pushBack(i * 100)
+    typed.pushFront(-1)
+    typed.remove(1)
+    print(f"   Массив: {typed}")
+    print(f"   Поиск 200: индекс {typed.find(200)}")
+    
+    # Групповые операции
+    print("\n9. Групповые операции (extend, pushFront_many, insert_many, remove_range):")
+    bulk = StaticArray(12)
+    bulk.extend([1, 2, 3])
+    bulk.pushFront_many([-2, -1])
+    bulk.insert_many(2, [0, 0])
+    print(f"   После вставок: {bulk}")
+    removed = bulk.remove_range(2, 4)
+    print(f"   remove_range(2, 4) удалил {removed}: {bulk}")
+    
+    # Отсортированный массив
+    print("\n10. Отсортированный массив (SortedStaticArray):")
+    sorted_arr = SortedStaticArray(10)
+    for value in [50, 10, 40, 20, 30, 20]:
+        sorted_arr.add(value)
+    print(f"   Массив: {sorted_arr}")
+    print(f"   find(20) = {sorted_arr.find(20)}, find(25) = {sorted_arr.find(25)}")
+    print(f"   lower_bound(20) = {sorted_arr.lower_bound(20)}, "
+          f"upper_bound(20) = {sorted_arr.upper_bound(20)}")
+    print(f"   count_range(15, 40) = {sorted_arr.count_range(15, 40)}")
+    try:
+        sorted_arr.pushFront(99)
+    except ValueError as e:
+        print(f"   pushFront(99): ошибка - {e}")
+    
+    # Экспорт без копирования
+    print("\n11. Экспорт буфера (as_memoryview, to_bytes, from_buffer):")
+    shared = StaticArray(8, dtype='q')
+    shared.extend([1, 2, 3])
+    view = shared.as_memoryview()
+    view[0] = 100  # Запись через представление видна в массиве
+    print(f"   Массив после записи через memoryview: {shared}")
+    raw = shared.to_bytes()
+    print(f"   to_bytes(): {len(raw)} байт")
+    restored = StaticArray.from_buffer(raw, 'q', capacity=5)
+    print(f"   from_buffer(): {restored}, ёмкость {restored.capacity}")
+    view.release()
+    
+    compare_typed_vs_list()
+    compare_export()
+    
     print("\n=== Анализ трудоемкости ===")
     print("pushBack:    O(1) - добавление в конец")
     print("pushFront:   O(n) - сдвиг всех элементов")
     print("insert:      O(n) - сдвиг части элементов")
     print("remove:      O(n) - сдвиг части элементов")
     print("find:        O(n) - последовательный поиск")
+    print("insert_many: O(n + k) - один сдвиг на k позиций")
+    print("remove_range: O(n) - один сдвиг на (stop - start) позиций")
+    print("Sorted find/lower_bound/upper_bound/count_range: O(log n)")
+    print("as_memoryview: O(1) - без копирования")
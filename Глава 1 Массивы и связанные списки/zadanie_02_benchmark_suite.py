@@ -0,0 +1,261 @@
+"""
+Задание 2 (дополнение). Набор бенчмарков для массивов
+Замеры операций pushBack, pushFront, вставки и удаления в середине и поиска
+для StaticArray, DynamicArray, list и array.array на размерах 10^3-10^7.
+
+Методика:
+- каждая операция выполняется над структурой ровно из n элементов,
+  после замера состояние восстанавливается обратной операцией вне замера;
+- время измеряется time.perf_counter_ns, из каждого замера вычитается
+  накладной расход самого таймера (медиана пустого замера);
+- первые warmup замеров отбрасываются, по остальным repeats считаются
+  медиана и 95-й перцентиль;
+- результаты сохраняются в JSON, а режим сравнения отмечает регрессии
+  относительно сохраненного базового файла.
+
+Запуск из командной строки:
+    python zadanie_02_benchmark_suite.py --json baseline.json
+    python zadanie_02_benchmark_suite.py --compare baseline.json --threshold 0.1
+"""
+
+import argparse
+import gc
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from array import array
+
+from zadanie_01_static_array import StaticArray
+from zadanie_02_dynamic_array import DynamicArray
+
+
+SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)
+OPERATIONS = ('pushBack', 'pushFront', 'insert_middle', 'remove_middle', 'find')
+MISSING = -1  # Значение, которого нет в структуре: find просматривает все n элементов
+
+
+def _array_find(arr, value):
+    """Поиск в array.array с тем же контрактом, что и find: индекс или -1."""
+    try:
+        return arr.index(value)
+    except ValueError:
+        return -1
+
+
+# Для каждой структуры: создание с n элементами и пары (операция, отмена).
+# Отмена возвращает структуру к n элементам и в замер не входит.
+STRUCTURES = {
+    'StaticArray': {
+        'build': lambda n: _filled(StaticArray(n + 1), n),
+        'pushBack': (lambda s: s.pushBack(0), lambda s: s.remove(s.size - 1)),
+        'pushFront': (lambda s: s.pushFront(0), lambda s: s.remove(0)),
+        'insert_middle': (lambda s: s.insert(s.size // 2, 0), lambda s: s.remove(s.size // 2)),
+        'remove_middle': (lambda s: s.remove(s.size // 2), lambda s: s.insert(s.size // 2, 0)),
+        'find': (lambda s: s.find(MISSING), None),
+    },
+    'DynamicArray': {
+        'build': lambda n: _filled(DynamicArray(), n),
+        'pushBack': (lambda s: s.pushBack(0), lambda s: s.remove(s.size - 1)),
+        'pushFront': (lambda s: s.pushFront(0), lambda s: s.remove(0)),
+        'insert_middle': (lambda s: s.insert(s.size // 2, 0), lambda s: s.remove(s.size // 2)),
+        'remove_middle': (lambda s: s.remove(s.size // 2), lambda s: s.insert(s.size // 2, 0)),
+        'find': (lambda s: s.find(MISSING), None),
+    },
+    'list': {
+        'build': lambda n: list(range(n)),
+        'pushBack': (lambda s: s.append(0), lambda s: s.pop()),
+        'pushFront': (lambda s: s.insert(0, 0), lambda s: s.pop(0)),
+        'insert_middle': (lambda s: s.insert(len(s) // 2, 0), lambda s: s.pop(len(s) // 2)),
+        'remove_middle': (lambda s: s.pop(len(s) // 2), lambda s: s.insert(len(s) // 2, 0)),
+        'find': (lambda s: MISSING in s, None),
+    },
+    'array.array': {
+        'build': lambda n: array('q', range(n)),
+        'pushBack': (lambda s: s.append(0), lambda s: s.pop()),
+        'pushFront': (lambda s: s.insert(0, 0), lambda s: s.pop(0)),
+        'insert_middle': (lambda s: s.insert(len(s) // 2, 0), lambda s: s.pop(len(s) // 2)),
+        'remove_middle': (lambda s: s.pop(len(s) // 2), lambda s: s.insert(len(s) // 2, 0)),
+        'find': (lambda s: _array_find(s, MISSING), None),
+    },
+}
+
+
+def _filled(structure, n):
+    """Заполнение структуры числами 0..n-1 одной групповой вставкой."""
+    structure.extend(range(n))
+    return structure
+
+
+def _timer_overhead(samples=1000):
+    """Медиана пустого замера perf_counter_ns - вычитается из результатов."""
+    clock = time.perf_counter_ns
+    timings = []
+    for _ in range(samples):
+        start_ns = clock()
+        timings.append(clock() - start_ns)
+    return statistics.median(timings)
+
+
+def percentile(values, q):
+    """
+    q-й перцентиль (0..100) по методу ближайшего ранга.
+    Трудоемкость: O(k log k) на сортировку k замеров.
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def measure(structure, operation, undo, repeats, warmup, overhead):
+    """
+    Замер одной операции repeats раз после warmup прогревочных вызовов.
+    Сборщик мусора на время замера отключается.
+    
+    Returns:
+        Список времен отдельных вызовов в наносекундах
+    """
+    clock = time.perf_counter_ns
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for i in range(warmup + repeats):
+            start_ns = clock()
+            operation(structure)
+            elapsed = clock() - start_ns
+            if undo is not None:
+                undo(structure)
+            if i >= warmup:
+                timings.append(max(0, elapsed - overhead))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return timings
+
+
+def run_suite(sizes=SIZES, structures=tuple(STRUCTURES), operations=OPERATIONS,
+              repeats=20, warmup=3, progress=True):
+    """
+    Прогон всех сочетаний структура × размер × операция.
+    Структура создается один раз на размер и переиспользуется
+    для всех операций (каждая операция возвращает ее к n элементам).
+    При progress=True строки таблицы печатаются по мере готовности.
+    
+    Returns:
+        Словарь {'meta': {...}, 'results': [{...}, ...]}, готовый для json.dump
+    """
+    overhead = _timer_overhead()
+    results = []
+    if progress:
+        print(f"\n   {'Структура':<13}{'Операция':<15}{'N':>10}{'Медиана, нс':>14}{'p95, нс':>12}")
+    
+    for n in sizes:
+        for name in structures:
+            spec = STRUCTURES[name]
+            structure = spec['build'](n)
+            for op_name in operations:
+                operation, undo = spec[op_name]
+                timings = measure(structure, operation, undo, repeats, warmup, overhead)
+                results.append({
+                    'structure': name,
+                    'operation': op_name,
+                    'n': n,
+                    'median_ns': statistics.median(timings),
+                    'p95_ns': percentile(timings, 95),
+                    'min_ns': min(timings),
+                    'repeats': repeats,
+                })
+                if progress:
+                    print(f"   {name:<13}{op_name:<15}{n:>10}"
+                          f"{results[-1]['median_ns']:>14.0f}{results[-1]['p95_ns']:>12.0f}")
+            del structure
+    
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'timer_overhead_ns': overhead,
+            'repeats': repeats,
+            'warmup': warmup,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+
+
+def compare(report, baseline, threshold=0.10, min_delta_ns=500):
+    """
+    Сравнение медиан с базовым прогоном.
+    Регрессия - медиана выросла больше чем в (1 + threshold) раз
+    и больше чем на min_delta_ns: операции в десятки наносекунд
+    колеблются сильнее порога из-за шума таймера.
+    Сочетания, которых нет в базовом файле, пропускаются.
+    
+    Returns:
+        Список регрессий: (структура, операция, n, было_нс, стало_нс, отношение)
+    """
+    base = {(row['structure'], row['operation'], row['n']): row['median_ns']
+            for row in baseline['results']}
+    regressions = []
+    
+    print(f"\n   {'Структура':<13}{'Операция':<15}{'N':>10}{'Было, нс':>12}"
+          f"{'Стало, нс':>12}{'Отношение':>11}")
+    for row in report['results']:
+        key = (row['structure'], row['operation'], row['n'])
+        if key not in base:
+            continue
+        before, after = base[key], row['median_ns']
+        ratio = after / before if before else float('inf') if after else 1.0
+        flag = ''
+        if ratio > 1 + threshold and after - before > min_delta_ns:
+            flag = '  <- регрессия'
+            regressions.append((*key, before, after, ratio))
+        print(f"   {key[0]:<13}{key[1]:<15}{key[2]:>10}{before:>12.0f}"
+              f"{after:>12.0f}{ratio:>10.2f}x{flag}")
+    
+    print(f"\n   Регрессий (порог +{threshold:.0%}): {len(regressions)}")
+    return regressions
+
+
+def main(argv=None):
+    """
+    Точка входа командной строки.
+    Код возврата 1, если в режиме сравнения найдены регрессии.
+    """
+    parser = argparse.ArgumentParser(description="Бенчмарки StaticArray, DynamicArray, list и array.array")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES))
+    parser.add_argument('--structures', nargs='+', choices=list(STRUCTURES), default=list(STRUCTURES))
+    parser.add_argument('--ops', nargs='+', choices=OPERATIONS, default=list(OPERATIONS))
+    parser.add_argument('--repeats', type=int, default=20)
+    parser.add_argument('--warmup', type=int, default=3)
+    parser.add_argument('--json', metavar='FILE', help="сохранить результаты в JSON")
+    parser.add_argument('--compare', metavar='BASELINE', help="сравнить с сохраненным JSON")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="допустимый рост медианы (0.10 = +10%%)")
+    parser.add_argument('--min-delta-ns', type=int, default=500,
+                        help="рост медианы меньше этого значения не считается регрессией")
+    args = parser.parse_args(argv)
+    
+    print("=== Бенчмарки массивов ===")
+    report = run_suite(args.sizes, args.structures, args.ops, args.repeats, args.warmup)
+    
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n   Результаты сохранены в {args.json}")
+    
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if compare(report, baseline, args.threshold, args.min_delta_ns):
+            return 1
+    return 0
+
+
+# Тестирование
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,40 +2,198 @@
 Задание 2. Динамический массив
 Реализовать динамический массив с автоматическим расширением (стратегия увеличения ×2).
 Сравнить время вставки 100000 элементов в статический массив vs динамический.
+
+Дополнительно: настраиваемая стратегия роста (×2, ×1.5, как в CPython),
+сжатие при удалении с гистерезисом, reserve/shrink_to_fit и статистика
+пиковой и текущей вместимости; телеметрия перевыделений без вывода в консоль.
 """
 
+import struct
 import time
 
 
+# Размер ссылки на объект: столько байт копируется на один элемент списка
+POINTER_SIZE = struct.calcsize('P')
+
+
+def grow_double(capacity, needed):
+    """Стратегия роста ×2: меньше расширений, до 50% свободного места."""
+    new_capacity = max(capacity, 1)
+    while new_capacity < needed:
+        new_capacity *= 2
+    return new_capacity
+
+
+def grow_one_and_half(capacity, needed):
+    """Стратегия роста ×1.5: больше расширений, до 33% свободного места."""
+    new_capacity = max(capacity, 1)
+    while new_capacity < needed:
+        new_capacity = max(new_capacity + 1, new_capacity * 3 // 2)
+    return new_capacity
+
+
+def grow_cpython(capacity, needed):
+    """
+    Стратегия роста как у list в CPython: запас ~12.5% сверх нужного
+    размера плюс небольшая константа, округление до кратного 4.
+    """
+    return (needed + (needed >> 3) + 6) & ~3
+
+
+# Именованные стратегии роста: функция (capacity, needed) -> новая вместимость
+GROWTH_POLICIES = {
+    'x2': grow_double,
+    'x1.5': grow_one_and_half,
+    'cpython': grow_cpython,
+}
+
+
 class DynamicArray:
-    def __init__(self, initial_capacity=8):
+    def __init__(self, initial_capacity=8, growth='x2', shrink=False,
+                 verbose=False, on_resize=None):
         """
         Инициализация динамического массива.
         
         Args:
             initial_capacity: начальная вместимость массива
+            growth: стратегия роста - имя из GROWTH_POLICIES ('x2', 'x1.5',
+                    'cpython') или функция (capacity, needed) -> новая вместимость
+            shrink: сжимать ли массив вдвое, когда заполнено не более 1/4
+            verbose: печатать ли сообщение о каждом расширении
+            on_resize: функция телеметрии, вызывается после каждого
+                       перевыделения со словарем-событием (см. _reallocate)
         """
         self.capacity = initial_capacity
         self.size = 0
-        self.data = [None] * self.capacity
+        self.data = self._allocate(self.capacity)
         self.resize_count = 0  # Счетчик количества расширений
+        self.shrink_count = 0  # Счетчик количества сжатий
+        self.peak_capacity = self.capacity
+        self.min_capacity = max(initial_capacity, 1)  # Сжатие не опускается до нуля
+        self.growth = GROWTH_POLICIES[growth] if isinstance(growth, str) else growth
+        self.shrink = shrink
+        self.verbose = verbose
+        self.on_resize = on_resize
+        # Накопительная телеметрия перевыделений
+        self.bytes_copied = 0
+        self.total_resize_ns = 0
+        self.max_resize_ns = 0  # Самая долгая остановка на копирование
     
-    def _resize(self):
-        """
-        Увеличение ёмкости массива в 2 раза.
-        Трудоемкость: O(n) - копирование всех элементов.
-        Однако, амортизированная сложность pushBack остается O(1).
+    # Значение, которым заполняются свободные ячейки
+    _empty = None
+    # Байт на ячейку хранилища (для list - ссылка на объект)
+    _itemsize = POINTER_SIZE
+    
+    def _allocate(self, capacity):
+        """Выделение хранилища на capacity пустых ячеек."""
+        return [self._empty] * capacity
+    
+    def _pack(self, values):
+        """Упаковка значений в контейнер того же типа, что и хранилище."""
+        return list(values)
+    
+    def _copy_into(self, new_data):
+        """Копирование элементов в начало нового массива одним срезом."""
+        new_data[:self.size] = self.data[:self.size]
+    
+    def _reallocate(self, new_capacity):
         """
-        self.capacity *= 2
-        new_data = [None] * self.capacity
+        Перенос элементов в новый массив вместимостью new_capacity.
+        Трудоемкость: O(n) - копирование всех элементов одним срезом.
         
-        # Копируем все элементы в новый массив
-        for i in range(self.size):
-            new_data[i] = self.data[i]
+        Время копирования замеряется всегда (это O(1) на фоне O(n)),
+        а функция on_resize, если задана, получает словарь:
+            old_capacity, new_capacity - ёмкость до и после
+            copied                     - число скопированных элементов
+            copy_ns                    - время копирования в наносекундах
+            bytes_copied_total         - всего скопировано байт
+            max_resize_ns              - самая долгая остановка на данный момент
+        """
+        old_capacity = self.capacity
+        start_ns = time.perf_counter_ns()
         
+        new_data = self._allocate(new_capacity)
+        self._copy_into(new_data)
         self.data = new_data
+        
+        copy_ns = time.perf_counter_ns() - start_ns
+        self.capacity = new_capacity
+        self.peak_capacity = max(self.peak_capacity, new_capacity)
+        self.bytes_copied += self.size * self._itemsize
+        self.total_resize_ns += copy_ns
+        self.max_resize_ns = max(self.max_resize_ns, copy_ns)
+        
+        if self.on_resize is not None:
+            self.on_resize({
+                'old_capacity': old_capacity,
+                'new_capacity': new_capacity,
+                'copied': self.size,
+                'copy_ns': copy_ns,
+                'bytes_copied_total': self.bytes_copied,
+                'max_resize_ns': self.max_resize_ns,
+            })
+    
+    def _resize(self, min_capacity=None):
+        """
+        Расширение массива по выбранной стратегии роста (по умолчанию ×2),
+        так чтобы поместилось не меньше min_capacity элементов.
+        Трудоемкость: O(n) - копирование всех элементов.
+        Однако, амортизированная сложность pushBack остается O(1).
+        """
+        needed = self.size + 1 if min_capacity is None else min_capacity
+        self._reallocate(max(self.growth(self.capacity, needed), needed))
         self.resize_count += 1
-        print(f"   [Расширение массива #{self.resize_count}: новая вместимость = {self.capacity}]")
+        if self.verbose:
+            print(f"   [Расширение массива #{self.resize_count}: новая вместимость = {self.capacity}]")
+    
+    def _shrink_if_needed(self):
+        """
+        Сжатие с гистерезисом: когда заполнено не более 1/4 ёмкости,
+        ёмкость уменьшается вдвое (но не ниже начальной и не ниже 1). После сжатия
+        массив заполнен наполовину, поэтому чередование вставок и
+        удалений на границе не вызывает постоянных перевыделений.
+        """
+        if not self.shrink:
+            return
+        new_capacity = self.capacity
+        while (new_capacity > 1 and new_capacity // 2 >= self.min_capacity
+               and self.size <= new_capacity // 4):
+            new_capacity //= 2
+        if new_capacity < self.capacity:
+            self._reallocate(new_capacity)
+            self.shrink_count += 1
+    
+    def reserve(self, n):
+        """
+        Резервирование места не менее чем под n элементов (одно выделение).
+        Трудоемкость: O(n), если требуется расширение, иначе O(1).
+        """
+        if n > self.capacity:
+            self._reallocate(n)
+    
+    def shrink_to_fit(self):
+        """
+        Уменьшение ёмкости до текущего размера (освобождение запаса).
+        Трудоемкость: O(n).
+        """
+        new_capacity = max(self.size, 1)
+        if new_capacity < self.capacity:
+            self._reallocate(new_capacity)
+            self.shrink_count += 1
+    
+    def stats(self):
+        """Статистика использования памяти: текущая и пиковая вместимость."""
+        return {
+            'size': self.size,
+            'capacity': self.capacity,
+            'peak_capacity': self.peak_capacity,
+            'utilization': self.size / self.capacity if self.capacity else 1.0,
+            'resize_count': self.resize_count,
+            'shrink_count': self.shrink_count,
+            'bytes_copied': self.bytes_copied,
+            'total_resize_ns': self.total_resize_ns,
+            'max_resize_ns': self.max_resize_ns,
+        }
     
     def pushBack(self, value):
         """
@@ -60,9 +218,8 @@ class DynamicArray:
         if self.size >= self.capacity:
             self._resize()
         
-        # Сдвигаем все элементы вправо
-        for i in range(self.size, 0, -1):
-            self.data[i] = self.data[i - 1]
+        # Сдвигаем все элементы вправо одним срезом
+        self.data[1:self.size + 1] = self.data[0:self.size]
         
         self.data[0] = value
         self.size += 1
@@ -78,9 +235,8 @@ class DynamicArray:
         if self.size >= self.capacity:
             self._resize()
         
-        # Сдвигаем элементы вправо
-        for i in range(self.size, index, -1):
-            self.data[i] = self.data[i - 1]
+        # Сдвигаем элементы вправо одним срезом
+        self.data[index + 1:self.size + 1] = self.data[index:self.size]
         
         self.data[index] = value
         self.size += 1
@@ -95,15 +251,71 @@ class DynamicArray:
         
         removed_value = self.data[index]
         
-        # Сдвигаем элементы влево
-        for i in range(index, self.size - 1):
-            self.data[i] = self.data[i + 1]
+        # Сдвигаем элементы влево одним срезом
+        self.data[index:self.size - 1] = self.data[index + 1:self.size]
         
-        self.data[self.size - 1] = None
+        self.data[self.size - 1] = self._empty
         self.size -= 1
+        self._shrink_if_needed()
         
         return removed_value
     
+    def insert_many(self, index, iterable):
+        """
+        Вставка группы элементов начиная с позиции index.
+        Трудоемкость: O(n + k) - не более одного расширения,
+        один сдвиг хвоста на k позиций и одна запись блока.
+        
+        Args:
+            index: индекс, на который встанет первый элемент группы
+            iterable: вставляемые значения (порядок сохраняется)
+        """
+        if index < 0 or index > self.size:
+            raise IndexError(f"Индекс {index} выходит за границы [0, {self.size}]")
+        
+        values = self._pack(iterable)
+        k = len(values)
+        if self.size + k > self.capacity:
+            self._resize(self.size + k)
+        
+        self.data[index + k:self.size + k] = self.data[index:self.size]
+        self.data[index:index + k] = values
+        self.size += k
+    
+    def extend(self, iterable):
+        """
+        Добавление группы элементов в конец массива.
+        Трудоемкость: O(k) амортизированная.
+        """
+        self.insert_many(self.size, iterable)
+    
+    def pushFront_many(self, iterable):
+        """
+        Добавление группы элементов в начало массива блоком
+        в исходном порядке. Трудоемкость: O(n + k).
+        """
+        self.insert_many(0, iterable)
+    
+    def remove_range(self, start, stop):
+        """
+        Удаление элементов с индексами [start, stop).
+        Трудоемкость: O(n) - один сдвиг хвоста влево.
+        
+        Returns:
+            Список удаленных значений
+        """
+        if start < 0 or stop > self.size or start > stop:
+            raise IndexError(f"Диапазон [{start}, {stop}) выходит за границы [0, {self.size}]")
+        
+        removed = list(self.data[start:stop])
+        k = stop - start
+        self.data[start:self.size - k] = self.data[stop:self.size]
+        self.data[self.size - k:self.size] = self._allocate(k)
+        self.size -= k
+        self._shrink_if_needed()
+        
+        return removed
+    
     def find(self, value):
         """
         Поиск элемента по значению.
@@ -120,6 +332,26 @@ class DynamicArray:
             raise IndexError(f"Индекс {index} выходит за границы [0, {self.size - 1}]")
         return self.data[index]
     
+    def as_memoryview(self):
+        """
+        Представление живой части [0, size) без копирования. O(1).
+        Доступно для типизированных хранилищ (NumericDynamicArray);
+        действительно до ближайшего перевыделения хранилища.
+        
+        Raises:
+            TypeError: для массива на списке объектов Python
+        """
+        try:
+            view = memoryview(self.data)
+        except TypeError:
+            raise TypeError(f"{type(self).__name__} хранит объекты Python и не имеет "
+                            "буфера; используйте NumericDynamicArray") from None
+        return view[:self.size]
+    
+    def to_bytes(self):
+        """Копия живой части в bytes. O(n) - одно копирование на C."""
+        return self.as_memoryview().tobytes()
+    
     def __str__(self):
         """Строковое представление массива."""
         if self.size > 10:
@@ -127,66 +359,60 @@ class DynamicArray:
         return f"DynamicArray({self.data[:self.size]}, size={self.size}, capacity={self.capacity})"
 
 
-def benchmark_static_vs_dynamic():
+def benchmark_static_vs_dynamic(N=100000, repeats=5):
     """
-    Сравнение производительности статического и динамического массивов.
+    Сравнение производительности статического и динамического массивов:
+    заполнение N элементами, медиана по repeats прогонам (perf_counter_ns).
+    Вывод выполняется только после замеров. Подробные замеры по размерам
+    и операциям с JSON-отчетом - в zadanie_02_benchmark_suite.py.
     """
-    N = 100000
-    
-    print("\n=== Сравнение производительности ===\n")
-    
-    # Тест динамического массива
-    print(f"1. Динамический массив - вставка {N} элементов:")
-    dynamic_arr = DynamicArray(initial_capacity=8)
-    
-    start_time = time.time()
-    for i in range(N):
-        dynamic_arr.pushBack(i)
-    end_time = time.time()
+    from statistics import median
     
-    dynamic_time = end_time - start_time
-    print(f"   Время выполнения: {dynamic_time:.4f} секунд")
-    print(f"   Количество расширений: {dynamic_arr.resize_count}")
-    print(f"   Финальная вместимость: {dynamic_arr.capacity}")
-    print(f"   Размер: {dynamic_arr.size}")
+    from zadanie_01_static_array import StaticArray
     
-    # Тест статического массива (заранее выделенного)
-    print(f"\n2. Статический массив (предварительно выделенный на {N} элементов):")
-    static_data = [None] * N
+    def fill_dynamic():
+        arr = DynamicArray(initial_capacity=8)
+        for i in range(N):
+            arr.pushBack(i)
+        return arr
     
-    start_time = time.time()
-    for i in range(N):
-        static_data[i] = i
-    end_time = time.time()
+    def fill_static():
+        arr = StaticArray(N)
+        for i in range(N):
+            arr.pushBack(i)
+        return arr
     
-    static_time = end_time - start_time
-    print(f"   Время выполнения: {static_time:.4f} секунд")
+    timings = {}
+    for name, fill in (("dynamic", fill_dynamic), ("static", fill_static)):
+        samples = []
+        for _ in range(repeats):
+            start_ns = time.perf_counter_ns()
+            arr = fill()
+            samples.append(time.perf_counter_ns() - start_ns)
+        timings[name] = median(samples) / 1e9
+        if name == "dynamic":
+            dynamic_arr = arr
     
-    # Тест статического массива с недостаточной вместимостью
-    print(f"\n3. Статический массив (недостаточная вместимость - 1000 элементов):")
-    print(f"   Попытка вставить {N} элементов...")
+    # Статический массив с недостаточной вместимостью (не замеряется)
+    small_static = StaticArray(1000)
+    overflow_at = None
     try:
-        from zadanie_01_static_array import StaticArray
-        small_static = StaticArray(1000)
-        
-        start_time = time.time()
         for i in range(N):
             small_static.pushBack(i)
-        end_time = time.time()
-        
-        print(f"   Время выполнения: {end_time - start_time:.4f} секунд")
-    except OverflowError as e:
-        print(f"   Ошибка: переполнение массива после вставки 1000 элементов")
-        print(f"   Невозможно вставить все {N} элементов в статический массив")
-    
-    # Анализ
-    print("\n=== Анализ результатов ===")
-    print(f"Динамический массив: {dynamic_time:.4f} сек")
-    print(f"Статический массив:  {static_time:.4f} сек")
+    except OverflowError:
+        overflow_at = small_static.size
     
+    dynamic_time, static_time = timings["dynamic"], timings["static"]
+    print(f"\n=== Сравнение производительности (вставка {N} элементов, медиана из {repeats}) ===\n")
+    print(f"1. Динамический массив: {dynamic_time:.4f} секунд")
+    print(f"   Количество расширений: {dynamic_arr.resize_count}")
+    print(f"   Финальная вместимость: {dynamic_arr.capacity}")
+    print(f"\n2. Статический массив (предварительно выделенный на {N} элементов): {static_time:.4f} секунд")
+    print("\n3. Статический массив (недостаточная вместимость - 1000 элементов):")
+    if overflow_at is not None:
+        print(f"   Ошибка: переполнение массива после вставки {overflow_at} элементов")
     if dynamic_time > 0 and static_time > 0:
-        ratio = dynamic_time / static_time
-        print(f"Отношение времен:    {ratio:.2f}x")
+        print(f"\nОтношение времен: {dynamic_time / static_time:.2f}x")
     
     print("\nВыводы:")
     print("- Динамический массив немного медленнее из-за расширений")
@@ -196,13 +422,74 @@ def benchmark_static_vs_dynamic():
     print("- При превышении размера статического массива происходит ошибка")
 
 
+def compare_growth_policies(N=1000000):
+    """
+    Сравнение стратегий роста: число расширений, время заполнения
+    и доля неиспользуемой памяти после вставки N элементов.
+    """
+    print(f"\n=== Стратегии роста ({N} элементов) ===\n")
+    print(f"   {'Стратегия':<10}{'Расширений':>11}{'Время, с':>10}"
+          f"{'Вместимость':>13}{'Запас':>8}")
+    
+    for name in GROWTH_POLICIES:
+        arr = DynamicArray(initial_capacity=8, growth=name)
+        start_time = time.perf_counter()
+        for i in range(N):
+            arr.pushBack(i)
+        elapsed = time.perf_counter() - start_time
+        spare = 1 - arr.size / arr.capacity
+        print(f"   {name:<10}{arr.resize_count:>11}{elapsed:>10.4f}"
+              f"{arr.capacity:>13}{spare:>8.1%}")
+
+
+def _shift_right_loop(data, size, index):
+    """Поэлементный сдвиг вправо на Python (прежняя реализация, для сравнения)."""
+    for i in range(size, index, -1):
+        data[i] = data[i - 1]
+
+
+def benchmark_bulk_shifts(sizes=(10**4, 10**5, 10**6), repeats=5):
+    """
+    Сравнение сдвига циклом Python и сдвига одним срезом (pushFront).
+    Показывает выигрыш в константе при одинаковой асимптотике O(n).
+    """
+    from zadanie_01_static_array import StaticArray
+    
+    print("\n=== Сдвиг циклом vs сдвиг срезом (pushFront) ===\n")
+    print(f"   {'N':>9}{'Цикл, мс/оп':>14}{'Срез, мс/оп':>14}{'Ускорение':>11}")
+    
+    for n in sizes:
+        # Поэлементный сдвиг на обычном списке с запасом места
+        data = list(range(n)) + [None] * repeats
+        start_time = time.perf_counter()
+        for r in range(repeats):
+            _shift_right_loop(data, n + r, 0)
+            data[0] = -r
+        loop_time = (time.perf_counter() - start_time) / repeats
+        
+        # Сдвиг срезом в StaticArray и DynamicArray
+        static_arr = StaticArray(n + repeats)
+        static_arr.extend(range(n))
+        dynamic_arr = DynamicArray(initial_capacity=n + repeats)
+        dynamic_arr.extend(range(n))
+        
+        start_time = time.perf_counter()
+        for r in range(repeats):
+            static_arr.pushFront(-r)
+            dynamic_arr.pushFront(-r)
+        slice_time = (time.perf_counter() - start_time) / (2 * repeats)
+        
+        print(f"   {n:>9}{loop_time * 1000:>14.3f}{slice_time * 1000:>14.3f}"
+              f"{loop_time / slice_time:>10.1f}x")
+
+
 # Тестирование
 if __name__ == "__main__":
     print("=== Тестирование динамического массива ===\n")
     
     # Базовые операции
     print("1. Создание динамического массива с начальной вместимостью 4:")
-    arr = DynamicArray(initial_capacity=4)
+    arr = DynamicArray(initial_capacity=4, verbose=True)
     print(f"   {arr}")
     
     print("\n2. Добавление элементов (следим за расширениями):")
@@ -227,12 +514,49 @@ if __name__ == "__main__":
     print(f"   Удален: {removed}")
     print(f"   {arr}")
     
+    print("\n7. Групповые операции:")
+    arr.extend([1, 2, 3])
+    arr.pushFront_many([-1, -2])
+    arr.insert_many(4, ['a', 'b'])
+    print(f"   {arr}")
+    removed = arr.remove_range(4, 6)
+    print(f"   remove_range(4, 6) удалил {removed}: {arr}")
+    
+    print("\n8. Сжатие при удалении, reserve и shrink_to_fit:")
+    shrinking = DynamicArray(initial_capacity=4, shrink=True)
+    shrinking.reserve(64)
+    shrinking.extend(range(64))
+    print(f"   После reserve(64) и вставки 64 элементов: {shrinking.stats()}")
+    shrinking.remove_range(0, 60)
+    print(f"   После удаления 60 элементов:  {shrinking.stats()}")
+    shrinking.shrink_to_fit()
+    print(f"   После shrink_to_fit():        {shrinking.stats()}")
+    empty_start = DynamicArray(initial_capacity=0, shrink=True)
+    empty_start.pushBack(1)
+    empty_start.remove(0)
+    print(f"   Начальная емкость 0, вставка и удаление: capacity = {empty_start.capacity}")
+    
+    print("\n9. Телеметрия перевыделений (без вывода в консоль):")
+    events = []
+    observed = DynamicArray(initial_capacity=8, on_resize=events.append)
+    for i in range(10**6):
+        observed.pushBack(i)
+    worst = max(events, key=lambda event: event['copy_ns'])
+    print(f"   Перевыделений: {len(events)}, скопировано "
+          f"{observed.bytes_copied / 2**20:.1f} МБ за {observed.total_resize_ns / 1e6:.2f} мс")
+    print(f"   Самая долгая остановка: {worst['copy_ns'] / 1e6:.2f} мс "
+          f"({worst['old_capacity']} -> {worst['new_capacity']}, "
+          f"скопировано {worst['copied']} элементов)")
+    
     # Бенчмарк
     benchmark_static_vs_dynamic()
+    compare_growth_policies()
+    benchmark_bulk_shifts()
     
     print("\n=== Преимущества динамического массива ===")
     print("✓ Автоматическое управление памятью")
     print("✓ Не требует заранее знать размер данных")
     print("✓ Амортизированная сложность O(1) для pushBack")
-    print("✓ Эффективная стратегия расширения ×2")
+    print("✓ Эффективная стратегия расширения ×2 (настраивается: ×1.5, как в CPython)")
+    print("✓ Сжатие при удалении возвращает память после пиковой нагрузки")
     print("✓ Предотвращает переполнение")
@@ -0,0 +1,282 @@
+"""
+Задание 2 (дополнение). Буфер с разрывом (gap buffer)
+Динамический массив, внутри которого в позиции курсора держится "разрыв" -
+блок свободных ячеек. Вставка и удаление у курсора выполняются за O(1),
+а перемещение курсора на d позиций стоит O(d). Серия из k правок в одном
+месте обходится в O(k + d) вместо O(k·n) у DynamicArray.insert.
+
+Раскладка данных:
+    [0, cursor)              - элементы до курсора
+    [cursor, gap_end)        - разрыв (свободные ячейки)
+    [gap_end, capacity)      - элементы после курсора
+"""
+
+import time
+
+from zadanie_02_dynamic_array import DynamicArray
+
+
+class GapBuffer(DynamicArray):
+    """Буфер с разрывом на основе динамического массива."""
+    
+    def __init__(self, initial_capacity=8, growth='x2', shrink=False,
+                 verbose=False, on_resize=None):
+        """
+        Инициализация пустого буфера: весь массив - это разрыв.
+        
+        Args:
+            initial_capacity: начальная вместимость
+            growth, shrink, verbose, on_resize: как в DynamicArray
+        """
+        super().__init__(initial_capacity, growth, shrink, verbose, on_resize)
+        self.cursor = 0
+        self._gap_end = self.capacity
+    
+    def _gap_size(self):
+        """Количество свободных ячеек в разрыве."""
+        return self._gap_end - self.cursor
+    
+    def _reallocate(self, new_capacity):
+        """
+        Перевыделение буфера механизмом DynamicArray (используется при
+        расширении, сжатии, reserve и shrink_to_fit).
+        Элементы после курсора временно придвигаются к началу разрыва,
+        массив перевыделяется базовым _reallocate, после чего хвост
+        переносится в конец нового массива - разрыв снова у курсора.
+        Трудоемкость: O(n).
+        """
+        tail_len = self.capacity - self._gap_end
+        tail = self.data[self._gap_end:self.capacity]
+        self.data[self.cursor:self.cursor + tail_len] = tail
+        
+        super()._reallocate(new_capacity)
+        
+        self._gap_end = self.capacity - tail_len
+        self.data[self._gap_end:self.capacity] = tail
+        self.data[self.cursor:self._gap_end] = [None] * self._gap_size()
+    
+    def move_cursor(self, position):
+        """
+        Перемещение курсора (и разрыва) в позицию position.
+        Трудоемкость: O(d), d - расстояние перемещения.
+        Элементы между старой и новой позицией переносятся
+        через разрыв одним срезом.
+        
+        Raises:
+            IndexError: если позиция выходит за границы
+        """
+        if position < 0 or position > self.size:
+            raise IndexError(f"Позиция {position} выходит за границы [0, {self.size}]")
+        
+        if position < self.cursor:
+            # Переносим [position, cursor) в конец разрыва
+            k = self.cursor - position
+            self.data[self._gap_end - k:self._gap_end] = self.data[position:self.cursor]
+            self.data[position:position + min(k, self._gap_size())] = [None] * min(k, self._gap_size())
+            self._gap_end -= k
+        elif position > self.cursor:
+            # Переносим начало хвоста в начало разрыва
+            k = position - self.cursor
+            gap_end = self._gap_end
+            self.data[self.cursor:position] = self.data[gap_end:gap_end + k]
+            cleared_from = max(gap_end, position)
+            self.data[cleared_from:gap_end + k] = [None] * (gap_end + k - cleared_from)
+            self._gap_end += k
+        
+        self.cursor = position
+    
+    def insert_at_cursor(self, value):
+        """
+        Вставка элемента в позицию курсора; курсор сдвигается за него.
+        Трудоемкость: O(1) амортизированная.
+        """
+        if self._gap_size() == 0:
+            self._resize()
+        
+        self.data[self.cursor] = value
+        self.cursor += 1
+        self.size += 1
+    
+    def delete_at_cursor(self):
+        """
+        Удаление элемента сразу после курсора (как клавиша Delete).
+        Трудоемкость: O(1).
+        
+        Returns:
+            Удаленное значение
+        
+        Raises:
+            IndexError: если после курсора нет элементов
+        """
+        if self._gap_end >= self.capacity:
+            raise IndexError("После курсора нет элементов")
+        
+        removed_value = self.data[self._gap_end]
+        self.data[self._gap_end] = None
+        self._gap_end += 1
+        self.size -= 1
+        self._shrink_if_needed()
+        
+        return removed_value
+    
+    def pushBack(self, value):
+        """Добавление в конец. O(d) на перемещение курсора + O(1)."""
+        self.move_cursor(self.size)
+        self.insert_at_cursor(value)
+    
+    def pushFront(self, value):
+        """Добавление в начало. O(d) на перемещение курсора + O(1)."""
+        self.move_cursor(0)
+        self.insert_at_cursor(value)
+    
+    def insert(self, index, value):
+        """Вставка на позицию. O(d) на перемещение курсора + O(1)."""
+        self.move_cursor(index)
+        self.insert_at_cursor(value)
+    
+    def remove(self, index):
+        """Удаление по индексу. O(d) на перемещение курсора + O(1)."""
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Индекс {index} выходит за границы [0, {self.size - 1}]")
+        self.move_cursor(index)
+        return self.delete_at_cursor()
+    
+    def insert_many(self, index, iterable):
+        """
+        Вставка группы элементов в позицию index.
+        Трудоемкость: O(d + k) - перемещение курсора и запись блока в разрыв.
+        """
+        self.move_cursor(index)
+        values = list(iterable)
+        k = len(values)
+        if self._gap_size() < k:
+            self._resize(self.size + k)
+        
+        self.data[self.cursor:self.cursor + k] = values
+        self.cursor += k
+        self.size += k
+    
+    def remove_range(self, start, stop):
+        """
+        Удаление элементов [start, stop): курсор ставится в start,
+        после чего разрыв поглощает stop - start элементов.
+        Трудоемкость: O(d + k).
+        """
+        if start < 0 or stop > self.size or start > stop:
+            raise IndexError(f"Диапазон [{start}, {stop}) выходит за границы [0, {self.size}]")
+        
+        self.move_cursor(start)
+        k = stop - start
+        removed = self.data[self._gap_end:self._gap_end + k]
+        self.data[self._gap_end:self._gap_end + k] = [None] * k
+        self._gap_end += k
+        self.size -= k
+        self._shrink_if_needed()
+        
+        return removed
+    
+    def get(self, index):
+        """
+        Получение элемента по индексу с учетом разрыва.
+        Трудоемкость: O(1).
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Индекс {index} выходит за границы [0, {self.size - 1}]")
+        if index < self.cursor:
+            return self.data[index]
+        return self.data[index + self._gap_size()]
+    
+    def find(self, value):
+        """
+        Поиск элемента по значению в обеих частях буфера.
+        Трудоемкость: O(n).
+        """
+        try:
+            return self.data.index(value, 0, self.cursor)
+        except ValueError:
+            pass
+        try:
+            return self.data.index(value, self._gap_end, self.capacity) - self._gap_size()
+        except ValueError:
+            return -1
+    
+    def toList(self):
+        """Преобразование в Python list (без разрыва)."""
+        return self.data[:self.cursor] + self.data[self._gap_end:self.capacity]
+    
+    def __str__(self):
+        """Строковое представление буфера; '|' обозначает курсор."""
+        before = ', '.join(map(str, self.data[:self.cursor]))
+        after = ', '.join(map(str, self.data[self._gap_end:self.capacity]))
+        return (f"GapBuffer([{before} | {after}], size={self.size}, "
+                f"gap={self._gap_size()}, capacity={self.capacity})")
+
+
+def benchmark_gap_buffer(N=100000, edits=2000):
+    """
+    Сравнение серии правок в одном месте: GapBuffer vs DynamicArray.insert.
+    Курсор буфера перемещается в середину один раз, затем выполняется
+    серия вставок и удалений рядом с ним.
+    """
+    print(f"\n=== {edits} правок в середине массива из {N} элементов ===\n")
+    middle = N // 2
+    
+    dynamic_arr = DynamicArray(initial_capacity=N + edits)
+    dynamic_arr.extend(range(N))
+    start_time = time.perf_counter()
+    for i in range(edits):
+        dynamic_arr.insert(middle + i, -i)
+    for _ in range(edits // 2):
+        dynamic_arr.remove(middle)
+    dynamic_time = time.perf_counter() - start_time
+    
+    gap_buffer = GapBuffer(initial_capacity=N + edits)
+    gap_buffer.extend(range(N))
+    start_time = time.perf_counter()
+    gap_buffer.move_cursor(middle)
+    for i in range(edits):
+        gap_buffer.insert_at_cursor(-i)
+    gap_buffer.move_cursor(middle)
+    for _ in range(edits // 2):
+        gap_buffer.delete_at_cursor()
+    gap_time = time.perf_counter() - start_time
+    
+    print(f"   DynamicArray.insert/remove: {dynamic_time:.4f} сек  (O(k·n))")
+    print(f"   GapBuffer у курсора:        {gap_time:.4f} сек  (O(k + d))")
+    print(f"   Ускорение: {dynamic_time / gap_time:.1f}x")
+    print(f"   Результаты совпадают: {dynamic_arr.data[:dynamic_arr.size] == gap_buffer.toList()}")
+
+
+# Тестирование
+if __name__ == "__main__":
+    print("=== Тестирование буфера с разрывом ===\n")
+    
+    print("1. Набор текста у курсора:")
+    buffer = GapBuffer(initial_capacity=4)
+    for char in "HELLO":
+        buffer.insert_at_cursor(char)
+    print(f"   {buffer}")
+    
+    print("\n2. Перемещение курсора в позицию 2 и вставка:")
+    buffer.move_cursor(2)
+    buffer.insert_at_cursor('*')
+    print(f"   {buffer}")
+    
+    print("\n3. Удаление двух элементов после курсора:")
+    print(f"   Удалены: {buffer.delete_at_cursor()}, {buffer.delete_at_cursor()}")
+    print(f"   {buffer}")
+    
+    print("\n4. Операции DynamicArray поверх буфера:")
+    buffer.pushFront('<')
+    buffer.pushBack('>')
+    print(f"   {buffer}")
+    print(f"   get(1) = {buffer.get(1)}, find('O') = {buffer.find('O')}")
+    
+    benchmark_gap_buffer()
+    
+    print("\n=== Анализ трудоемкости ===")
+    print("move_cursor:       O(d) - перенос d элементов через разрыв")
+    print("insert_at_cursor:  O(1) амортизированная")
+    print("delete_at_cursor:  O(1)")
+    print("get:               O(1)")
+    print("find:              O(n)")
@@ -0,0 +1,352 @@
+"""
+Задание 2 (дополнение). Числовой динамический массив на NumPy
+Динамический массив чисел с тем же API (pushBack, insert, remove, ...),
+но хранилищем в виде numpy.ndarray. Поиск, подсчет, фильтрация,
+отображение и агрегаты (sum/min/max) выполняются векторизованно над
+живой частью data[:size] - один вызов на C вместо цикла по get.
+
+Если NumPy не установлен, используется типизированный буфер модуля array
+и встроенные функции Python - API и результаты остаются прежними:
+значения проверяются по правилам модуля array в обоих случаях (float
+в целочисленный тип - TypeError, а не молчаливое отбрасывание дробной
+части), а наружу возвращаются числа Python, а не скаляры NumPy.
+"""
+
+import sys
+import time
+from array import array, typecodes
+
+from zadanie_02_dynamic_array import DynamicArray
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAS_NUMPY = np is not None
+# array.index принимает границы start/stop только с Python 3.10
+ARRAY_INDEX_BOUNDS = sys.version_info >= (3, 10)
+
+# Типы NumPy без точного аналога в модуле array -> ближайший код array
+_ARRAY_TYPECODE = {'?': 'b', 'e': 'f', 'g': 'd'}
+
+
+class NumericDynamicArray(DynamicArray):
+    """Динамический массив чисел с векторизованными операциями."""
+    
+    _empty = 0
+    
+    def __init__(self, initial_capacity=8, dtype='d', growth='x2', shrink=False,
+                 verbose=False, on_resize=None):
+        """
+        Инициализация числового массива.
+        
+        Args:
+            initial_capacity: начальная вместимость
+            dtype: код типа ('d' - float64, 'q' - int64, 'i' - int32, ...),
+                   понятный и NumPy, и модулю array
+            growth, shrink, verbose, on_resize: как в DynamicArray
+        """
+        self.dtype = dtype
+        self.backend = 'numpy' if HAS_NUMPY else 'array'
+        # Одноэлементный буфер array: запись в него проверяет значение
+        self._probe = array(dtype, [0])
+        self._itemsize = self._probe.itemsize
+        super().__init__(initial_capacity, growth, shrink, verbose, on_resize)
+    
+    def _allocate(self, capacity):
+        """Нулевой буфер: np.zeros или array того же типа."""
+        if HAS_NUMPY:
+            return np.zeros(capacity, dtype=self.dtype)
+        return array(self.dtype, [0]) * capacity
+    
+    def _check(self, value):
+        """
+        Проверка значения по правилам модуля array: float или строка
+        в целочисленном типе - TypeError, выход за диапазон - OverflowError.
+        NumPy при записи молча отбросил бы дробную часть, поэтому значение
+        сначала записывается в одноэлементный array. Проверка идет до
+        сдвига элементов, так что при ошибке массив не меняется. O(1).
+        """
+        self._probe[0] = value
+        return value
+    
+    def _pack(self, values):
+        """
+        Упаковка значений в буфер нужного типа.
+        С NumPy ndarray приводится без копии, если приведение без потерь;
+        остальное проходит через array (та же проверка, что без NumPy),
+        а np.frombuffer дает представление над ним без второй копии.
+        """
+        if HAS_NUMPY:
+            if isinstance(values, np.ndarray):
+                if np.can_cast(values.dtype, self.dtype):
+                    return values.astype(self.dtype, copy=False)
+                values = values.tolist()
+            return np.frombuffer(array(self.dtype, values), dtype=self.dtype)
+        if isinstance(values, array) and values.typecode == self.dtype:
+            return values
+        return array(self.dtype, values)
+    
+    def _live(self):
+        """Живая часть хранилища: представление без копирования (NumPy)."""
+        return self.data[:self.size]
+    
+    def _new_like(self, values, dtype=None):
+        """Новый массив с данными values (тип по умолчанию - текущий)."""
+        result = NumericDynamicArray(max(len(values), 1), dtype or self.dtype, self.growth)
+        result.data[:len(values)] = values
+        result.size = len(values)
+        return result
+    
+    @classmethod
+    def from_buffer(cls, buffer, dtype='d'):
+        """
+        Создание массива из объекта с буферным протоколом (bytes, mmap,
+        shared_memory.buf, ndarray и т.д.).
+        Трудоемкость: O(n). С NumPy буфер читается через np.frombuffer
+        без промежуточной копии - данные копируются один раз, в хранилище.
+        """
+        if HAS_NUMPY:
+            items = np.frombuffer(buffer, dtype=dtype)
+        else:
+            items = array(dtype)
+            items.frombytes(memoryview(buffer).cast('B'))
+        arr = cls(max(len(items), 1), dtype)
+        arr.extend(items)
+        return arr
+    
+    def pushBack(self, value):
+        """Добавление в конец с проверкой значения. O(1) амортизированная."""
+        super().pushBack(self._check(value))
+    
+    def pushFront(self, value):
+        """Добавление в начало с проверкой значения. O(n)."""
+        super().pushFront(self._check(value))
+    
+    def insert(self, index, value):
+        """Вставка на позицию index с проверкой значения. O(n)."""
+        super().insert(index, self._check(value))
+    
+    def get(self, index):
+        """Получение элемента по индексу как числа Python. O(1)."""
+        value = super().get(index)
+        return value.item() if HAS_NUMPY else value
+    
+    def remove(self, index):
+        """Удаление по индексу; возвращает число Python. O(n)."""
+        value = super().remove(index)
+        return value.item() if HAS_NUMPY else value
+    
+    def remove_range(self, start, stop):
+        """
+        Удаление элементов с индексами [start, stop).
+        Трудоемкость: O(n).
+        
+        Returns:
+            Список удаленных значений (числа Python)
+        """
+        removed = super().remove_range(start, stop)
+        return [x.item() for x in removed] if HAS_NUMPY else removed
+    
+    def find(self, value):
+        """
+        Поиск первого вхождения.
+        Трудоемкость: O(n) - одно векторное сравнение.
+        """
+        if HAS_NUMPY:
+            matches = np.flatnonzero(self._live() == value)
+            return int(matches[0]) if len(matches) else -1
+        if not ARRAY_INDEX_BOUNDS:
+            for i in range(self.size):
+                if self.data[i] == value:
+                    return i
+            return -1
+        try:
+            return self.data.index(value, 0, self.size)
+        except ValueError:
+            return -1
+    
+    def find_all(self, value):
+        """
+        Индексы всех вхождений value.
+        Трудоемкость: O(n).
+        """
+        if HAS_NUMPY:
+            return np.flatnonzero(self._live() == value).tolist()
+        return [i for i, x in enumerate(self._live()) if x == value]
+    
+    def count(self, value):
+        """Количество вхождений value. O(n)."""
+        if HAS_NUMPY:
+            return int(np.count_nonzero(self._live() == value))
+        return self._live().count(value)
+    
+    def filter(self, predicate_array):
+        """
+        Отбор элементов по маске.
+        Трудоемкость: O(n).
+        
+        Args:
+            predicate_array: последовательность bool длины size,
+                             например arr.data[:arr.size] > 0 для NumPy
+        
+        Returns:
+            Новый NumericDynamicArray с отобранными элементами
+        """
+        if len(predicate_array) != self.size:
+            raise ValueError(f"Длина маски {len(predicate_array)} не равна размеру {self.size}")
+        if HAS_NUMPY:
+            return self._new_like(self._live()[np.asarray(predicate_array, dtype=bool)])
+        return self._new_like(array(self.dtype, (x for x, keep in zip(self._live(), predicate_array) if keep)))
+    
+    def map(self, ufunc):
+        """
+        Применение функции ко всем элементам.
+        С NumPy функция вызывается один раз для всего массива (ufunc,
+        например np.sqrt), без NumPy - поэлементно.
+        Трудоемкость: O(n).
+        
+        Returns:
+            Новый NumericDynamicArray (тип определяется результатом;
+            bool хранится как 'b', float16 - как 'f')
+        
+        Raises:
+            TypeError: если тип результата не представим в модуле array
+                       (например, комплексные числа)
+        """
+        if HAS_NUMPY:
+            result = np.asarray(ufunc(self._live()))
+            code = _ARRAY_TYPECODE.get(result.dtype.char, result.dtype.char)
+            if code not in typecodes or code in 'uw':
+                raise TypeError(f"Тип результата map {result.dtype} не поддерживается модулем array")
+            return self._new_like(result, code)
+        values = [ufunc(x) for x in self._live()]
+        for x in values:
+            if not isinstance(x, (int, float)):
+                raise TypeError(f"Тип результата map {type(x).__name__} не поддерживается модулем array")
+        if values and all(type(x) is bool for x in values):
+            dtype = 'b'
+        elif any(isinstance(x, float) for x in values):
+            dtype = 'd'
+        else:
+            dtype = self.dtype
+        return self._new_like(array(dtype, values), dtype)
+    
+    def sum(self):
+        """Сумма элементов. O(n)."""
+        if HAS_NUMPY:
+            return self._live().sum().item()
+        return sum(self._live())
+    
+    def min(self):
+        """Минимальный элемент. O(n). Для пустого массива - ValueError."""
+        if self.size == 0:
+            raise ValueError("min() для пустого массива")
+        if HAS_NUMPY:
+            return self._live().min().item()
+        return min(self._live())
+    
+    def max(self):
+        """Максимальный элемент. O(n). Для пустого массива - ValueError."""
+        if self.size == 0:
+            raise ValueError("max() для пустого массива")
+        if HAS_NUMPY:
+            return self._live().max().item()
+        return max(self._live())
+    
+    def toList(self):
+        """Преобразование в Python list."""
+        return self._live().tolist()
+    
+    def __str__(self):
+        """Строковое представление массива."""
+        elements = self.toList()
+        if self.size > 10:
+            return (f"NumericDynamicArray([{', '.join(map(str, elements[:5]))} ... "
+                    f"{', '.join(map(str, elements[-5:]))}], size={self.size}, "
+                    f"capacity={self.capacity}, backend={self.backend})")
+        return f"NumericDynamicArray({elements}, size={self.size}, backend={self.backend})"
+
+
+def benchmark_vectorized(N=1000000):
+    """
+    Сравнение поиска и суммирования: DynamicArray (цикл по get)
+    vs NumericDynamicArray (векторные операции).
+    """
+    print(f"\n=== Поиск и сумма по {N} элементам (backend={'numpy' if HAS_NUMPY else 'array'}) ===\n")
+    
+    plain = DynamicArray()
+    plain.extend(range(N))
+    numeric = NumericDynamicArray(dtype='q')
+    numeric.extend(range(N))
+    
+    start_time = time.perf_counter()
+    plain_find = plain.find(N - 1)
+    plain_sum = sum(plain.get(i) for i in range(plain.size))
+    plain_time = time.perf_counter() - start_time
+    
+    start_time = time.perf_counter()
+    numeric_find = numeric.find(N - 1)
+    numeric_sum = numeric.sum()
+    numeric_time = time.perf_counter() - start_time
+    
+    print(f"   DynamicArray:        {plain_time:.4f} сек")
+    print(f"   NumericDynamicArray: {numeric_time:.4f} сек")
+    print(f"   Результаты совпадают: {(plain_find, plain_sum) == (numeric_find, numeric_sum)}")
+
+
+# Тестирование
+if __name__ == "__main__":
+    print("=== Тестирование числового динамического массива ===\n")
+    print(f"Используется: {'NumPy ' + np.__version__ if HAS_NUMPY else 'модуль array (NumPy не установлен)'}")
+    
+    print("\n1. Добавление элементов и базовые операции:")
+    numbers = NumericDynamicArray(initial_capacity=4, dtype='q')
+    numbers.extend([5, 3, 8, 3, 1, 9, 3])
+    numbers.pushFront(7)
+    numbers.insert(2, 4)
+    print(f"   {numbers}")
+    print(f"   remove(0) = {numbers.remove(0)}: {numbers}")
+    
+    print("\n2. Векторизованные запросы:")
+    print(f"   find(3) = {numbers.find(3)}, find_all(3) = {numbers.find_all(3)}, count(3) = {numbers.count(3)}")
+    print(f"   sum = {numbers.sum()}, min = {numbers.min()}, max = {numbers.max()}")
+    
+    print("\n3. filter и map:")
+    mask = [x > 3 for x in numbers.toList()]
+    print(f"   Элементы > 3: {numbers.filter(mask)}")
+    square = np.square if HAS_NUMPY else (lambda x: x * x)
+    print(f"   Квадраты:     {numbers.map(square)}")
+    print(f"   x > 3 (bool): {numbers.map(lambda x: x > 3)}")
+    
+    print("\n4. Передача через shared_memory без промежуточных копий:")
+    from multiprocessing import shared_memory
+    view = numbers.as_memoryview()
+    block = shared_memory.SharedMemory(create=True, size=view.nbytes)
+    block.buf[:view.nbytes] = view.cast('B')
+    received = NumericDynamicArray.from_buffer(block.buf[:view.nbytes], dtype='q')
+    print(f"   Получено: {received}")
+    view.release()
+    block.close()
+    block.unlink()
+    
+    print("\n5. Одинаковая проверка значений в обоих бэкендах:")
+    print(f"   remove_range(0, 2) = {numbers.remove_range(0, 2)}: {numbers}")
+    for bad in (2.5, [1, 2.5]):
+        try:
+            if isinstance(bad, list):
+                numbers.extend(bad)
+            else:
+                numbers.pushBack(bad)
+        except TypeError as e:
+            print(f"   {bad!r} в dtype='q': TypeError ({e})")
+    print(f"   Массив не изменился: {numbers}")
+    
+    benchmark_vectorized()
+    
+    print("\n=== Анализ трудоемкости ===")
+    print("pushBack:                 O(1) амортизированная (рост ×2 с копированием буфера)")
+    print("find/find_all/count:      O(n) - векторное сравнение")
+    print("filter/map:               O(n) - один проход на C")
+    print("sum/min/max:              O(n) - векторные агрегаты")
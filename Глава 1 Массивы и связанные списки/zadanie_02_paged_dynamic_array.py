@@ -0,0 +1,326 @@
+"""
+Задание 2 (дополнение). Страничный динамический массив
+Элементы хранятся в страницах фиксированного размера 2^k, а массив растет
+добавлением новой страницы в каталог страниц. Существующие элементы при
+росте никогда не копируются, поэтому худшая задержка pushBack ограничена
+временем выделения одной страницы, а не O(n), как у DynamicArray._resize.
+
+Индексация: page = pages[i >> k], offset = i & mask, где mask = 2^k - 1.
+"""
+
+import gc
+import time
+
+from zadanie_02_dynamic_array import DynamicArray
+
+
+class PagedDynamicArray(DynamicArray):
+    """Динамический массив на каталоге страниц."""
+    
+    def __init__(self, page_bits=12, shrink=False, verbose=False, on_resize=None):
+        """
+        Инициализация пустого массива без страниц.
+        
+        Args:
+            page_bits: k - размер страницы 2^k элементов (по умолчанию 4096)
+            shrink: освобождать ли лишние пустые страницы в конце
+            verbose, on_resize: как в DynamicArray
+        """
+        super().__init__(0, shrink=shrink, verbose=verbose, on_resize=on_resize)
+        self.page_bits = page_bits
+        self.page_size = 1 << page_bits
+        self.mask = self.page_size - 1
+        self.pages = []  # Каталог страниц
+        self.data = self.pages
+    
+    def _add_page(self):
+        """
+        Добавление одной страницы в конец каталога.
+        Трудоемкость: O(page_size) - выделение страницы, без копирования
+        элементов. Время выделения попадает в телеметрию как "остановка".
+        """
+        old_capacity = self.capacity
+        start_ns = time.perf_counter_ns()
+        self.pages.append([None] * self.page_size)
+        alloc_ns = time.perf_counter_ns() - start_ns
+        
+        self.capacity += self.page_size
+        self.peak_capacity = max(self.peak_capacity, self.capacity)
+        self.total_resize_ns += alloc_ns
+        self.max_resize_ns = max(self.max_resize_ns, alloc_ns)
+        
+        if self.on_resize is not None:
+            self.on_resize({
+                'old_capacity': old_capacity,
+                'new_capacity': self.capacity,
+                'copied': 0,
+                'copy_ns': alloc_ns,
+                'bytes_copied_total': self.bytes_copied,
+                'max_resize_ns': self.max_resize_ns,
+            })
+    
+    def _resize(self, min_capacity=None):
+        """
+        Расширение добавлением страниц (элементы не копируются).
+        Трудоемкость: O(page_size) на страницу.
+        """
+        needed = self.size + 1 if min_capacity is None else min_capacity
+        while self.capacity < needed:
+            self._add_page()
+        self.resize_count += 1
+        if self.verbose:
+            print(f"   [Расширение массива #{self.resize_count}: "
+                  f"страниц = {len(self.pages)}, вместимость = {self.capacity}]")
+    
+    def _drop_pages(self, keep):
+        """Освобождение страниц сверх первых keep (в них нет элементов)."""
+        if keep < len(self.pages):
+            del self.pages[keep:]
+            self.capacity = keep * self.page_size
+            self.shrink_count += 1
+    
+    def _used_pages(self):
+        """Количество страниц, в которых есть элементы."""
+        return (self.size + self.mask) >> self.page_bits
+    
+    def _shrink_if_needed(self):
+        """
+        Освобождение пустых страниц в конце с гистерезисом:
+        одна пустая страница остается в запасе.
+        """
+        if self.shrink and len(self.pages) > self._used_pages() + 1:
+            self._drop_pages(self._used_pages() + 1)
+    
+    def reserve(self, n):
+        """Резервирование места под n элементов добавлением страниц."""
+        while self.capacity < n:
+            self._add_page()
+    
+    def shrink_to_fit(self):
+        """Освобождение всех страниц, в которых нет элементов."""
+        self._drop_pages(self._used_pages())
+    
+    def _read(self, start, stop):
+        """Чтение элементов [start, stop) в список - срезами по страницам."""
+        result = []
+        while start < stop:
+            page = self.pages[start >> self.page_bits]
+            offset = start & self.mask
+            count = min(self.page_size - offset, stop - start)
+            result.extend(page[offset:offset + count])
+            start += count
+        return result
+    
+    def _write(self, start, values):
+        """Запись списка values начиная с позиции start - срезами по страницам."""
+        written = 0
+        while written < len(values):
+            page = self.pages[start >> self.page_bits]
+            offset = start & self.mask
+            count = min(self.page_size - offset, len(values) - written)
+            page[offset:offset + count] = values[written:written + count]
+            start += count
+            written += count
+    
+    def pushBack(self, value):
+        """
+        Добавление элемента в конец.
+        Трудоемкость: O(1); в худшем случае O(page_size) на новую страницу,
+        независимо от числа элементов в массиве.
+        """
+        if self.size >= self.capacity:
+            self._resize()
+        
+        self.pages[self.size >> self.page_bits][self.size & self.mask] = value
+        self.size += 1
+    
+    def pushFront(self, value):
+        """Добавление элемента в начало. O(n)."""
+        self.insert(0, value)
+    
+    def insert(self, index, value):
+        """
+        Вставка элемента на произвольную позицию.
+        Трудоемкость: O(n) - в каждой странице от index до конца выполняется
+        сдвиг срезом, последний элемент страницы переносится в следующую.
+        """
+        if index < 0 or index > self.size:
+            raise IndexError(f"Индекс {index} выходит за границы [0, {self.size}]")
+        
+        if self.size >= self.capacity:
+            self._resize()
+        
+        first_page = index >> self.page_bits
+        last_page = self.size >> self.page_bits
+        carry = value
+        for page_index in range(first_page, last_page + 1):
+            page = self.pages[page_index]
+            start = index & self.mask if page_index == first_page else 0
+            out = page[-1]
+            page[start + 1:] = page[start:-1]
+            page[start] = carry
+            carry = out
+        
+        self.size += 1
+    
+    def remove(self, index):
+        """
+        Удаление элемента по индексу.
+        Трудоемкость: O(n) - сдвиг срезами по страницам с переносом
+        первого элемента следующей страницы в конец текущей.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Индекс {index} выходит за границы [0, {self.size - 1}]")
+        
+        first_page = index >> self.page_bits
+        last_page = (self.size - 1) >> self.page_bits
+        removed_value = self.pages[first_page][index & self.mask]
+        for page_index in range(first_page, last_page + 1):
+            page = self.pages[page_index]
+            start = index & self.mask if page_index == first_page else 0
+            page[start:-1] = page[start + 1:]
+            page[-1] = self.pages[page_index + 1][0] if page_index < last_page else None
+        
+        self.size -= 1
+        self._shrink_if_needed()
+        
+        return removed_value
+    
+    def insert_many(self, index, iterable):
+        """
+        Вставка группы элементов начиная с позиции index.
+        Трудоемкость: O(n + k) - хвост перечитывается и записывается срезами.
+        """
+        if index < 0 or index > self.size:
+            raise IndexError(f"Индекс {index} выходит за границы [0, {self.size}]")
+        
+        values = list(iterable)
+        if self.size + len(values) > self.capacity:
+            self._resize(self.size + len(values))
+        
+        tail = self._read(index, self.size)
+        self._write(index, values + tail)
+        self.size += len(values)
+    
+    def remove_range(self, start, stop):
+        """
+        Удаление элементов с индексами [start, stop).
+        Трудоемкость: O(n).
+        """
+        if start < 0 or stop > self.size or start > stop:
+            raise IndexError(f"Диапазон [{start}, {stop}) выходит за границы [0, {self.size}]")
+        
+        removed = self._read(start, stop)
+        k = stop - start
+        self._write(start, self._read(stop, self.size))
+        self._write(self.size - k, [None] * k)
+        self.size -= k
+        self._shrink_if_needed()
+        
+        return removed
+    
+    def get(self, index):
+        """
+        Получение элемента по индексу: pages[i >> k][i & mask].
+        Трудоемкость: O(1).
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Индекс {index} выходит за границы [0, {self.size - 1}]")
+        return self.pages[index >> self.page_bits][index & self.mask]
+    
+    def find(self, value):
+        """
+        Поиск элемента по значению постранично (встроенный index).
+        Трудоемкость: O(n).
+        """
+        for page_index in range(self._used_pages()):
+            stop = min(self.page_size, self.size - (page_index << self.page_bits))
+            try:
+                return (page_index << self.page_bits) + self.pages[page_index].index(value, 0, stop)
+            except ValueError:
+                pass
+        return -1
+    
+    def toList(self):
+        """Преобразование в Python list."""
+        return self._read(0, self.size)
+    
+    def stats(self):
+        """Статистика DynamicArray плюс число страниц."""
+        result = super().stats()
+        result['pages'] = len(self.pages)
+        result['page_size'] = self.page_size
+        return result
+    
+    def __str__(self):
+        """Строковое представление массива."""
+        if self.size > 10:
+            head = ', '.join(map(str, self._read(0, 5)))
+            tail = ', '.join(map(str, self._read(self.size - 5, self.size)))
+            return (f"PagedDynamicArray([{head} ... {tail}], size={self.size}, "
+                    f"pages={len(self.pages)}, capacity={self.capacity})")
+        return f"PagedDynamicArray({self.toList()}, pages={len(self.pages)}, capacity={self.capacity})"
+
+
+def benchmark_push_latency(N=2000000):
+    """
+    Задержка отдельных вызовов pushBack: средняя (амортизированная),
+    99.9-й перцентиль и худшая. У DynamicArray худший случай - копирование
+    всего массива, у PagedDynamicArray - выделение одной страницы.
+    Сборщик мусора на время замера отключается, чтобы его проходы
+    не маскировали задержки самих структур.
+    """
+    print(f"\n=== Задержка pushBack ({N} вставок) ===\n")
+    print(f"   {'Структура':<19}{'Средняя, нс':>12}{'p99.9, нс':>11}"
+          f"{'Худшая, мкс':>13}{'Расширений':>12}")
+    
+    for arr in (DynamicArray(), PagedDynamicArray()):
+        latencies = [0] * N
+        clock = time.perf_counter_ns
+        gc.disable()
+        try:
+            for i in range(N):
+                start_ns = clock()
+                arr.pushBack(i)
+                latencies[i] = clock() - start_ns
+        finally:
+            gc.enable()
+        mean = sum(latencies) / N
+        latencies.sort()
+        p999 = latencies[int(N * 0.999)]
+        worst = latencies[-1]
+        print(f"   {type(arr).__name__:<19}{mean:>12.0f}{p999:>11}"
+              f"{worst / 1000:>13.1f}{arr.resize_count:>12}")
+
+
+# Тестирование
+if __name__ == "__main__":
+    print("=== Тестирование страничного динамического массива ===\n")
+    
+    print("1. Добавление 10 элементов (страницы по 4 элемента):")
+    paged = PagedDynamicArray(page_bits=2, shrink=True, verbose=True)
+    for i in range(10):
+        paged.pushBack(i * 10)
+    print(f"   {paged}")
+    print(f"   Страницы: {paged.pages}")
+    
+    print("\n2. Вставка в начало и в середину:")
+    paged.pushFront(-1)
+    paged.insert(6, 999)
+    print(f"   {paged}")
+    print(f"   get(6) = {paged.get(6)}, find(90) = {paged.find(90)}")
+    
+    print("\n3. Удаление и освобождение страниц:")
+    print(f"   remove(0) = {paged.remove(0)}")
+    print(f"   remove_range(2, 10) удалил {paged.remove_range(2, 10)}")
+    print(f"   {paged}")
+    print(f"   {paged.stats()}")
+    
+    benchmark_push_latency()
+    
+    print("\n=== Анализ трудоемкости ===")
+    print("get:        O(1) - pages[i >> k][i & mask]")
+    print("pushBack:   O(1), худший случай O(page_size) вместо O(n)")
+    print("insert:     O(n) - сдвиг срезами по страницам")
+    print("remove:     O(n) - сдвиг срезами по страницам")
+    print("Рост:       без копирования существующих элементов")
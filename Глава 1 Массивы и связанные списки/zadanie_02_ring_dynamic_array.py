@@ -0,0 +1,257 @@
+"""
+Задание 2 (дополнение). Динамический массив на кольцевом буфере
+Расширяемый циклический массив: начало данных хранится в поле front,
+а индексы переходят через конец массива так же, как в CircularQueue
+(задание 6). Добавление и удаление с обоих концов - O(1) амортизированная,
+доступ по индексу - O(1) через арифметику смещений.
+
+При расширении содержимое "разворачивается" в начало нового массива
+не более чем двумя копированиями срезов.
+"""
+
+import time
+
+from zadanie_02_dynamic_array import DynamicArray
+
+
+class RingDynamicArray(DynamicArray):
+    """Динамический массив с циклической адресацией."""
+    
+    def __init__(self, initial_capacity=8, growth='x2', shrink=False,
+                 verbose=False, on_resize=None):
+        """
+        Инициализация пустого кольцевого массива.
+        
+        Args:
+            initial_capacity: начальная вместимость
+            growth, shrink, verbose, on_resize: как в DynamicArray
+        """
+        super().__init__(initial_capacity, growth, shrink, verbose, on_resize)
+        self.front = 0  # Физический индекс первого элемента
+    
+    def _copy_into(self, new_data):
+        """
+        Разворачивание кольца в начало нового массива.
+        Не более двух копирований срезов: [front, capacity) и [0, конец).
+        """
+        end = self.front + self.size
+        if end <= self.capacity:
+            new_data[:self.size] = self.data[self.front:end]
+        else:
+            first_part = self.capacity - self.front
+            new_data[:first_part] = self.data[self.front:self.capacity]
+            new_data[first_part:self.size] = self.data[:end - self.capacity]
+        self.front = 0
+    
+    def _unwrap(self):
+        """
+        Перенос начала данных в индекс 0 (поворот кольца двумя срезами).
+        Нужен перед операциями в середине массива, которые сдвигают
+        элементы срезами. Трудоемкость: O(n), если front != 0, иначе O(1).
+        """
+        if self.front != 0:
+            self.data = self.data[self.front:] + self.data[:self.front]
+            self.front = 0
+    
+    def pushBack(self, value):
+        """
+        Добавление элемента в конец.
+        Трудоемкость: O(1) амортизированная.
+        """
+        if self.size >= self.capacity:
+            self._resize()
+        
+        self.data[(self.front + self.size) % self.capacity] = value
+        self.size += 1
+    
+    def pushFront(self, value):
+        """
+        Добавление элемента в начало - начало кольца сдвигается влево.
+        Трудоемкость: O(1) амортизированная (без сдвига элементов).
+        """
+        if self.size >= self.capacity:
+            self._resize()
+        
+        self.front = (self.front - 1) % self.capacity  # Циклический переход
+        self.data[self.front] = value
+        self.size += 1
+    
+    def popBack(self):
+        """
+        Удаление и возврат последнего элемента.
+        Трудоемкость: O(1) амортизированная.
+        
+        Raises:
+            IndexError: если массив пуст
+        """
+        if self.size == 0:
+            raise IndexError("Массив пуст")
+        
+        index = (self.front + self.size - 1) % self.capacity
+        value = self.data[index]
+        self.data[index] = None
+        self.size -= 1
+        self._shrink_if_needed()
+        
+        return value
+    
+    def popFront(self):
+        """
+        Удаление и возврат первого элемента.
+        Трудоемкость: O(1) амортизированная.
+        
+        Raises:
+            IndexError: если массив пуст
+        """
+        if self.size == 0:
+            raise IndexError("Массив пуст")
+        
+        value = self.data[self.front]
+        self.data[self.front] = None
+        self.front = (self.front + 1) % self.capacity  # Циклический переход
+        self.size -= 1
+        self._shrink_if_needed()
+        
+        return value
+    
+    def insert(self, index, value):
+        """
+        Вставка элемента на произвольную позицию.
+        Трудоемкость: O(1) амортизированная на концах, O(n) в середине.
+        """
+        if index == 0:
+            self.pushFront(value)
+        elif index == self.size:
+            self.pushBack(value)
+        else:
+            self._unwrap()
+            super().insert(index, value)
+    
+    def remove(self, index):
+        """
+        Удаление элемента по индексу.
+        Трудоемкость: O(1) амортизированная на концах, O(n) в середине.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Индекс {index} выходит за границы [0, {self.size - 1}]")
+        if index == 0:
+            return self.popFront()
+        if index == self.size - 1:
+            return self.popBack()
+        self._unwrap()
+        return super().remove(index)
+    
+    def insert_many(self, index, iterable):
+        """Групповая вставка. O(n + k)."""
+        self._unwrap()
+        super().insert_many(index, iterable)
+    
+    def remove_range(self, start, stop):
+        """Удаление диапазона [start, stop). O(n)."""
+        self._unwrap()
+        return super().remove_range(start, stop)
+    
+    def get(self, index):
+        """
+        Получение элемента по индексу через арифметику смещений.
+        Трудоемкость: O(1).
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Индекс {index} выходит за границы [0, {self.size - 1}]")
+        return self.data[(self.front + index) % self.capacity]
+    
+    def find(self, value):
+        """
+        Поиск элемента по значению в обеих частях кольца.
+        Трудоемкость: O(n).
+        """
+        end = self.front + self.size
+        try:
+            return self.data.index(value, self.front, min(end, self.capacity)) - self.front
+        except ValueError:
+            pass
+        if end > self.capacity:
+            try:
+                return self.data.index(value, 0, end - self.capacity) + self.capacity - self.front
+            except ValueError:
+                pass
+        return -1
+    
+    def toList(self):
+        """Преобразование в Python list в логическом порядке."""
+        end = self.front + self.size
+        if end <= self.capacity:
+            return self.data[self.front:end]
+        return self.data[self.front:self.capacity] + self.data[:end - self.capacity]
+    
+    def __str__(self):
+        """Строковое представление массива."""
+        elements = self.toList()
+        if self.size > 10:
+            return (f"RingDynamicArray([{', '.join(map(str, elements[:5]))} ... "
+                    f"{', '.join(map(str, elements[-5:]))}], size={self.size}, "
+                    f"front={self.front}, capacity={self.capacity})")
+        return f"RingDynamicArray({elements}, front={self.front}, capacity={self.capacity})"
+
+
+def benchmark_front_operations(N=10000):
+    """
+    Сравнение вставки и удаления в начале: DynamicArray vs RingDynamicArray.
+    """
+    print(f"\n=== {N} вставок и удалений в начале ===\n")
+    
+    for cls, complexity in ((DynamicArray, "O(n) на операцию"),
+                            (RingDynamicArray, "O(1) амортизированная")):
+        arr = cls()
+        start_time = time.perf_counter()
+        for i in range(N):
+            arr.pushFront(i)
+        for _ in range(N):
+            arr.remove(0)
+        elapsed = time.perf_counter() - start_time
+        print(f"   {cls.__name__:<17} {elapsed:.4f} сек  ({complexity})")
+
+
+# Тестирование
+if __name__ == "__main__":
+    print("=== Тестирование кольцевого динамического массива ===\n")
+    
+    print("1. Добавление элементов с обоих концов:")
+    ring = RingDynamicArray(initial_capacity=4)
+    for i in range(3):
+        ring.pushBack(i)
+        ring.pushFront(-i - 1)
+    print(f"   {ring}")
+    
+    print("\n2. Доступ по индексу (front учитывается автоматически):")
+    print(f"   get(0) = {ring.get(0)}, get(5) = {ring.get(5)}")
+    
+    print("\n3. Удаление с обоих концов:")
+    print(f"   popFront() = {ring.popFront()}, popBack() = {ring.popBack()}")
+    print(f"   {ring}")
+    
+    print("\n4. Демонстрация переноса через конец массива:")
+    wrap = RingDynamicArray(initial_capacity=4)
+    for i in range(4):
+        wrap.pushBack(i)
+    wrap.popFront()
+    wrap.popFront()
+    wrap.pushBack(4)
+    wrap.pushBack(5)
+    print(f"   Физический массив: {wrap.data}")
+    print(f"   Логический порядок: {wrap}")
+    wrap.pushBack(6)
+    print(f"   После расширения (развернут двумя срезами): {wrap.data}")
+    
+    print("\n5. Вставка и поиск в середине:")
+    wrap.insert(2, 99)
+    print(f"   {wrap}, find(99) = {wrap.find(99)}")
+    
+    benchmark_front_operations()
+    
+    print("\n=== Анализ трудоемкости ===")
+    print("pushFront/pushBack:  O(1) амортизированная")
+    print("popFront/popBack:    O(1) амортизированная")
+    print("get:                 O(1) - (front + index) % capacity")
+    print("insert/remove:       O(n) в середине")
+    print("Расширение:          O(n) - не более двух копирований срезов")
@@ -0,0 +1,261 @@
+"""
+Задание 2 (дополнение). Многоуровневый массив (tiered vector)
+Элементы хранятся в блоках фиксированного размера b, каждый блок - кольцевой
+массив (RingDynamicArray), а верхний уровень - список блоков. Все блоки,
+кроме последнего, заполнены полностью, поэтому блок элемента вычисляется
+делением индекса: доступ по индексу - O(1).
+
+Вставка в середину сдвигает элементы только внутри одного блока (O(b)),
+а затем переносит по одному элементу между соседними блоками - в кольцевом
+буфере это O(1) на блок, всего O(n / b). При b ≈ √n вставка и удаление
+стоят O(√n) вместо O(n) у DynamicArray и LinkedList.
+"""
+
+import random
+import time
+
+from zadanie_02_dynamic_array import DynamicArray
+from zadanie_02_ring_dynamic_array import RingDynamicArray
+from zadanie_03_singly_linked_list import LinkedList, Node
+
+
+class TieredArray:
+    """Многоуровневый массив: список блоков-колец фиксированного размера."""
+    
+    def __init__(self, block_size=64):
+        """
+        Инициализация пустого массива.
+        
+        Args:
+            block_size: начальный размер блока. Когда элементов становится
+                        больше 4·b², размер блока удваивается (перестройка
+                        за O(n)), чтобы b оставался порядка √n.
+        """
+        self.block_size = block_size
+        self.blocks = []
+        self.size = 0
+        self.rebuild_count = 0  # Счетчик перестроек при росте
+    
+    def _new_block(self):
+        """Кольцевой блок с местом под один временный лишний элемент."""
+        return RingDynamicArray(initial_capacity=self.block_size + 1)
+    
+    def _rebuild_if_needed(self):
+        """
+        Удвоение размера блока, когда n > 4·b².
+        Трудоемкость: O(n), амортизированно O(1) на вставку.
+        """
+        if self.size <= 4 * self.block_size * self.block_size:
+            return
+        elements = self.toList()
+        self.block_size *= 2
+        self.blocks = []
+        for start in range(0, len(elements), self.block_size):
+            block = self._new_block()
+            block.extend(elements[start:start + self.block_size])
+            self.blocks.append(block)
+        self.rebuild_count += 1
+    
+    def _locate(self, index):
+        """Номер блока и смещение внутри блока для индекса. O(1)."""
+        return index // self.block_size, index % self.block_size
+    
+    def pushBack(self, value):
+        """
+        Добавление элемента в конец.
+        Трудоемкость: O(1) амортизированная.
+        """
+        if not self.blocks or self.blocks[-1].size >= self.block_size:
+            self.blocks.append(self._new_block())
+        self.blocks[-1].pushBack(value)
+        self.size += 1
+        self._rebuild_if_needed()
+    
+    def pushFront(self, value):
+        """
+        Добавление элемента в начало.
+        Трудоемкость: O(n / b) - перенос по одному элементу между блоками.
+        """
+        self.insert(0, value)
+    
+    def insert(self, index, value):
+        """
+        Вставка элемента на произвольную позицию.
+        Трудоемкость: O(b + n / b) = O(√n) - сдвиг внутри одного блока
+        и перенос последнего элемента каждого следующего блока в начало
+        соседнего (O(1) для кольцевого буфера).
+        
+        Raises:
+            IndexError: если индекс выходит за границы
+        """
+        if index < 0 or index > self.size:
+            raise IndexError(f"Индекс {index} выходит за границы [0, {self.size}]")
+        
+        if index == self.size:
+            self.pushBack(value)
+            return
+        
+        block_index, offset = self._locate(index)
+        self.blocks[block_index].insert(offset, value)
+        
+        # Каскадный перенос лишнего элемента в следующий блок
+        while self.blocks[block_index].size > self.block_size:
+            carry = self.blocks[block_index].popBack()
+            block_index += 1
+            if block_index == len(self.blocks):
+                self.blocks.append(self._new_block())
+            self.blocks[block_index].pushFront(carry)
+        
+        self.size += 1
+        self._rebuild_if_needed()
+    
+    def remove(self, index):
+        """
+        Удаление элемента по индексу.
+        Трудоемкость: O(b + n / b) = O(√n) - сдвиг внутри блока и перенос
+        первого элемента каждого следующего блока в конец предыдущего.
+        
+        Returns:
+            Удаленное значение
+        
+        Raises:
+            IndexError: если индекс выходит за границы
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Индекс {index} выходит за границы [0, {self.size - 1}]")
+        
+        block_index, offset = self._locate(index)
+        removed_value = self.blocks[block_index].remove(offset)
+        
+        # Каскадное заполнение образовавшейся дыры из следующих блоков
+        for i in range(block_index, len(self.blocks) - 1):
+            self.blocks[i].pushBack(self.blocks[i + 1].popFront())
+        
+        if self.blocks[-1].size == 0:
+            self.blocks.pop()
+        
+        self.size -= 1
+        return removed_value
+    
+    def get(self, index):
+        """
+        Получение элемента по индексу.
+        Трудоемкость: O(1) - номер блока и смещение вычисляются делением.
+        """
+        if index < 0 or index >= self.size:
+            raise IndexError(f"Индекс {index} выходит за границы [0, {self.size - 1}]")
+        block_index, offset = self._locate(index)
+        return self.blocks[block_index].get(offset)
+    
+    def find(self, value):
+        """
+        Поиск элемента по значению (поблочно).
+        Трудоемкость: O(n).
+        
+        Returns:
+            Индекс первого найденного элемента или -1
+        """
+        for block_index, block in enumerate(self.blocks):
+            offset = block.find(value)
+            if offset != -1:
+                return block_index * self.block_size + offset
+        return -1
+    
+    def toList(self):
+        """Преобразование в Python list."""
+        result = []
+        for block in self.blocks:
+            result.extend(block.toList())
+        return result
+    
+    def __len__(self):
+        return self.size
+    
+    def __str__(self):
+        """Строковое представление массива."""
+        elements = self.toList()
+        if self.size > 10:
+            return (f"TieredArray([{', '.join(map(str, elements[:5]))} ... "
+                    f"{', '.join(map(str, elements[-5:]))}], size={self.size}, "
+                    f"blocks={len(self.blocks)}, block_size={self.block_size})")
+        return f"TieredArray({elements}, blocks={len(self.blocks)}, block_size={self.block_size})"
+
+
+def _linked_list_insert(linked_list, index, value):
+    """Вставка в LinkedList по индексу: проход O(index) до предыдущего узла."""
+    if index == 0:
+        linked_list.pushFront(value)
+        return
+    current = linked_list.head
+    for _ in range(index - 1):
+        current = current.next
+    new_node = Node(value)
+    new_node.next = current.next
+    current.next = new_node
+    if new_node.next is None:
+        linked_list.tail = new_node
+    linked_list.size += 1
+
+
+def benchmark_middle_inserts(sizes=(1000, 10000, 100000), operations=1000):
+    """
+    Вставки в случайные позиции: TieredArray vs DynamicArray vs LinkedList.
+    На малых n выигрывает DynamicArray (сдвиг срезом на C), на больших -
+    TieredArray благодаря O(√n) против O(n).
+    """
+    print(f"\n=== {operations} вставок в случайные позиции (мкс/операцию) ===\n")
+    print(f"   {'N':>8}{'DynamicArray':>15}{'LinkedList':>13}{'TieredArray':>14}")
+    
+    for n in sizes:
+        positions = [random.randint(0, n) for _ in range(operations)]
+        results = []
+        
+        dynamic_arr = DynamicArray()
+        dynamic_arr.extend(range(n))
+        tiered = TieredArray()
+        for i in range(n):
+            tiered.pushBack(i)
+        linked_list = LinkedList()
+        for i in range(n):
+            linked_list.pushBack(i)
+        
+        for insert in (dynamic_arr.insert,
+                       lambda index, value: _linked_list_insert(linked_list, index, value),
+                       tiered.insert):
+            start_time = time.perf_counter()
+            for position in positions:
+                insert(position, -1)
+            results.append((time.perf_counter() - start_time) / operations * 1e6)
+        
+        print(f"   {n:>8}{results[0]:>15.2f}{results[1]:>13.2f}{results[2]:>14.2f}")
+
+
+# Тестирование
+if __name__ == "__main__":
+    print("=== Тестирование многоуровневого массива ===\n")
+    
+    print("1. Добавление 12 элементов (размер блока 4):")
+    tiered = TieredArray(block_size=4)
+    for i in range(12):
+        tiered.pushBack(i)
+    print(f"   {tiered}")
+    print(f"   Блоки: {[block.toList() for block in tiered.blocks]}")
+    
+    print("\n2. Вставка 99 на позицию 5 (каскадный перенос между блоками):")
+    tiered.insert(5, 99)
+    print(f"   Блоки: {[block.toList() for block in tiered.blocks]}")
+    
+    print("\n3. Удаление элемента на позиции 1:")
+    print(f"   Удален: {tiered.remove(1)}")
+    print(f"   Блоки: {[block.toList() for block in tiered.blocks]}")
+    
+    print("\n4. Доступ и поиск:")
+    print(f"   get(4) = {tiered.get(4)}, find(99) = {tiered.find(99)}, find(-5) = {tiered.find(-5)}")
+    
+    benchmark_middle_inserts()
+    
+    print("\n=== Анализ трудоемкости ===")
+    print("get:             O(1) - деление индекса на размер блока")
+    print("pushBack:        O(1) амортизированная")
+    print("insert/remove:   O(b + n/b) = O(√n)")
+    print("find:            O(n)")
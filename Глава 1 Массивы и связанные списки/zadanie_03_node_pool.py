@@ -0,0 +1,236 @@
+"""
+Задание 3 (дополнение). Пул узлов (free list)
+Ограниченный пул повторно использует узлы, освобожденные при удалении
+из LinkedList, DoublyLinkedList и StackLinkedList (задание 5). Вместо
+выделения нового объекта на каждую вставку узел берется из списка
+свободных узлов, поэтому при "очередной" нагрузке (вставка в конец,
+удаление из начала) аллокатор и сборщик мусора почти не задействуются.
+
+Свободные узлы связаны через собственное поле next (интрузивный список),
+отдельный контейнер для них не нужен. Пул можно передать нескольким
+структурам с одинаковым видом узлов - например, LinkedList и
+StackLinkedList делят узлы Node(data, next).
+
+Важно: после удаления узел возвращается в пул и может быть выдан снова,
+поэтому ссылки на удаленные узлы (removeNode, find) использовать нельзя.
+"""
+
+import gc
+import os
+import sys
+import time
+
+from zadanie_03_singly_linked_list import LinkedList, Node
+from zadanie_04_doubly_linked_list import DoublyLinkedList, DoublyNode
+
+
+class NodePool:
+    """Ограниченный пул узлов одного класса."""
+    
+    def __init__(self, node_class, max_size=1024):
+        """
+        Args:
+            node_class: класс узлов (конструктор от одного аргумента data)
+            max_size: максимальное число свободных узлов в пуле; лишние
+                      освобожденные узлы отдаются сборщику мусора
+        """
+        if max_size < 0:
+            raise ValueError("Размер пула не может быть отрицательным")
+        self.node_class = node_class
+        self.max_size = max_size
+        self._free = None      # Голова списка свободных узлов
+        self.free_count = 0
+        self.hits = 0          # Узел выдан из пула
+        self.misses = 0        # Пул пуст - создан новый узел
+        self.released = 0      # Узел возвращен в пул
+        self.dropped = 0       # Пул полон - узел отдан сборщику мусора
+    
+    def acquire(self, data):
+        """
+        Получение узла с данными data: из пула, если он не пуст,
+        иначе новый. Трудоемкость: O(1).
+        """
+        node = self._free
+        if node is None:
+            self.misses += 1
+            return self.node_class(data)
+        
+        self._free = node.next
+        self.free_count -= 1
+        self.hits += 1
+        node.__init__(data)  # Сброс всех полей, как у нового узла
+        return node
+    
+    def release(self, node):
+        """
+        Возврат узла в пул. Ссылки узла на данные и соседей обнуляются,
+        чтобы пул не удерживал их в памяти. Трудоемкость: O(1).
+        """
+        if self.free_count >= self.max_size:
+            self.dropped += 1
+            return
+        
+        node.__init__(None)
+        node.next = self._free
+        self._free = node
+        self.free_count += 1
+        self.released += 1
+    
+    def clear(self):
+        """Освобождение всех свободных узлов пула."""
+        self._free = None
+        self.free_count = 0
+    
+    def stats(self):
+        """Счетчики пула и доля выдач без выделения памяти."""
+        requests = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / requests if requests else 0.0,
+            'released': self.released,
+            'dropped': self.dropped,
+            'free': self.free_count,
+            'max_size': self.max_size,
+        }
+    
+    def __str__(self):
+        return (f"NodePool({self.node_class.__name__}, free={self.free_count}/{self.max_size}, "
+                f"hits={self.hits}, misses={self.misses})")
+
+
+def _import_stack():
+    """Импорт StackLinkedList из соседней главы (задание 5)."""
+    chapter = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Глава 2 Стек и очередь")
+    if chapter not in sys.path:
+        sys.path.append(chapter)
+    from zadanie_05_stack import StackLinkedList
+    return StackLinkedList
+
+
+def _churn_linked_list(pool, window, operations):
+    """Очередь на LinkedList: pushBack в конец, removeByValue головы."""
+    linked = LinkedList(pool=pool)
+    for i in range(window):
+        linked.pushBack(i)
+    for i in range(window, window + operations):
+        linked.pushBack(i)
+        linked.removeByValue(linked.head.data)
+
+
+def _churn_doubly(pool, window, operations):
+    """Очередь на DoublyLinkedList: pushBack в конец, removeNode головы."""
+    dll = DoublyLinkedList(pool=pool)
+    for i in range(window):
+        dll.pushBack(i)
+    for i in range(window, window + operations):
+        dll.pushBack(i)
+        dll.removeNode(dll.head)
+
+
+def _churn_stack(stack_class, pool, window, operations):
+    """Стек: пачка push, затем столько же pop."""
+    stack = stack_class(pool=pool)
+    for _ in range(operations // window):
+        for i in range(window):
+            stack.push(i)
+        for _ in range(window):
+            stack.pop()
+
+
+def benchmark_node_pool(operations=500000, window=1000):
+    """
+    Пропускная способность и паузы сборщика мусора при высокой
+    текучести узлов: без пула и с пулом. Паузы GC измеряются через
+    gc.callbacks (время от 'start' до 'stop' каждой сборки).
+    """
+    StackLinkedList = _import_stack()
+    
+    print(f"\n=== Пул узлов: {operations} вставок и удалений, окно {window} ===\n")
+    print(f"   {'Структура':<18}{'Пул':>5}{'Опер./с':>12}{'Сборок GC':>11}"
+          f"{'Пауза GC, мс':>14}{'Попаданий':>11}")
+    
+    gc_events = []
+    
+    def on_gc(phase, info):
+        gc_events.append((phase, time.perf_counter_ns()))
+    
+    scenarios = (
+        ("LinkedList", Node, lambda pool: _churn_linked_list(pool, window, operations)),
+        ("DoublyLinkedList", DoublyNode, lambda pool: _churn_doubly(pool, window, operations)),
+        ("StackLinkedList", Node, lambda pool: _churn_stack(StackLinkedList, pool, window, operations)),
+    )
+    
+    gc.callbacks.append(on_gc)
+    try:
+        for name, node_class, run in scenarios:
+            for pool in (None, NodePool(node_class, max_size=window)):
+                gc.collect()
+                gc_events.clear()
+                start_time = time.perf_counter()
+                run(pool)
+                elapsed = time.perf_counter() - start_time
+                
+                starts = [t for phase, t in gc_events if phase == 'start']
+                stops = [t for phase, t in gc_events if phase == 'stop']
+                pause_ms = sum(stop - start for start, stop in zip(starts, stops)) / 1e6
+                hit_rate = f"{pool.stats()['hit_rate']:>11.1%}" if pool else f"{'-':>11}"
+                print(f"   {name:<18}{'да' if pool else 'нет':>5}{operations / elapsed:>12.0f}"
+                      f"{len(starts):>11}{pause_ms:>14.2f}{hit_rate}")
+    finally:
+        gc.callbacks.remove(on_gc)
+    
+    print("\n   В CPython выделение небольших объектов и так быстрое (pymalloc),")
+    print("   поэтому пул почти не меняет пропускную способность, а выигрыш -")
+    print("   в числе сборок GC, когда узлы накапливаются пачками (стек).")
+
+
+# Тестирование
+if __name__ == "__main__":
+    print("=== Тестирование пула узлов ===\n")
+    
+    print("1. Односвязный список с пулом:")
+    pool = NodePool(Node, max_size=4)
+    ll = LinkedList(pool=pool)
+    for i in range(6):
+        ll.pushBack(i)
+    print(f"   {ll}, {pool}")
+    for value in (0, 1, 2):
+        ll.removeByValue(value)
+    print(f"   После удаления 0, 1, 2: {ll}, {pool}")
+    for i in range(10, 14):
+        ll.pushBack(i)
+    print(f"   После 4 вставок: {ll}, {pool}")
+    
+    print("\n2. Общий пул для LinkedList и StackLinkedList:")
+    StackLinkedList = _import_stack()
+    stack = StackLinkedList(pool=pool)
+    ll.removeByValue(10)
+    ll.removeByValue(11)
+    stack.push('A')
+    stack.push('B')
+    print(f"   {stack}, {pool}")
+    
+    print("\n3. Двусвязный список с пулом:")
+    dll_pool = NodePool(DoublyNode, max_size=8)
+    dll = DoublyLinkedList(pool=dll_pool)
+    for i in range(5):
+        dll.pushBack(i)
+    dll.removeNode(dll.head)
+    dll.removeNode(dll.tail)
+    dll.insertAfter(dll.head, 99)
+    print(f"   {dll}, обратный порядок: {dll.toListReverse()}")
+    print(f"   {dll_pool.stats()}")
+    
+    print("\n4. Узел двусвязного списка нельзя выдать односвязному:")
+    try:
+        DoublyLinkedList(pool=pool)
+    except ValueError as e:
+        print(f"   Ошибка: {e}")
+    
+    benchmark_node_pool()
+    
+    print("\n=== Анализ трудоемкости ===")
+    print("acquire:   O(1) - снятие узла с головы списка свободных")
+    print("release:   O(1) - добавление узла в голову списка свободных")
+    print("Память:    не более max_size свободных узлов")
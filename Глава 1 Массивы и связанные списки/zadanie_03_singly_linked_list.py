@@ -6,33 +6,159 @@
 - поиск по значению,
 - разворот списка in-place.
 Сравнить операции вставки/удаления с массивом.
+
+Дополнительно: узлы со __slots__ (без словаря атрибутов на каждый узел)
+и отчет о занимаемой памяти memory_footprint(); индексированный режим
+(indexed=True) - словарь "значение -> узлы" и словарь предшественников,
+с которыми removeByValue и проверка вхождения выполняются за O(1)
+(для дублирующихся значений removeByValue ищет первый узел проходом
+от головы, то есть O(n));
+устойчивая сортировка слиянием sort() без выделения узлов и групповое
+построение extend()/from_iterable(); ленивые обходы __iter__,
+__reversed__ и iter_range(), __str__ без копирования всего списка.
 """
 
+import gc
+import math
+import os
+import sys
 import time
+import tracemalloc
 
 
 class Node:
     """Узел односвязного списка."""
     
+    # Без словаря атрибутов у каждого экземпляра: 48 байт на узел,
+    # без __slots__ - около 90 (Python 3.11) и до ~150 в старых версиях
+    __slots__ = ('data', 'next')
+    
     def __init__(self, data):
         self.data = data
         self.next = None
 
 
+def linked_memory_footprint(linked, include_data=False):
+    """
+    Память связного списка по sys.getsizeof: обход узлов от linked.head
+    по ссылкам next. Общая часть memory_footprint() односвязного
+    и двусвязного списков.
+    Трудоемкость: O(n).
+    
+    Args:
+        linked: список с полями head, size и методом index_memory()
+        include_data: учитывать ли сами хранимые объекты
+    
+    Returns:
+        Словарь с размером объекта списка, узлов, индексов, данных
+        и числом байт на элемент
+    """
+    list_bytes = sys.getsizeof(linked)
+    index_bytes = linked.index_memory()
+    node_bytes = 0
+    data_bytes = 0
+    current = linked.head
+    while current is not None:
+        node_bytes += sys.getsizeof(current)
+        if hasattr(current, '__dict__'):  # Узел без __slots__
+            node_bytes += sys.getsizeof(current.__dict__)
+        if include_data:
+            data_bytes += sys.getsizeof(current.data)
+        current = current.next
+    
+    size = linked.size
+    total = list_bytes + node_bytes + index_bytes + data_bytes
+    return {
+        'size': size,
+        'list_bytes': list_bytes,
+        'node_bytes': node_bytes,
+        'index_bytes': index_bytes,
+        'data_bytes': data_bytes,
+        'total_bytes': total,
+        'bytes_per_element': total / size if size else 0,
+    }
+
+
 class LinkedList:
     """Односвязный список."""
     
-    def __init__(self):
+    def __init__(self, pool=None, indexed=False):
+        """
+        Args:
+            pool: необязательный пул узлов (NodePool(Node)) - удаленные
+                  узлы возвращаются в него и используются повторно
+            indexed: вести индекс "значение -> узлы" и индекс
+                     предшественников (значения должны быть хешируемыми)
+        """
+        if pool is not None and not issubclass(pool.node_class, Node):
+            raise ValueError(f"Пул должен выдавать узлы {Node.__name__}")
         self.head = None
         self.tail = None
         self.size = 0
+        self.pool = pool
+        self.indexed = indexed
+        self._index = {}  # Значение -> узел или {узел: None} при дубликатах
+        self._prev = {}   # Узел -> предыдущий узел (None для головы)
+    
+    def _new_node(self, data):
+        """Новый узел: из пула, если он задан. O(1)."""
+        if self.pool is not None:
+            return self.pool.acquire(data)
+        return Node(data)
+    
+    def _free_node(self, node):
+        """Возврат удаленного узла в пул, если он задан. O(1)."""
+        if self.pool is not None:
+            self.pool.release(node)
+    
+    def _index_add(self, node, prev):
+        """
+        Регистрация нового узла в индексах. O(1) в среднем.
+        Уникальное значение хранит сам узел; множество узлов
+        заводится только для дубликатов - это экономит память.
+        """
+        entry = self._index.get(node.data)
+        if entry is None:
+            self._index[node.data] = node
+        elif type(entry) is dict:
+            entry[node] = None
+        else:
+            self._index[node.data] = {entry: None, node: None}
+        self._prev[node] = prev
+        if node.next is not None:
+            self._prev[node.next] = node
+    
+    def _index_discard(self, node):
+        """Удаление узла из индекса значений. O(1) в среднем."""
+        entry = self._index[node.data]
+        if type(entry) is dict:
+            del entry[node]
+            if len(entry) == 1:
+                self._index[node.data] = next(iter(entry))
+        else:
+            del self._index[node.data]
+    
+    def _index_first(self, value):
+        """
+        Первый по порядку узел со значением value или None.
+        Трудоемкость: O(1) в среднем для уникального значения; при
+        дубликатах - O(n): узлы значения хранятся без учета порядка
+        в списке, поэтому первый из них ищется проходом от головы.
+        """
+        entry = self._index.get(value)
+        if type(entry) is not dict:
+            return entry
+        current = self.head
+        while current not in entry:
+            current = current.next
+        return current
     
     def pushFront(self, data):
         """
         Вставка элемента в начало списка.
         Трудоемкость: O(1) - создание узла и обновление ссылок.
         """
-        new_node = Node(data)
+        new_node = self._new_node(data)
         
         if self.head is None:
             # Список пуст
@@ -43,6 +169,8 @@ class LinkedList:
             new_node.next = self.head
             self.head = new_node
         
+        if self.indexed:
+            self._index_add(new_node, None)
         self.size += 1
     
     def pushBack(self, data):
@@ -51,7 +179,8 @@ class LinkedList:
         Трудоемкость: O(1) - при наличии указателя tail.
         Без указателя tail потребовалось бы O(n) для поиска последнего узла.
         """
-        new_node = Node(data)
+        new_node = self._new_node(data)
+        prev = self.tail
         
         if self.head is None:
             # Список пуст
@@ -62,25 +191,36 @@ class LinkedList:
             self.tail.next = new_node
             self.tail = new_node
         
+        if self.indexed:
+            self._index_add(new_node, prev)
         self.size += 1
     
     def removeByValue(self, value):
         """
         Удаление первого узла с заданным значением.
-        Трудоемкость: O(n) - требуется поиск узла.
+        Трудоемкость: O(n) - требуется поиск узла;
+        в индексированном режиме O(1) в среднем: узел берется из индекса
+        значений, а его предшественник - из индекса предшественников.
+        Для дублирующегося значения первый узел ищется проходом от
+        головы, поэтому такое удаление остается O(n).
         
         Returns:
             True, если элемент найден и удален, иначе False.
         """
+        if self.indexed:
+            return self._remove_indexed(value)
+        
         if self.head is None:
             return False
         
         # Особый случай: удаление головы
         if self.head.data == value:
+            removed = self.head
             self.head = self.head.next
             if self.head is None:
                 self.tail = None
             self.size -= 1
+            self._free_node(removed)
             return True
         
         # Поиск узла для удаления
@@ -88,23 +228,63 @@ class LinkedList:
         while current.next is not None:
             if current.next.data == value:
                 # Найден узел для удаления
-                if current.next == self.tail:
+                removed = current.next
+                if removed is self.tail:
                     self.tail = current
-                current.next = current.next.next
+                current.next = removed.next
                 self.size -= 1
+                self._free_node(removed)
                 return True
             current = current.next
         
         return False
     
+    def _remove_indexed(self, value):
+        """
+        Удаление по значению через индексы.
+        Трудоемкость: O(1) в среднем для уникального значения,
+        O(n) при дубликатах (см. _index_first).
+        """
+        node = self._index_first(value)
+        if node is None:
+            return False
+        
+        prev = self._prev.pop(node)
+        if prev is None:
+            self.head = node.next
+        else:
+            prev.next = node.next
+        if node.next is not None:
+            self._prev[node.next] = prev
+        if node is self.tail:
+            self.tail = prev
+        
+        self._index_discard(node)
+        self.size -= 1
+        self._free_node(node)
+        return True
+    
     def find(self, value):
         """
         Поиск элемента по значению.
         Трудоемкость: O(n) - последовательный перебор узлов.
+        В индексированном режиме отсутствие значения определяется за O(1),
+        а для найденного узла индекс считается проходом до него.
         
         Returns:
             Индекс найденного элемента или -1, если не найден.
         """
+        if self.indexed:
+            target = self._index_first(value)
+            if target is None:
+                return -1
+            index = 0
+            current = self.head
+            while current is not target:
+                current = current.next
+                index += 1
+            return index
+        
         current = self.head
         index = 0
         
@@ -116,6 +296,15 @@ class LinkedList:
         
         return -1
     
+    def __contains__(self, value):
+        """
+        Проверка вхождения: value in список.
+        Трудоемкость: O(1) в среднем в индексированном режиме, иначе O(n).
+        """
+        if self.indexed:
+            return value in self._index
+        return self.find(value) != -1
+    
     def reverse(self):
         """
         Разворот списка in-place.
@@ -137,6 +326,143 @@ class LinkedList:
             current = next_node
         
         self.head = prev
+        
+        if self.indexed:
+            self._rebuild_prev()  # Предшественники поменялись у всех узлов
+    
+    def _rebuild_prev(self):
+        """Пересчет индекса предшественников одним проходом. O(n)."""
+        self._prev = {}
+        prev = None
+        current = self.head
+        while current is not None:
+            self._prev[current] = prev
+            prev = current
+            current = current.next
+    
+    def extend(self, iterable):
+        """
+        Добавление элементов в конец одним проходом: цепочка строится
+        локальными переменными, tail и size обновляются один раз.
+        Трудоемкость: O(k), k - число добавляемых элементов.
+        """
+        if self.pool is None and not self.indexed:
+            # Быстрый путь: цепочка за временным узлом-сторожем
+            sentinel = last = Node(None)
+            added = 0
+            for added, data in enumerate(iterable, 1):
+                last.next = last = Node(data)
+            if added:
+                if self.tail is None:
+                    self.head = sentinel.next
+                else:
+                    self.tail.next = sentinel.next
+                self.tail = last
+                self.size += added
+            return
+        
+        tail = self.tail
+        added = 0
+        for data in iterable:
+            node = self._new_node(data)
+            if tail is None:
+                self.head = node
+            else:
+                tail.next = node
+            if self.indexed:
+                self._index_add(node, tail)
+            tail = node
+            added += 1
+        
+        self.tail = tail
+        self.size += added
+    
+    @classmethod
+    def from_iterable(cls, iterable, **kwargs):
+        """
+        Создание списка из последовательности (аргументы kwargs - как
+        у конструктора, например pool или indexed). O(n).
+        """
+        linked = cls(**kwargs)
+        linked.extend(iterable)
+        return linked
+    
+    def sort(self, key=None, reverse=False):
+        """
+        Устойчивая сортировка слиянием снизу вверх (bottom-up) на месте:
+        узлы только перецепляются, новые узлы и списки не создаются.
+        Трудоемкость: O(n log n) времени, O(1) дополнительной памяти.
+        
+        Args:
+            key: функция ключа (вызывается при каждом сравнении, чтобы
+                 не хранить ключи в отдельной памяти)
+            reverse: сортировка по убыванию; равные элементы сохраняют
+                     исходный порядок, как у sorted(reverse=True)
+        """
+        if self.size < 2:
+            return
+        
+        # before(right, left): должен ли узел right встать раньше узла left
+        if key is None:
+            if reverse:
+                before = lambda right, left: right.data > left.data
+            else:
+                before = lambda right, left: right.data < left.data
+        elif reverse:
+            before = lambda right, left: key(right.data) > key(left.data)
+        else:
+            before = lambda right, left: key(right.data) < key(left.data)
+        
+        head = self.head
+        width = 1
+        while width < self.size:
+            merged_head = merged_tail = None
+            current = head
+            while current is not None:
+                # Отрезаем две соседние серии длины width
+                left = current
+                for _ in range(width - 1):
+                    if current.next is None:
+                        break
+                    current = current.next
+                right = current.next
+                current.next = None
+                current = right
+                for _ in range(width - 1):
+                    if current is None or current.next is None:
+                        break
+                    current = current.next
+                if current is not None:
+                    rest = current.next
+                    current.next = None
+                    current = rest
+                
+                # Слияние: при равенстве первым идет узел из левой серии
+                while left is not None and right is not None:
+                    if before(right, left):
+                        node, right = right, right.next
+                    else:
+                        node, left = left, left.next
+                    if merged_tail is None:
+                        merged_head = node
+                    else:
+                        merged_tail.next = node
+                    merged_tail = node
+                remainder = left if left is not None else right
+                if merged_tail is None:
+                    merged_head = merged_tail = remainder
+                else:
+                    merged_tail.next = remainder
+                while merged_tail.next is not None:
+                    merged_tail = merged_tail.next
+            
+            head = merged_head
+            width *= 2
+        
+        self.head = head
+        self.tail = merged_tail
+        if self.indexed:
+            self._rebuild_prev()
     
     def toList(self):
         """Преобразование связного списка в Python list для удобства."""
@@ -147,15 +473,99 @@ class LinkedList:
             current = current.next
         return result
     
+    def __iter__(self):
+        """
+        Ленивый обход от головы к хвосту (генератор).
+        Трудоемкость: O(1) на элемент, O(1) дополнительной памяти.
+        """
+        current = self.head
+        while current is not None:
+            yield current.data
+            current = current.next
+    
+    def iter_range(self, start, stop=None):
+        """
+        Ленивый обход элементов с индексами [start, stop), как itertools.islice.
+        Трудоемкость: O(stop) - проход до start и выдача stop - start элементов.
+        
+        Raises:
+            ValueError: если start или stop отрицательны
+        """
+        if start < 0 or (stop is not None and stop < 0):
+            raise ValueError("Индексы должны быть неотрицательными")
+        stop = self.size if stop is None else min(stop, self.size)
+        
+        current = self.head
+        for _ in range(min(start, stop)):
+            current = current.next
+        for _ in range(start, stop):
+            yield current.data
+            current = current.next
+    
+    def __reversed__(self):
+        """
+        Ленивый обход от хвоста к голове.
+        Односвязный список нельзя пройти назад, поэтому при первом проходе
+        запоминается каждый √n-й узел (контрольные точки), а затем отрезки
+        между ними по очереди разворачиваются от последнего к первому.
+        Трудоемкость: O(n) времени, O(√n) дополнительной памяти
+        (вместо O(n) у reversed(toList())).
+        """
+        step = max(1, math.isqrt(self.size))
+        checkpoints = []
+        current = self.head
+        index = 0
+        while current is not None:
+            if index % step == 0:
+                checkpoints.append(current)
+            current = current.next
+            index += 1
+        
+        for checkpoint in reversed(checkpoints):
+            segment = []
+            current = checkpoint
+            while current is not None and len(segment) < step:
+                segment.append(current.data)
+                current = current.next
+            yield from reversed(segment)
+    
+    def memory_footprint(self, include_data=False):
+        """
+        Память, занимаемая списком, по sys.getsizeof.
+        Трудоемкость: O(n) - обход всех узлов.
+        
+        Args:
+            include_data: учитывать ли сами хранимые объекты
+                          (общие объекты, например малые int, считаются
+                          в каждом узле заново)
+        
+        Returns:
+            Словарь с размером объекта списка, узлов, индексов, данных
+            и числом байт на элемент
+        """
+        return linked_memory_footprint(self, include_data)
+    
+    def index_memory(self):
+        """
+        Накладные расходы индексов в байтах (словари и множества узлов
+        дубликатов, без самих ключей-значений). Трудоемкость: O(число значений).
+        """
+        if not self.indexed:
+            return 0
+        return (sys.getsizeof(self._index) + sys.getsizeof(self._prev)
+                + sum(sys.getsizeof(entry) for entry in self._index.values() if type(entry) is dict))
+    
     def __str__(self):
         """Строковое представление списка."""
         if self.head is None:
             return "LinkedList([])"
         
-        elements = self.toList()
-        if len(elements) > 10:
-            return f"LinkedList([{', '.join(map(str, elements[:5]))} ... {', '.join(map(str, elements[-5:]))}], size={self.size})"
-        return f"LinkedList({elements})"
+        if self.size > 10:
+            # Только первые и последние 5 элементов, без копии всего списка
+            head = ', '.join(map(str, self.iter_range(0, 5)))
+            tail = ', '.join(map(str, self.iter_range(self.size - 5)))
+            return f"LinkedList([{head} ... {tail}], size={self.size})"
+        return f"LinkedList({self.toList()})"
     
     def __len__(self):
         return self.size
@@ -234,6 +644,201 @@ def compare_with_array():
     print("✗ Доступ по индексу: массив O(1) vs односвязный список O(n)")
 
 
+class _DictNode:
+    """Узел односвязного списка без __slots__ (прежний вариант, для сравнения)."""
+    
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+class _DictDoublyNode:
+    """Узел двусвязного списка без __slots__ (прежний вариант, для сравнения)."""
+    
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        self.prev = None
+
+
+def _current_rss():
+    """Текущий RSS процесса в байтах (Linux, /proc) или None."""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        # statm считает страницы; их размер зависит от платформы (4-64 КБ)
+        return pages * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _build_chain(node_class, N, doubly):
+    """Цепочка из N узлов, связанных так же, как в pushBack."""
+    head = tail = node_class(0)
+    for i in range(1, N):
+        node = node_class(i)
+        tail.next = node
+        if doubly:
+            node.prev = tail
+        tail = node
+    return head
+
+
+def benchmark_node_memory(N=1000000):
+    """
+    Узлы со __slots__ против узлов со словарем атрибутов: время создания
+    цепочки из N узлов, память по tracemalloc (байт на узел) и прирост RSS.
+    Цепочки не освобождаются до конца замера, чтобы каждая занимала
+    новую память, а не переиспользовала освобожденную.
+    """
+    from zadanie_04_doubly_linked_list import DoublyNode
+    
+    print(f"\n=== Память узлов: __slots__ vs __dict__ ({N} узлов) ===\n")
+    print(f"   {'Узел':<17}{'Создание, с':>12}{'Байт/узел':>11}{'RSS, МБ':>9}")
+    
+    alive = []
+    for name, node_class, doubly in (("Node (__dict__)", _DictNode, False),
+                                     ("Node (__slots__)", Node, False),
+                                     ("DoublyNode (dict)", _DictDoublyNode, True),
+                                     ("DoublyNode (slot)", DoublyNode, True)):
+        gc.collect()
+        rss_before = _current_rss()
+        gc.disable()
+        start_time = time.perf_counter()
+        alive.append(_build_chain(node_class, N, doubly))
+        elapsed = time.perf_counter() - start_time
+        gc.enable()
+        rss_after = _current_rss()
+        
+        tracemalloc.start()
+        chain = _build_chain(node_class, N // 10, doubly)
+        per_node = tracemalloc.get_traced_memory()[0] / (N // 10)
+        tracemalloc.stop()
+        del chain
+        
+        rss = f"{(rss_after - rss_before) / 2**20:>9.1f}" if rss_before is not None else f"{'н/д':>9}"
+        print(f"   {name:<17}{elapsed:>12.3f}{per_node:>11.0f}{rss}")
+    
+    print("\n   Байт/узел включает сам int-объект данных (~28-32 байта).")
+
+
+def benchmark_indexed(N=20000, lookups=2000):
+    """
+    Обычный и индексированный режимы LinkedList и DoublyLinkedList:
+    проверка вхождения и удаление по значению для случайных значений,
+    плюс накладные расходы индекса в байтах на элемент.
+    """
+    import random
+    
+    from zadanie_04_doubly_linked_list import DoublyLinkedList
+    
+    print(f"\n=== Индекс значений: {lookups} поисков и удалений в списке из {N} ===\n")
+    print(f"   {'Структура':<18}{'Режим':<14}{'in, мкс':>9}{'Удаление, мкс':>15}{'Индекс, Б/эл':>14}")
+    
+    values = random.sample(range(N), lookups)
+    for cls in (LinkedList, DoublyLinkedList):
+        for indexed in (False, True):
+            linked = cls(indexed=indexed)
+            for i in range(N):
+                linked.pushBack(i)
+            index_per_element = linked.index_memory() / N
+            
+            start_time = time.perf_counter()
+            for value in values:
+                value in linked
+            contains_time = (time.perf_counter() - start_time) / lookups * 1e6
+            
+            start_time = time.perf_counter()
+            for value in values:
+                linked.removeByValue(value)
+            remove_time = (time.perf_counter() - start_time) / lookups * 1e6
+            
+            mode = "индекс" if indexed else "обычный"
+            print(f"   {cls.__name__:<18}{mode:<14}{contains_time:>9.2f}"
+                  f"{remove_time:>15.2f}{index_per_element:>14.1f}")
+
+
+def benchmark_sort_and_build(N=200000):
+    """
+    Построение списка (pushBack в цикле против extend) и сортировка
+    (sort на месте против преобразования toList -> sorted -> from_iterable).
+    """
+    import random
+    
+    values = [random.random() for _ in range(N)]
+    print(f"\n=== Построение и сортировка LinkedList ({N} элементов) ===\n")
+    
+    start_time = time.perf_counter()
+    linked = LinkedList()
+    for value in values:
+        linked.pushBack(value)
+    push_time = time.perf_counter() - start_time
+    
+    start_time = time.perf_counter()
+    linked = LinkedList.from_iterable(values)
+    extend_time = time.perf_counter() - start_time
+    
+    print(f"   pushBack в цикле:         {push_time:.4f} сек")
+    print(f"   from_iterable / extend:   {extend_time:.4f} сек  ({push_time / extend_time:.1f}x)")
+    
+    start_time = time.perf_counter()
+    linked.sort()
+    sort_time = time.perf_counter() - start_time
+    in_place = linked.toList()
+    
+    linked = LinkedList.from_iterable(values)
+    start_time = time.perf_counter()
+    linked = LinkedList.from_iterable(sorted(linked.toList()))
+    round_trip_time = time.perf_counter() - start_time
+    
+    print(f"\n   sort() на месте:          {sort_time:.4f} сек  (O(1) доп. памяти)")
+    print(f"   toList -> sorted -> from_iterable: {round_trip_time:.4f} сек  (копия данных и новые узлы)")
+    print(f"   Результаты совпадают: {in_place == linked.toList()}")
+
+
+def _time_and_peak(func):
+    """
+    Время (сек) и пиковая память по tracemalloc (байт) вызова func.
+    Время замеряется отдельным прогоном: трассировка выделений сама
+    замедляет код в разы.
+    """
+    start_time = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start_time
+    
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def benchmark_lazy_iteration(N=1000000):
+    """
+    Ленивые обходы против копии toList(): str() большого списка,
+    обход в обратном порядке и срез из начала списка.
+    """
+    linked = LinkedList.from_iterable(range(N))
+    
+    def str_via_copy():
+        elements = linked.toList()
+        return f"{elements[:5]} ... {elements[-5:]}"
+    
+    print(f"\n=== Ленивый обход LinkedList ({N} элементов) ===\n")
+    print(f"   {'Операция':<38}{'Время, мс':>11}{'Пик памяти':>14}")
+    scenarios = (
+        ("str() через toList()", str_via_copy),
+        ("str() через iter_range", lambda: str(linked)),
+        ("reversed(toList())", lambda: sum(reversed(linked.toList()))),
+        ("reversed(список), √n контрольных точек", lambda: sum(reversed(linked))),
+        ("toList()[:100]", lambda: linked.toList()[:100]),
+        ("iter_range(0, 100)", lambda: list(linked.iter_range(0, 100))),
+    )
+    for name, func in scenarios:
+        elapsed, peak = _time_and_peak(func)
+        print(f"   {name:<38}{elapsed * 1000:>11.2f}{peak / 1024:>11.1f} КБ")
+
+
 # Тестирование
 if __name__ == "__main__":
     print("=== Тестирование односвязного списка ===\n")
@@ -297,12 +902,65 @@ if __name__ == "__main__":
     small_ll.reverse()
     print(f"   После: {small_ll}")
     
+    # Память списка
+    print("\n10. Занимаемая память (memory_footprint):")
+    big_ll = LinkedList()
+    for i in range(1000):
+        big_ll.pushBack(i)
+    footprint = big_ll.memory_footprint(include_data=True)
+    print(f"   {footprint}")
+    print(f"   Байт на элемент: {footprint['bytes_per_element']:.1f}")
+    
+    # Индексированный режим
+    print("\n11. Индексированный режим (indexed=True):")
+    indexed_ll = LinkedList(indexed=True)
+    for value in [5, 3, 8, 3, 1]:
+        indexed_ll.pushBack(value)
+    print(f"   {indexed_ll}: 8 in список = {8 in indexed_ll}, find(3) = {indexed_ll.find(3)}")
+    indexed_ll.removeByValue(8)
+    indexed_ll.removeByValue(3)
+    print(f"   После removeByValue(8) и removeByValue(3): {indexed_ll}")
+    print(f"   Память индекса: {indexed_ll.index_memory()} байт")
+    
+    # Сортировка и групповое построение
+    print("\n12. Групповое построение и сортировка:")
+    words = LinkedList.from_iterable(["pear", "fig", "apple", "kiwi", "banana", "plum"])
+    words.extend(["date"])
+    print(f"   {words}")
+    words.sort(key=len)
+    print(f"   sort(key=len) (устойчивая): {words}")
+    words.sort(reverse=True)
+    print(f"   sort(reverse=True):         {words}, tail = {words.tail.data}")
+    
+    # Ленивые обходы
+    print("\n13. Ленивые обходы:")
+    numbers = LinkedList.from_iterable(range(20))
+    print(f"   {numbers}")
+    print(f"   iter_range(3, 7) = {list(numbers.iter_range(3, 7))}")
+    print(f"   iter_range(17)   = {list(numbers.iter_range(17))}")
+    print(f"   reversed         = {list(reversed(numbers))}")
+    try:
+        list(numbers.iter_range(-1))
+    except ValueError as e:
+        print(f"   iter_range(-1): Ошибка: {e}")
+    
     # Сравнение с массивом
     compare_with_array()
+    benchmark_node_memory()
+    benchmark_indexed()
+    benchmark_sort_and_build()
+    benchmark_lazy_iteration()
     
     print("\n=== Анализ трудоемкости ===")
     print("pushFront:       O(1) - обновление head")
     print("pushBack:        O(1) - обновление tail")
-    print("removeByValue:   O(n) - поиск элемента")
+    print("removeByValue:   O(n) - поиск элемента (с индексом - O(1) в среднем,\n"
+          "                 для дубликатов - O(n))")
     print("find:            O(n) - последовательный поиск")
+    print("in (с индексом): O(1) в среднем")
     print("reverse:         O(n) - один проход по списку")
+    print("extend:          O(k) - tail и size обновляются один раз")
+    print("sort:            O(n log n), O(1) доп. памяти - слияние снизу вверх")
+    print("iter_range:      O(stop) - без копии списка")
+    print("reversed:        O(n), O(√n) доп. памяти - контрольные точки")
+    print("str:             O(n) - проход до последних 5 элементов, без копии")
@@ -0,0 +1,319 @@
+"""
+Задание 3 (дополнение). Список с пропусками (skip list)
+Упорядоченное множество/словарь на основе узлов связного списка.
+Узел SkipNode расширяет Node: кроме ссылки next (нижний уровень - обычный
+отсортированный односвязный список) он хранит массив ссылок forward на
+узлы более высоких уровней. Уровень узла выбирается случайно: с
+вероятностью p узел поднимается еще на уровень, поэтому на уровне i
+в среднем n·p^i узлов, а поиск спускается по уровням за O(log n).
+
+Для rank у каждой ссылки хранится ширина width - сколько узлов нижнего
+уровня она перешагивает (indexable skip list).
+"""
+
+import bisect
+import os
+import random
+import sys
+import time
+
+from zadanie_02_dynamic_array import DynamicArray
+from zadanie_03_singly_linked_list import Node
+
+
+class SkipNode(Node):
+    """Узел списка с пропусками: ключ, значение и ссылки по уровням."""
+    
+    __slots__ = ('value', 'forward', 'width')
+    
+    def __init__(self, key, value=None, level=1):
+        super().__init__(key)
+        self.value = value
+        self.forward = [None] * level  # forward[0] всегда совпадает с next
+        self.width = [1] * level       # Число шагов нижнего уровня по ссылке
+
+
+class SkipList:
+    """Упорядоченный словарь (множество) на списке с пропусками."""
+    
+    MAX_LEVEL = 32
+    
+    def __init__(self, p=0.5, seed=None):
+        """
+        Args:
+            p: вероятность подъема узла на следующий уровень
+            seed: зерно генератора уровней (для воспроизводимости)
+        """
+        if not 0 < p < 1:
+            raise ValueError("Вероятность p должна быть в интервале (0, 1)")
+        self.p = p
+        self._random = random.Random(seed)
+        self._header = SkipNode(None, level=self.MAX_LEVEL)  # Сторож без ключа
+        self.level = 1  # Число используемых уровней
+        self.size = 0
+    
+    @property
+    def head(self):
+        """Первый узел нижнего уровня (как у LinkedList) или None."""
+        return self._header.next
+    
+    def _random_level(self):
+        """Случайный уровень: геометрическое распределение с параметром p."""
+        level = 1
+        while level < self.MAX_LEVEL and self._random.random() < self.p:
+            level += 1
+        return level
+    
+    def _search(self, key):
+        """
+        Спуск по уровням к последнему узлу с ключом < key на каждом уровне.
+        Трудоемкость: O(log n) в среднем.
+        
+        Returns:
+            (update, positions): update[i] - узел, после которого ключ
+            стоял бы на уровне i; positions[i] - число элементов до него
+            включительно (0 для сторожа)
+        """
+        update = [None] * self.level
+        positions = [0] * self.level
+        node = self._header
+        position = 0
+        for i in range(self.level - 1, -1, -1):
+            while node.forward[i] is not None and node.forward[i].data < key:
+                position += node.width[i]
+                node = node.forward[i]
+            update[i] = node
+            positions[i] = position
+        return update, positions
+    
+    def insert(self, key, value=None):
+        """
+        Вставка ключа (со значением). Для существующего ключа значение
+        заменяется.
+        Трудоемкость: O(log n) в среднем.
+        
+        Returns:
+            True, если ключ добавлен, False, если обновлен
+        """
+        update, positions = self._search(key)
+        candidate = update[0].next
+        if candidate is not None and candidate.data == key:
+            candidate.value = value
+            return False
+        
+        level = self._random_level()
+        if level > self.level:
+            for i in range(self.level, level):
+                # Новый уровень: сторож ссылается "за конец" списка
+                self._header.forward[i] = None
+                self._header.width[i] = self.size + 1
+                update.append(self._header)
+                positions.append(0)
+            self.level = level
+        
+        new_node = SkipNode(key, value, level)
+        position = positions[0] + 1  # Позиция нового узла (с единицы)
+        for i in range(level):
+            prev = update[i]
+            distance = position - positions[i]
+            new_node.forward[i] = prev.forward[i]
+            new_node.width[i] = prev.width[i] - distance + 1
+            prev.forward[i] = new_node
+            prev.width[i] = distance
+        for i in range(level, self.level):
+            update[i].width[i] += 1  # Ссылка перешагивает и новый узел
+        
+        new_node.next = new_node.forward[0]
+        update[0].next = new_node
+        self.size += 1
+        return True
+    
+    def remove(self, key):
+        """
+        Удаление ключа.
+        Трудоемкость: O(log n) в среднем.
+        
+        Returns:
+            True, если ключ найден и удален, иначе False
+        """
+        update, _ = self._search(key)
+        target = update[0].next
+        if target is None or target.data != key:
+            return False
+        
+        for i in range(self.level):
+            if update[i].forward[i] is target:
+                update[i].width[i] += target.width[i] - 1
+                update[i].forward[i] = target.forward[i]
+            else:
+                update[i].width[i] -= 1
+        update[0].next = target.next
+        
+        while self.level > 1 and self._header.forward[self.level - 1] is None:
+            self.level -= 1
+        self.size -= 1
+        return True
+    
+    def find(self, key):
+        """
+        Поиск узла по ключу.
+        Трудоемкость: O(log n) в среднем.
+        
+        Returns:
+            Узел (key в поле data, значение в value) или None
+        """
+        node = self._header
+        for i in range(self.level - 1, -1, -1):
+            while node.forward[i] is not None and node.forward[i].data < key:
+                node = node.forward[i]
+        node = node.next
+        if node is not None and node.data == key:
+            return node
+        return None
+    
+    def get(self, key, default=None):
+        """Значение по ключу или default. O(log n)."""
+        node = self.find(key)
+        return default if node is None else node.value
+    
+    def rank(self, key):
+        """
+        Число ключей, строго меньших key (позиция key в отсортированном
+        порядке). Трудоемкость: O(log n) - суммирование ширин ссылок.
+        """
+        _, positions = self._search(key)
+        return positions[0]
+    
+    def range(self, lo, hi):
+        """
+        Обход ключей из отрезка [lo, hi] по возрастанию.
+        Трудоемкость: O(log n + k), k - число выданных ключей.
+        """
+        update, _ = self._search(lo)
+        node = update[0].next
+        while node is not None and node.data <= hi:
+            yield node.data
+            node = node.next
+    
+    def items(self):
+        """Пары (ключ, значение) по возрастанию ключей. O(n)."""
+        node = self.head
+        while node is not None:
+            yield node.data, node.value
+            node = node.next
+    
+    def __iter__(self):
+        """Обход ключей по возрастанию - по нижнему уровню, как LinkedList."""
+        node = self.head
+        while node is not None:
+            yield node.data
+            node = node.next
+    
+    def __contains__(self, key):
+        return self.find(key) is not None
+    
+    def __len__(self):
+        return self.size
+    
+    def toList(self):
+        """Ключи в порядке возрастания."""
+        return list(self)
+    
+    def __str__(self):
+        """Строковое представление списка."""
+        elements = self.toList()
+        if len(elements) > 10:
+            return (f"SkipList([{', '.join(map(str, elements[:5]))} ... "
+                    f"{', '.join(map(str, elements[-5:]))}], size={self.size}, levels={self.level})")
+        return f"SkipList({elements}, levels={self.level})"
+
+
+def _import_bst():
+    """Импорт BST из главы 4 (задание 11)."""
+    chapter = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "Глава 4 Деревья и графы")
+    if chapter not in sys.path:
+        sys.path.append(chapter)
+    from zadanie_11_bst import BST
+    return BST
+
+
+class _SortedDynamicArray:
+    """Отсортированный DynamicArray: бинарный поиск + вставка со сдвигом."""
+    
+    def __init__(self):
+        self.arr = DynamicArray()
+    
+    def insert(self, key):
+        position = bisect.bisect_left(self.arr.data, key, 0, self.arr.size)
+        self.arr.insert(position, key)
+    
+    def find(self, key):
+        position = bisect.bisect_left(self.arr.data, key, 0, self.arr.size)
+        return position < self.arr.size and self.arr.data[position] == key
+    
+    def remove(self, key):
+        position = bisect.bisect_left(self.arr.data, key, 0, self.arr.size)
+        self.arr.remove(position)
+
+
+def benchmark_ordered(N=50000):
+    """
+    Вставка, поиск и удаление N случайных ключей:
+    SkipList vs отсортированный DynamicArray vs BST (задание 11).
+    """
+    BST = _import_bst()
+    keys = random.sample(range(N * 10), N)
+    
+    print(f"\n=== Упорядоченные контейнеры: {N} случайных ключей (мкс/операцию) ===\n")
+    print(f"   {'Структура':<20}{'Вставка':>9}{'Поиск':>9}{'Удаление':>10}")
+    
+    structures = (
+        ("SkipList", SkipList(), "insert", "find", "remove"),
+        ("DynamicArray (sort)", _SortedDynamicArray(), "insert", "find", "remove"),
+        ("BST", BST(), "insert", "search", "delete"),
+    )
+    for name, structure, insert_name, find_name, remove_name in structures:
+        timings = []
+        for method_name in (insert_name, find_name, remove_name):
+            method = getattr(structure, method_name)
+            start_time = time.perf_counter()
+            for key in keys:
+                method(key)
+            timings.append((time.perf_counter() - start_time) / N * 1e6)
+        print(f"   {name:<20}{timings[0]:>9.2f}{timings[1]:>9.2f}{timings[2]:>10.2f}")
+    
+    print("\n   DynamicArray: поиск O(log n), но вставка/удаление - сдвиг O(n);")
+    print("   BST: O(h) - на случайных ключах h ~ log n, на отсортированных - n.")
+
+
+# Тестирование
+if __name__ == "__main__":
+    print("=== Тестирование списка с пропусками ===\n")
+    
+    print("1. Вставка ключей со значениями:")
+    skip = SkipList(seed=1)
+    for key in [30, 10, 50, 20, 40, 60, 70]:
+        skip.insert(key, f"v{key}")
+    print(f"   {skip}")
+    print(f"   Обновление значения: insert(20, 'new') = {skip.insert(20, 'new')}, get(20) = {skip.get(20)}")
+    
+    print("\n2. Поиск:")
+    node = skip.find(40)
+    print(f"   find(40) = ({node.data}, {node.value}), find(45) = {skip.find(45)}, 45 in skip = {45 in skip}")
+    
+    print("\n3. Ранг и диапазон:")
+    print(f"   rank(40) = {skip.rank(40)}, rank(5) = {skip.rank(5)}, rank(100) = {skip.rank(100)}")
+    print(f"   range(15, 55) = {list(skip.range(15, 55))}")
+    
+    print("\n4. Удаление:")
+    print(f"   remove(30) = {skip.remove(30)}, remove(35) = {skip.remove(35)}")
+    print(f"   {skip}, rank(40) = {skip.rank(40)}")
+    print(f"   items() = {list(skip.items())}")
+    
+    benchmark_ordered()
+    
+    print("\n=== Анализ трудоемкости (в среднем) ===")
+    print("insert/remove/find:  O(log n)")
+    print("rank:                O(log n) - сумма ширин ссылок")
+    print("range(lo, hi):       O(log n + k)")
+    print("Обход по порядку:    O(n) - по нижнему уровню (next)")
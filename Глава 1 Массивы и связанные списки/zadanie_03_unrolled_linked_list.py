@@ -0,0 +1,325 @@
+"""
+Задание 3 (дополнение). Развернутый связный список (unrolled linked list)
+Каждый узел хранит не один элемент, а небольшой массив до node_capacity
+элементов. Переход по ссылке выполняется один раз на блок, а внутри блока
+поиск и копирование идут встроенными операциями списка на C - обход и
+find в несколько раз быстрее, чем у LinkedList, а объектов-узлов, которые
+отслеживает сборщик мусора, в node_capacity раз меньше.
+
+Инвариант: каждый узел, кроме последнего, заполнен хотя бы наполовину.
+Переполненный узел делится пополам, а узел, опустевший меньше чем
+наполовину, сливается со следующим или забирает у него элементы.
+"""
+
+import gc
+import sys
+import time
+
+from zadanie_03_singly_linked_list import LinkedList
+
+
+class UnrolledNode:
+    """Узел развернутого списка: массив элементов и ссылка на следующий узел."""
+    
+    __slots__ = ('items', 'next')
+    
+    def __init__(self, items=None):
+        self.items = items if items is not None else []
+        self.next = None
+
+
+class UnrolledLinkedList:
+    """Односвязный список блоков фиксированной вместимости."""
+    
+    def __init__(self, node_capacity=64):
+        """
+        Args:
+            node_capacity: максимальное число элементов в одном узле
+        """
+        if node_capacity < 2:
+            raise ValueError("Вместимость узла должна быть не меньше 2")
+        self.node_capacity = node_capacity
+        self.head = None
+        self.tail = None
+        self.size = 0
+        self.node_count = 0
+    
+    def _split(self, node):
+        """
+        Деление полного узла пополам: вторая половина переносится
+        в новый узел сразу после него.
+        Трудоемкость: O(node_capacity).
+        """
+        middle = len(node.items) // 2
+        new_node = UnrolledNode(node.items[middle:])
+        del node.items[middle:]
+        
+        new_node.next = node.next
+        node.next = new_node
+        if self.tail is node:
+            self.tail = new_node
+        self.node_count += 1
+    
+    def _rebalance(self, prev, node):
+        """
+        Восстановление инварианта после удаления из node.
+        Пустой узел исключается из цепочки; узел, заполненный меньше
+        чем наполовину, сливается со следующим, если оба помещаются
+        в один, иначе забирает недостающие элементы из начала следующего.
+        Трудоемкость: O(node_capacity).
+        """
+        if not node.items:
+            if prev is None:
+                self.head = node.next
+            else:
+                prev.next = node.next
+            if self.tail is node:
+                self.tail = prev
+            self.node_count -= 1
+            return
+        
+        half = self.node_capacity // 2
+        following = node.next
+        if len(node.items) >= half or following is None:
+            return
+        
+        if len(node.items) + len(following.items) <= self.node_capacity:
+            # Слияние: следующий узел поглощается текущим
+            node.items.extend(following.items)
+            node.next = following.next
+            if self.tail is following:
+                self.tail = node
+            self.node_count -= 1
+        else:
+            # Заимствование: следующий узел остается заполненным наполовину
+            need = half - len(node.items)
+            node.items.extend(following.items[:need])
+            del following.items[:need]
+    
+    def pushFront(self, data):
+        """
+        Вставка элемента в начало списка.
+        Трудоемкость: O(node_capacity) - сдвиг внутри первого узла,
+        при переполнении - деление узла пополам.
+        """
+        if self.head is None:
+            self.head = self.tail = UnrolledNode()
+            self.node_count = 1
+        elif len(self.head.items) >= self.node_capacity:
+            self._split(self.head)
+        
+        self.head.items.insert(0, data)
+        self.size += 1
+    
+    def pushBack(self, data):
+        """
+        Вставка элемента в конец списка.
+        Трудоемкость: O(1) - добавление в массив последнего узла или новый узел.
+        """
+        if self.tail is None:
+            self.head = self.tail = UnrolledNode()
+            self.node_count = 1
+        elif len(self.tail.items) >= self.node_capacity:
+            new_node = UnrolledNode()
+            self.tail.next = new_node
+            self.tail = new_node
+            self.node_count += 1
+        
+        self.tail.items.append(data)
+        self.size += 1
+    
+    def removeByValue(self, value):
+        """
+        Удаление первого элемента с заданным значением.
+        Трудоемкость: O(n) - поиск блоками, удаление и перебалансировка
+        за O(node_capacity).
+        
+        Returns:
+            True, если элемент найден и удален, иначе False.
+        """
+        prev = None
+        current = self.head
+        while current is not None:
+            try:
+                offset = current.items.index(value)
+            except ValueError:
+                prev = current
+                current = current.next
+                continue
+            
+            del current.items[offset]
+            self.size -= 1
+            self._rebalance(prev, current)
+            return True
+        
+        return False
+    
+    def find(self, value):
+        """
+        Поиск элемента по значению.
+        Трудоемкость: O(n), но внутри узла - встроенный index на C.
+        
+        Returns:
+            Индекс найденного элемента или -1, если не найден.
+        """
+        base = 0
+        current = self.head
+        while current is not None:
+            try:
+                return base + current.items.index(value)
+            except ValueError:
+                base += len(current.items)
+                current = current.next
+        return -1
+    
+    def reverse(self):
+        """
+        Разворот списка in-place: разворачиваются ссылки между узлами
+        и массив внутри каждого узла.
+        Трудоемкость: O(n).
+        Бывший последний узел становится первым и может быть заполнен
+        меньше чем наполовину - это восстанавливается при удалениях.
+        """
+        prev = None
+        current = self.head
+        self.tail = self.head
+        
+        while current is not None:
+            current.items.reverse()
+            next_node = current.next
+            current.next = prev
+            prev = current
+            current = next_node
+        
+        self.head = prev
+    
+    def toList(self):
+        """Преобразование в Python list - одно копирование на узел."""
+        result = []
+        current = self.head
+        while current is not None:
+            result.extend(current.items)
+            current = current.next
+        return result
+    
+    def __iter__(self):
+        """Обход элементов: один переход по ссылке на node_capacity элементов."""
+        current = self.head
+        while current is not None:
+            yield from current.items
+            current = current.next
+    
+    def memory_footprint(self):
+        """
+        Память узлов и их массивов по sys.getsizeof (без самих данных).
+        Трудоемкость: O(число узлов).
+        """
+        total = sys.getsizeof(self)
+        current = self.head
+        while current is not None:
+            total += sys.getsizeof(current) + sys.getsizeof(current.items)
+            current = current.next
+        return {
+            'size': self.size,
+            'nodes': self.node_count,
+            'total_bytes': total,
+            'bytes_per_element': total / self.size if self.size else 0,
+        }
+    
+    def __str__(self):
+        """Строковое представление списка."""
+        if self.head is None:
+            return "UnrolledLinkedList([])"
+        
+        elements = self.toList()
+        if len(elements) > 10:
+            return (f"UnrolledLinkedList([{', '.join(map(str, elements[:5]))} ... "
+                    f"{', '.join(map(str, elements[-5:]))}], size={self.size}, nodes={self.node_count})")
+        return f"UnrolledLinkedList({elements}, nodes={self.node_count})"
+    
+    def __len__(self):
+        return self.size
+
+
+def benchmark_unrolled(N=1000000):
+    """
+    Сравнение LinkedList и UnrolledLinkedList: построение N элементов,
+    полный обход (toList), поиск отсутствующего значения и число объектов,
+    которые отслеживает сборщик мусора.
+    """
+    print(f"\n=== LinkedList vs UnrolledLinkedList ({N} элементов) ===\n")
+    print(f"   {'Структура':<20}{'Построение, с':>14}{'Обход, с':>10}"
+          f"{'find, с':>9}{'Объектов GC':>13}")
+    
+    results = {}
+    for cls in (LinkedList, UnrolledLinkedList):
+        gc.collect()
+        objects_before = len(gc.get_objects())
+        
+        start_time = time.perf_counter()
+        linked = cls()
+        for i in range(N):
+            linked.pushBack(i)
+        build_time = time.perf_counter() - start_time
+        
+        objects = len(gc.get_objects()) - objects_before
+        
+        start_time = time.perf_counter()
+        linked.toList()
+        scan_time = time.perf_counter() - start_time
+        
+        start_time = time.perf_counter()
+        linked.find(-1)
+        find_time = time.perf_counter() - start_time
+        
+        results[cls] = (build_time, scan_time, find_time)
+        print(f"   {cls.__name__:<20}{build_time:>14.3f}{scan_time:>10.3f}"
+              f"{find_time:>9.3f}{objects:>13}")
+        del linked
+    
+    plain, unrolled = results[LinkedList], results[UnrolledLinkedList]
+    print(f"\n   Ускорение: построение {plain[0] / unrolled[0]:.1f}x, "
+          f"обход {plain[1] / unrolled[1]:.1f}x, find {plain[2] / unrolled[2]:.1f}x")
+
+
+# Тестирование
+if __name__ == "__main__":
+    print("=== Тестирование развернутого связного списка ===\n")
+    
+    print("1. Вставка 10 элементов в конец (вместимость узла 4):")
+    ul = UnrolledLinkedList(node_capacity=4)
+    for i in range(10):
+        ul.pushBack(i)
+    print(f"   {ul}")
+    
+    print("\n2. Вставка в начало с делением полного узла:")
+    ul.pushFront(-1)
+    print(f"   {ul}")
+    
+    print("\n3. Поиск:")
+    print(f"   find(7) = {ul.find(7)}, find(100) = {ul.find(100)}")
+    
+    print("\n4. Удаление со слиянием узлов:")
+    for value in (0, 1, 5):
+        print(f"   removeByValue({value}) = {ul.removeByValue(value)}: {ul}")
+    print(f"   removeByValue(100) = {ul.removeByValue(100)}")
+    
+    print("\n5. Разворот:")
+    ul.reverse()
+    print(f"   {ul}")
+    print(f"   Обход итератором: {list(ul)}")
+    
+    print("\n6. Память (без данных):")
+    big = UnrolledLinkedList()
+    for i in range(10000):
+        big.pushBack(i)
+    print(f"   {big.memory_footprint()}")
+    
+    benchmark_unrolled()
+    
+    print("\n=== Анализ трудоемкости (B - вместимость узла) ===")
+    print("pushBack:        O(1)")
+    print("pushFront:       O(B) - сдвиг внутри первого узла")
+    print("removeByValue:   O(n) - поиск, затем O(B) на слияние")
+    print("find:            O(n) - n/B переходов по ссылкам")
+    print("reverse:         O(n)")
@@ -0,0 +1,384 @@
+"""
+Задание 4 (дополнение). Двусвязный список на параллельных массивах
+Вместо объекта DoublyNode на каждый элемент список хранит три массива
+одинаковой длины: data[i], next[i] и prev[i] описывают узел в ячейке i.
+Ссылки - индексы ячеек в array('q') (8 байт на ссылку на любой
+платформе, в отличие от 'l' с размером C long, вместо указателя
+в объекте с заголовком), поэтому на узел приходится около 24 байт
+вместо 56 у DoublyNode со __slots__, а сборщик мусора не
+отслеживает ни одного объекта-узла.
+
+Дескриптор узла - целый номер ячейки. Освобожденные ячейки образуют
+список свободных (связанный через next) и занимаются повторно, поэтому
+дескриптор удаленного узла использовать нельзя.
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from array import array
+from itertools import islice
+
+from zadanie_04_doubly_linked_list import DoublyLinkedList
+
+
+NIL = -1   # Нет соседа (аналог None у DoublyNode)
+FREE = -2  # Метка свободной ячейки в prev
+
+
+class ArrayDoublyLinkedList:
+    """Двусвязный список с узлами-ячейками параллельных массивов."""
+    
+    def __init__(self, capacity=16, typecode=None):
+        """
+        Args:
+            capacity: начальное число ячеек (удваивается при заполнении)
+            typecode: код типа array для данных ('q', 'd', ...) - тогда и данные
+                      хранятся в компактном массиве; None - list произвольных объектов
+        """
+        if capacity < 1:
+            raise ValueError("Емкость должна быть положительной")
+        self.typecode = typecode
+        self.data = [None] * capacity if typecode is None else array(typecode, [0]) * capacity
+        self.next = array('q', range(1, capacity + 1))
+        self.next[-1] = NIL
+        self.prev = array('q', [FREE]) * capacity
+        self.free = 0  # Голова списка свободных ячеек
+        self.head = NIL
+        self.tail = NIL
+        self.size = 0
+    
+    @property
+    def capacity(self):
+        return len(self.next)
+    
+    def _grow(self):
+        """
+        Удвоение числа ячеек; новые ячейки становятся свободными.
+        Трудоемкость: O(capacity), амортизированно O(1) на вставку.
+        """
+        old = self.capacity
+        if self.typecode is None:
+            self.data.extend([None] * old)
+        else:
+            self.data.extend(array(self.typecode, [0]) * old)
+        self.next.extend(range(old + 1, 2 * old + 1))
+        self.next[-1] = self.free
+        self.prev.extend(array('q', [FREE]) * old)
+        self.free = old
+    
+    def _allocate(self, data):
+        """Занятие свободной ячейки под новый узел. O(1) амортизированно."""
+        if self.free == NIL:
+            self._grow()
+        slot = self.free
+        # Сначала запись данных: если array отвергнет значение (TypeError),
+        # ячейка останется в списке свободных
+        self.data[slot] = data
+        self.free = self.next[slot]
+        self.size += 1
+        return slot
+    
+    def _check(self, handle):
+        """Проверка, что дескриптор указывает на занятую ячейку."""
+        if handle is None:
+            raise ValueError("Узел не может быть None")
+        if not 0 <= handle < self.capacity or self.prev[handle] == FREE:
+            raise ValueError(f"Недействительный дескриптор узла: {handle}")
+    
+    def pushFront(self, data):
+        """
+        Вставка элемента в начало списка.
+        Трудоемкость: O(1) амортизированно.
+        
+        Returns:
+            Дескриптор нового узла
+        """
+        slot = self._allocate(data)
+        self.prev[slot] = NIL
+        self.next[slot] = self.head
+        if self.head == NIL:
+            self.tail = slot
+        else:
+            self.prev[self.head] = slot
+        self.head = slot
+        return slot
+    
+    def pushBack(self, data):
+        """
+        Вставка элемента в конец списка.
+        Трудоемкость: O(1) амортизированно.
+        
+        Returns:
+            Дескриптор нового узла
+        """
+        slot = self._allocate(data)
+        self.next[slot] = NIL
+        self.prev[slot] = self.tail
+        if self.tail == NIL:
+            self.head = slot
+        else:
+            self.next[self.tail] = slot
+        self.tail = slot
+        return slot
+    
+    def insertAfter(self, handle, data):
+        """
+        Вставка элемента после заданного узла.
+        Трудоемкость: O(1) амортизированно.
+        
+        Args:
+            handle: дескриптор узла, после которого вставляем
+            data: данные для нового узла
+        
+        Returns:
+            Дескриптор нового узла
+        """
+        self._check(handle)
+        slot = self._allocate(data)
+        following = self.next[handle]
+        self.prev[slot] = handle
+        self.next[slot] = following
+        if following == NIL:
+            self.tail = slot
+        else:
+            self.prev[following] = slot
+        self.next[handle] = slot
+        return slot
+    
+    def insertBefore(self, handle, data):
+        """
+        Вставка элемента перед заданным узлом.
+        Трудоемкость: O(1) амортизированно.
+        
+        Args:
+            handle: дескриптор узла, перед которым вставляем
+            data: данные для нового узла
+        
+        Returns:
+            Дескриптор нового узла
+        """
+        self._check(handle)
+        slot = self._allocate(data)
+        preceding = self.prev[handle]
+        self.next[slot] = handle
+        self.prev[slot] = preceding
+        if preceding == NIL:
+            self.head = slot
+        else:
+            self.next[preceding] = slot
+        self.prev[handle] = slot
+        return slot
+    
+    def removeNode(self, handle):
+        """
+        Удаление узла без предварительного поиска; ячейка становится свободной.
+        Трудоемкость: O(1).
+        
+        Returns:
+            Данные удаленного узла
+        """
+        self._check(handle)
+        preceding = self.prev[handle]
+        following = self.next[handle]
+        if preceding == NIL:
+            self.head = following
+        else:
+            self.next[preceding] = following
+        if following == NIL:
+            self.tail = preceding
+        else:
+            self.prev[following] = preceding
+        
+        data = self.data[handle]
+        if self.typecode is None:
+            self.data[handle] = None  # Не удерживаем удаленный объект
+        self.prev[handle] = FREE
+        self.next[handle] = self.free
+        self.free = handle
+        self.size -= 1
+        return data
+    
+    def value(self, handle):
+        """Данные узла по дескриптору. O(1)."""
+        self._check(handle)
+        return self.data[handle]
+    
+    def find(self, value):
+        """
+        Поиск узла по значению.
+        Трудоемкость: O(n).
+        
+        Returns:
+            Дескриптор узла или None
+        """
+        data, following = self.data, self.next
+        slot = self.head
+        while slot != NIL:
+            if data[slot] == value:
+                return slot
+            slot = following[slot]
+        return None
+    
+    def toList(self):
+        """Преобразование в Python list."""
+        return list(self)
+    
+    def toListReverse(self):
+        """Преобразование в Python list в обратном порядке."""
+        return list(self.reverse_iter())
+    
+    def __iter__(self):
+        """Прямой обход: от головы к хвосту."""
+        data, following = self.data, self.next
+        slot = self.head
+        while slot != NIL:
+            yield data[slot]
+            slot = following[slot]
+    
+    def reverse_iter(self):
+        """Обратный обход: от хвоста к голове."""
+        data, preceding = self.data, self.prev
+        slot = self.tail
+        while slot != NIL:
+            yield data[slot]
+            slot = preceding[slot]
+    
+    def memory_footprint(self, include_data=False):
+        """
+        Память списка по sys.getsizeof: три массива целиком (включая
+        свободные ячейки). Трудоемкость: O(1), с include_data - O(n).
+        
+        Returns:
+            Словарь с размером массивов ссылок, массива данных,
+            самих данных и числом байт на элемент
+        """
+        link_bytes = sys.getsizeof(self.next) + sys.getsizeof(self.prev)
+        slot_bytes = sys.getsizeof(self.data)
+        data_bytes = 0
+        if include_data and self.typecode is None:
+            data_bytes = sum(sys.getsizeof(item) for item in self)
+        total = sys.getsizeof(self) + link_bytes + slot_bytes + data_bytes
+        return {
+            'size': self.size,
+            'capacity': self.capacity,
+            'link_bytes': link_bytes,
+            'slot_bytes': slot_bytes,
+            'data_bytes': data_bytes,
+            'total_bytes': total,
+            'bytes_per_element': total / self.size if self.size else 0,
+        }
+    
+    def __str__(self):
+        """Строковое представление списка."""
+        if self.size > 10:
+            head = ', '.join(map(str, islice(self, 5)))
+            tail = ', '.join(map(str, reversed(list(islice(self.reverse_iter(), 5)))))
+            return f"ArrayDoublyLinkedList([{head} ... {tail}], size={self.size})"
+        return f"ArrayDoublyLinkedList({self.toList()})"
+    
+    def __len__(self):
+        return self.size
+
+
+def benchmark_array_vs_objects(N=1000000):
+    """
+    Сравнение DoublyLinkedList (объекты DoublyNode) и ArrayDoublyLinkedList:
+    время построения и обхода, память по tracemalloc и число объектов,
+    которые отслеживает сборщик мусора. Данные - небольшие int (кэшированы
+    интерпретатором), поэтому в памяти - только сама структура.
+    """
+    print(f"\n=== DoublyLinkedList vs ArrayDoublyLinkedList ({N} элементов) ===\n")
+    print(f"   {'Структура':<30}{'Построение, с':>14}{'Обход, с':>10}"
+          f"{'Байт/элемент':>14}{'Объектов GC':>13}")
+    
+    variants = (
+        ("DoublyLinkedList", DoublyLinkedList),
+        ("ArrayDoublyLinkedList", ArrayDoublyLinkedList),
+        ("ArrayDoublyLinkedList('q')", lambda: ArrayDoublyLinkedList(typecode='q')),
+    )
+    for name, factory in variants:
+        gc.collect()
+        objects_before = len(gc.get_objects())
+        tracemalloc.start()
+        
+        start_time = time.perf_counter()
+        linked = factory()
+        for i in range(N):
+            linked.pushBack(i % 256)
+        build_time = time.perf_counter() - start_time
+        
+        traced = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        objects = len(gc.get_objects()) - objects_before
+        
+        start_time = time.perf_counter()
+        for _ in linked:
+            pass
+        scan_time = time.perf_counter() - start_time
+        
+        print(f"   {name:<30}{build_time:>14.3f}{scan_time:>10.3f}"
+              f"{traced / N:>14.1f}{objects:>13}")
+        del linked
+    
+    print("\n   Построение замерено под tracemalloc - абсолютное время завышено.")
+    print("   Массивы растут удвоением: после роста до половины ячеек свободны.")
+
+
+# Тестирование
+if __name__ == "__main__":
+    print("=== Тестирование двусвязного списка на массивах ===\n")
+    
+    print("1. Вставка в начало и конец:")
+    adll = ArrayDoublyLinkedList(capacity=4)
+    h1 = adll.pushBack(1)
+    h2 = adll.pushBack(2)
+    h3 = adll.pushBack(3)
+    h0 = adll.pushFront(0)
+    print(f"   {adll}, дескрипторы: {h0}, {h1}, {h2}, {h3}")
+    
+    print("\n2. Вставка после и перед узлом (с ростом массивов):")
+    adll.insertAfter(h1, 1.5)
+    adll.insertBefore(h3, 2.5)
+    print(f"   {adll}, емкость = {adll.capacity}")
+    print(f"   next = {adll.next.tolist()}")
+    print(f"   prev = {adll.prev.tolist()}")
+    
+    print("\n3. Удаление узлов и повторное использование ячеек:")
+    print(f"   removeNode({h1}) = {adll.removeNode(h1)}, removeNode({h0}) = {adll.removeNode(h0)}")
+    print(f"   {adll}, свободная ячейка: {adll.free}")
+    reused = adll.pushBack(4)
+    print(f"   pushBack(4) занял ячейку {reused}: {adll}")
+    try:
+        adll.removeNode(h1)
+    except ValueError as e:
+        print(f"   Повторное удаление: Ошибка: {e}")
+    
+    print("\n4. Обход в обоих направлениях:")
+    print(f"   Вперед: {list(adll)}")
+    print(f"   Назад:  {list(adll.reverse_iter())}")
+    print(f"   find(2.5) = {adll.find(2.5)}, value = {adll.value(adll.find(2.5))}")
+    
+    print("\n5. Занимаемая память (100000 элементов):")
+    objects = DoublyLinkedList()
+    arrays = ArrayDoublyLinkedList()
+    packed = ArrayDoublyLinkedList(typecode='q')
+    for i in range(100000):
+        objects.pushBack(i)
+        arrays.pushBack(i)
+        packed.pushBack(i)
+    for name, linked in (("DoublyLinkedList", objects), ("ArrayDoublyLinkedList", arrays),
+                         ("ArrayDoublyLinkedList('q')", packed)):
+        footprint = linked.memory_footprint()
+        print(f"   {name:<28}{footprint['total_bytes']:>10} байт, "
+              f"{footprint['bytes_per_element']:.1f} байт/элемент")
+    
+    benchmark_array_vs_objects()
+    
+    print("\n=== Анализ трудоемкости ===")
+    print("pushFront/pushBack:  O(1) амортизированно - удвоение массивов")
+    print("insertAfter/Before:  O(1) амортизированно - по дескриптору")
+    print("removeNode:          O(1) - ячейка в список свободных")
+    print("find:                O(n)")
+    print("Память:              3 ячейки массивов на узел, без объектов-узлов")
@@ -0,0 +1,376 @@
+"""
+Задание 4 (дополнение). Потокобезопасный дек на узлах двусвязного списка
+Общий список задач для потоков-производителей и потоков-потребителей.
+Вместо одной общей блокировки на все операции используются три:
+
+- head_lock - голова: pop_front работает только под ней;
+- tail_lock - хвост: push_back работает только под ней;
+- счетчик доступных элементов под условной переменной - на нем
+  ждут блокирующие pop и резервируются элементы (drain - сразу пачкой).
+
+Раздельные блокировки безопасны благодаря сторожевому узлу в голове
+(схема двух блокировок Майкла-Скотта): push_back меняет только
+хвостовой узел, а pop_front не исключает узел из цепочки, а делает
+первый элемент новым сторожем - поэтому даже при одном элементе
+производитель и потребитель не изменяют одни и те же поля.
+Операции с "чужого" конца (push_front, pop_back) берут обе блокировки
+в одном порядке (head_lock, затем tail_lock), взаимоблокировки нет.
+
+Из-за особенностей работы со сторожем дек связывает узлы DoublyNode
+напрямую, а не через методы DoublyLinkedList: счетчик size списка
+изменялся бы из двух потоков одновременно.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+
+from zadanie_04_doubly_linked_list import DoublyLinkedList, DoublyNode
+
+
+class ConcurrentDeque:
+    """Потокобезопасный дек с блокирующими pop и раздельными блокировками концов."""
+    
+    def __init__(self, iterable=()):
+        self._sentinel = DoublyNode(None)  # Голова: элементы начинаются с _sentinel.next
+        self._tail = self._sentinel
+        self.head_lock = threading.Lock()
+        self.tail_lock = threading.Lock()
+        self._available = 0  # Элементы, не зарезервированные потребителями
+        self._not_empty = threading.Condition(threading.Lock())
+        for item in iterable:
+            self.push_back(item)
+    
+    def _publish(self, count=1):
+        """Учет новых элементов и пробуждение ожидающих потребителей."""
+        with self._not_empty:
+            self._available += count
+            if count == 1:
+                self._not_empty.notify()
+            else:
+                self._not_empty.notify(count)
+    
+    def _reserve(self, max_count, block, timeout):
+        """
+        Резервирование до max_count элементов. Зарезервированные элементы
+        гарантированно есть в цепочке: они публикуются после связывания.
+        
+        Returns:
+            Число зарезервированных элементов (0 - элементов нет)
+        """
+        with self._not_empty:
+            if block and not self._available:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while not self._available:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return 0
+                    self._not_empty.wait(remaining)
+            count = min(max_count, self._available)
+            self._available -= count
+            return count
+    
+    def push_back(self, item):
+        """
+        Добавление в конец. Берет только tail_lock.
+        Трудоемкость: O(1).
+        """
+        node = DoublyNode(item)
+        with self.tail_lock:
+            node.prev = self._tail
+            self._tail.next = node
+            self._tail = node
+        self._publish()
+    
+    def push_front(self, item):
+        """
+        Добавление в начало. Берет обе блокировки: при пустом деке
+        меняется и хвост. Трудоемкость: O(1).
+        """
+        node = DoublyNode(item)
+        with self.head_lock, self.tail_lock:
+            first = self._sentinel.next
+            node.prev = self._sentinel
+            node.next = first
+            if first is None:
+                self._tail = node
+            else:
+                first.prev = node
+            self._sentinel.next = node
+        self._publish()
+    
+    def _take_front(self, count):
+        """Снятие count зарезервированных элементов с головы под head_lock."""
+        items = []
+        with self.head_lock:
+            sentinel = self._sentinel
+            for _ in range(count):
+                first = sentinel.next
+                items.append(first.data)
+                # Первый узел становится сторожем - хвост не затрагивается
+                first.data = None
+                first.prev = None
+                sentinel.next = None
+                sentinel = first
+            self._sentinel = sentinel
+        return items
+    
+    def pop_front(self, block=True, timeout=None):
+        """
+        Извлечение из начала. Ожидает элемент, если block=True
+        (не дольше timeout секунд, None - без ограничения).
+        Трудоемкость: O(1).
+        
+        Raises:
+            queue.Empty: если элемента нет (или он не появился за timeout)
+        """
+        if not self._reserve(1, block, timeout):
+            raise queue.Empty
+        return self._take_front(1)[0]
+    
+    def pop_back(self, block=True, timeout=None):
+        """
+        Извлечение из конца. Берет обе блокировки: последний узел
+        может быть и первым. Трудоемкость: O(1).
+        
+        Raises:
+            queue.Empty: если элемента нет (или он не появился за timeout)
+        """
+        if not self._reserve(1, block, timeout):
+            raise queue.Empty
+        with self.head_lock, self.tail_lock:
+            last = self._tail
+            self._tail = last.prev
+            self._tail.next = None
+            last.prev = None
+        return last.data
+    
+    def pop_front_nowait(self):
+        """Извлечение из начала без ожидания (queue.Empty, если пусто)."""
+        return self.pop_front(block=False)
+    
+    def pop_back_nowait(self):
+        """Извлечение из конца без ожидания (queue.Empty, если пусто)."""
+        return self.pop_back(block=False)
+    
+    def drain(self, max_n=None, timeout=0):
+        """
+        Извлечение до max_n элементов из начала за одно резервирование
+        и один захват head_lock (вместо max_n отдельных pop_front).
+        Трудоемкость: O(k), k - число извлеченных элементов.
+        
+        Args:
+            max_n: максимум элементов (None - все доступные)
+            timeout: сколько ждать первый элемент (0 - не ждать,
+                     None - без ограничения)
+        
+        Returns:
+            Список элементов в порядке от головы (может быть пустым)
+        """
+        if max_n is not None and max_n < 1:
+            raise ValueError("max_n должно быть положительным")
+        count = self._reserve(float('inf') if max_n is None else max_n,
+                              timeout != 0, timeout)
+        return self._take_front(count) if count else []
+    
+    def toList(self):
+        """Снимок элементов от головы к хвосту (под обеими блокировками). O(n)."""
+        with self.head_lock, self.tail_lock:
+            result = []
+            current = self._sentinel.next
+            while current is not None:
+                result.append(current.data)
+                current = current.next
+            return result
+    
+    def __len__(self):
+        """Число доступных (не зарезервированных потребителями) элементов. O(1)."""
+        with self._not_empty:
+            return self._available
+    
+    def __str__(self):
+        return f"ConcurrentDeque({self.toList()})"
+
+
+class _LockedDoublyLinkedList:
+    """DoublyLinkedList под одной общей блокировкой (для сравнения)."""
+    
+    def __init__(self):
+        self.items = DoublyLinkedList()
+        self.not_empty = threading.Condition()
+    
+    def push_back(self, item):
+        with self.not_empty:
+            self.items.pushBack(item)
+            self.not_empty.notify()
+    
+    def pop_front(self):
+        with self.not_empty:
+            while self.items.head is None:
+                self.not_empty.wait()
+            return self.items.removeNode(self.items.head)
+
+
+def _run_threads(producers, consumers, items, push, consume):
+    """
+    Запуск производителей и потребителей; каждый потребитель завершается,
+    получив свой маркер None (маркеры добавляются после производителей).
+    
+    Returns:
+        (время в секундах, число полученных элементов)
+    """
+    per_producer = items // producers
+    received = []
+    
+    def produce():
+        for i in range(per_producer):
+            push(i)
+    
+    def consumer():
+        received.append(consume())
+    
+    producer_threads = [threading.Thread(target=produce) for _ in range(producers)]
+    consumer_threads = [threading.Thread(target=consumer) for _ in range(consumers)]
+    start_time = time.perf_counter()
+    for thread in consumer_threads + producer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    for _ in range(consumers):
+        push(None)
+    for thread in consumer_threads:
+        thread.join()
+    return time.perf_counter() - start_time, sum(received)
+
+
+def benchmark_concurrent(items=200000, producers=2, consumers=2, batch=64):
+    """
+    Пропускная способность очереди "производители -> потребители":
+    ConcurrentDeque (pop_front и drain), DoublyLinkedList под одной
+    блокировкой, queue.Queue и collections.deque (без ожидания -
+    потребители опрашивают его в цикле).
+    """
+    print(f"\n=== {producers} производителя, {consumers} потребителя, {items} элементов ===\n")
+    print(f"   {'Очередь':<34}{'Время, с':>10}{'Элем./с':>12}")
+    
+    def count_until_marker(pop):
+        def consume():
+            count = 0
+            while pop() is not None:
+                count += 1
+            return count
+        return consume
+    
+    def count_batches(shared):
+        def consume():
+            count = 0
+            while True:
+                items = shared.drain(batch, timeout=None)
+                markers = items.count(None)
+                count += len(items) - markers
+                if markers:
+                    # Пачка могла захватить и маркеры других потребителей
+                    for _ in range(markers - 1):
+                        shared.push_back(None)
+                    return count
+        return consume
+    
+    def count_polling(shared):
+        def consume():
+            count = 0
+            while True:
+                try:
+                    item = shared.popleft()
+                except IndexError:
+                    time.sleep(0)  # Ожидания нет - уступаем процессор
+                    continue
+                if item is None:
+                    return count
+                count += 1
+        return consume
+    
+    shared_deque = ConcurrentDeque()
+    batched_deque = ConcurrentDeque()
+    locked = _LockedDoublyLinkedList()
+    stdlib_queue = queue.Queue()
+    stdlib_deque = deque()
+    scenarios = (
+        ("ConcurrentDeque.pop_front", shared_deque.push_back, count_until_marker(shared_deque.pop_front)),
+        (f"ConcurrentDeque.drain({batch})", batched_deque.push_back, count_batches(batched_deque)),
+        ("DoublyLinkedList + общая блокировка", locked.push_back, count_until_marker(locked.pop_front)),
+        ("queue.Queue", stdlib_queue.put, count_until_marker(stdlib_queue.get)),
+        ("collections.deque (опрос)", stdlib_deque.append, count_polling(stdlib_deque)),
+    )
+    for name, push, consume in scenarios:
+        elapsed, received = _run_threads(producers, consumers, items, push, consume)
+        status = "" if received == items // producers * producers else f"  (получено {received})"
+        print(f"   {name:<34}{elapsed:>10.3f}{received / elapsed:>12.0f}{status}")
+    
+    print("\n   В CPython потоки разделяют GIL: раздельные блокировки убирают")
+    print("   конкуренцию производителей и потребителей за одну блокировку,")
+    print("   а drain снижает число захватов блокировок в batch раз.")
+
+
+# Тестирование
+if __name__ == "__main__":
+    print("=== Тестирование потокобезопасного дека ===\n")
+    
+    print("1. Операции с обоих концов:")
+    dq = ConcurrentDeque([1, 2, 3])
+    dq.push_front(0)
+    dq.push_back(4)
+    print(f"   {dq}, длина = {len(dq)}")
+    print(f"   pop_front() = {dq.pop_front()}, pop_back() = {dq.pop_back()}: {dq}")
+    
+    print("\n2. Пакетное извлечение drain:")
+    print(f"   drain(2) = {dq.drain(2)}, drain() = {dq.drain()}, остаток: {dq}")
+    
+    print("\n3. Неблокирующие варианты и таймауты:")
+    try:
+        dq.pop_front_nowait()
+    except queue.Empty:
+        print("   pop_front_nowait() на пустом деке: queue.Empty")
+    start = time.perf_counter()
+    try:
+        dq.pop_back(timeout=0.1)
+    except queue.Empty:
+        print(f"   pop_back(timeout=0.1): queue.Empty через {time.perf_counter() - start:.2f} с")
+    
+    print("\n4. Блокирующий pop_front дожидается производителя:")
+    worker = threading.Thread(target=lambda: (time.sleep(0.05), dq.push_back('задача')))
+    worker.start()
+    print(f"   pop_front() = {dq.pop_front(timeout=1)}")
+    worker.join()
+    
+    print("\n5. Несколько производителей и потребителей:")
+    shared = ConcurrentDeque()
+    results = []
+    
+    def producer(start_value):
+        for value in range(start_value, start_value + 1000):
+            shared.push_back(value)
+    
+    def consumer():
+        while True:
+            batch = shared.drain(100, timeout=0.5)
+            if not batch:
+                return
+            results.extend(batch)
+    
+    threads = [threading.Thread(target=producer, args=(i * 1000,)) for i in range(4)]
+    threads += [threading.Thread(target=consumer) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(f"   Получено {len(results)} элементов, все различны и на месте: "
+          f"{sorted(results) == list(range(4000))}")
+    
+    benchmark_concurrent()
+    
+    print("\n=== Анализ трудоемкости ===")
+    print("push_back/pop_front:  O(1) - одна блокировка конца + счетчик")
+    print("push_front/pop_back:  O(1) - обе блокировки")
+    print("drain(k):             O(k) - одно резервирование и один захват head_lock")
+    print("len:                  O(1)")
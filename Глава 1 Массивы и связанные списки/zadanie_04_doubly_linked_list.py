@@ -4,32 +4,297 @@
 - вставку после произвольного узла,
 - удаление узла без поиска "сначала",
 - итератор по двусвязному списку.
+
+Дополнительно: узлы со __slots__ и отчет о памяти memory_footprint();
+индексированный режим (indexed=True) - словарь "значение -> узлы",
+с которым find и removeByValue выполняются за O(1) в среднем
+(для дублирующихся значений - O(n): первый узел ищется от головы);
+moveToFront() - перенос узла в начало за O(1) (очередь вытеснения кэша);
+перенос цепочек узлов splice(), split_after() и concat() перевязкой
+концов - внутренние узлы не затрагиваются, а размер пересчитывается
+лениво при первом обращении;
+позиционный режим (positional=True) - башни skip-индекса над узлами
+с шириной каждой ссылки, дающие get(i), node_at(i), index_of(node)
+и insert_at(i, x) за O(log n) в среднем.
 """
 
+import random
+import sys
+import time
+from itertools import islice
+
+from zadanie_03_singly_linked_list import linked_memory_footprint
+
 
 class DoublyNode:
     """Узел двусвязного списка."""
     
+    # Три ссылки без словаря атрибутов: 56 байт на узел вместо ~100
+    __slots__ = ('data', 'next', 'prev')
+    
     def __init__(self, data):
         self.data = data
         self.next = None
         self.prev = None
 
 
+_GROUND = (None,)  # Башня только из нижнего уровня - общий кортеж без выделения памяти
+
+
+class PositionalDoublyNode(DoublyNode):
+    """
+    Узел двусвязного списка с башней позиционного индекса.
+    Уровень 0 - обычные next/prev; на уровнях 1..h-1 forward/backward
+    ссылаются на соседей той же высоты, а width - сколько узлов
+    нижнего уровня перешагивает ссылка forward.
+    """
+    
+    __slots__ = ('forward', 'backward', 'width')
+    
+    def __init__(self, data):
+        super().__init__(data)
+        self.forward = self.backward = self.width = _GROUND
+
+
 class DoublyLinkedList:
     """Двусвязный список."""
     
-    def __init__(self):
+    SKIP_P = 0.5     # Вероятность подъема узла на следующий уровень индекса
+    MAX_LEVEL = 32
+    
+    def __init__(self, pool=None, indexed=False, positional=False):
+        """
+        Args:
+            pool: необязательный пул узлов (NodePool(DoublyNode)) - узлы,
+                  удаленные через removeNode, используются повторно;
+                  ссылки на них после удаления становятся недействительны
+            indexed: вести индекс "значение -> узлы" (значения должны
+                     быть хешируемыми)
+            positional: вести позиционный skip-индекс (узлы
+                        PositionalDoublyNode) - доступ по номеру за O(log n),
+                        а вставка и удаление узла тоже O(log n) вместо O(1)
+        """
+        self._node_class = PositionalDoublyNode if positional else DoublyNode
+        if pool is not None and not issubclass(pool.node_class, self._node_class):
+            raise ValueError(f"Пул должен выдавать узлы {self._node_class.__name__}")
         self.head = None
         self.tail = None
-        self.size = 0
+        self._size = 0
+        self._size_stale = False  # Размер неизвестен после splice/split_after
+        self.pool = pool
+        self.indexed = indexed
+        self._index = {}  # Значение -> узел или {узел: None} при дубликатах
+        self.positional = positional
+        if positional:
+            self._random = random.Random()
+            self._reset_header()
+    
+    @property
+    def size(self):
+        """
+        Число элементов. После splice/split_after, перенесших цепочку
+        неизвестной длины, пересчитывается при первом обращении за O(n),
+        дальше снова O(1).
+        """
+        if self._size_stale:
+            count = 0
+            current = self.head
+            while current is not None:
+                count += 1
+                current = current.next
+            self._size = count
+            self._size_stale = False
+        return self._size
+    
+    @size.setter
+    def size(self, value):
+        self._size = value
+        self._size_stale = False
+    
+    def _index_add(self, node):
+        """Регистрация узла в индексе "значение -> узлы". O(1) в среднем."""
+        data = node.data
+        entry = self._index.get(data)
+        if entry is None:
+            self._index[data] = node
+        elif type(entry) is dict:
+            entry[node] = None
+        else:
+            self._index[data] = {entry: None, node: None}
+    
+    def _index_discard(self, node):
+        """Удаление узла из индекса "значение -> узлы". O(1) в среднем."""
+        data = node.data
+        entry = self._index[data]
+        if type(entry) is dict:
+            del entry[node]
+            if len(entry) == 1:
+                self._index[data] = next(iter(entry))
+        else:
+            del self._index[data]
+    
+    # Позиционный skip-индекс. Позиции внутри индекса считаются с единицы:
+    # сторож _header стоит в позиции 0, ссылка без соседа ведет "за конец"
+    # в позицию size + 1.
+    
+    def _reset_header(self):
+        """Пустой индекс: сторож с башней максимальной высоты."""
+        header = PositionalDoublyNode(None)
+        header.forward = [None] * self.MAX_LEVEL
+        header.backward = [None] * self.MAX_LEVEL
+        header.width = [1] * self.MAX_LEVEL
+        self._header = header
+        self._level = 1  # Число используемых уровней
+    
+    def _random_level(self):
+        """Случайная высота башни: геометрическое распределение с параметром SKIP_P."""
+        level = 1
+        while level < self.MAX_LEVEL and self._random.random() < self.SKIP_P:
+            level += 1
+        return level
+    
+    def _back(self, node):
+        """Шаг назад по верхнему уровню башни узла (к сторожу от головы)."""
+        top = len(node.forward) - 1
+        if top == 0:
+            return node.prev if node.prev is not None else self._header
+        return node.backward[top]
+    
+    def _search_position(self, position):
+        """
+        Спуск по уровням 1.._level-1 к последнему узлу с позицией < position.
+        Трудоемкость: O(log n) в среднем.
+        
+        Returns:
+            (update, positions): update[l] - узел уровня l перед позицией,
+            positions[l] - его позиция (0 - сторож)
+        """
+        update = [None] * self._level
+        positions = [0] * self._level
+        node = self._header
+        current = 0
+        for level in range(self._level - 1, 0, -1):
+            while node.forward[level] is not None and current + node.width[level] < position:
+                current += node.width[level]
+                node = node.forward[level]
+            update[level] = node
+            positions[level] = current
+        return update, positions
+    
+    def _skip_insert(self, node, index):
+        """
+        Постройка башни для узла, уже связанного на нижнем уровне
+        в позиции index (с нуля). Вызывается после увеличения _size.
+        Трудоемкость: O(log n) в среднем.
+        """
+        position = index + 1
+        level = self._random_level()
+        update, positions = self._search_position(position)
+        if level > self._level:
+            for i in range(self._level, level):
+                # Новый уровень: сторож ссылается "за конец" (n + 1 до вставки)
+                self._header.forward[i] = None
+                self._header.width[i] = self._size
+                update.append(self._header)
+                positions.append(0)
+            self._level = level
+        
+        if level > 1:
+            node.forward = [None] * level
+            node.backward = [None] * level
+            node.width = [1] * level
+            for i in range(1, level):
+                prev = update[i]
+                distance = position - positions[i]
+                following = prev.forward[i]
+                node.forward[i] = following
+                node.backward[i] = prev
+                node.width[i] = prev.width[i] - distance + 1
+                prev.forward[i] = node
+                prev.width[i] = distance
+                if following is not None:
+                    following.backward[i] = node
+        for i in range(max(level, 1), self._level):
+            update[i].width[i] += 1  # Ссылка перешагивает и новый узел
+    
+    def _skip_remove(self, node):
+        """
+        Удаление башни узла; вызывается до исключения узла с нижнего уровня.
+        Ссылки выше башни, перешагивающие узел, находятся подъемом назад.
+        Трудоемкость: O(log n) в среднем.
+        """
+        height = len(node.forward)
+        for i in range(1, height):
+            prev = node.backward[i]
+            following = node.forward[i]
+            prev.forward[i] = following
+            prev.width[i] += node.width[i] - 1
+            if following is not None:
+                following.backward[i] = prev
+        
+        current = node
+        for i in range(height, self._level):
+            while len(current.forward) <= i:
+                current = self._back(current)
+            current.width[i] -= 1
+        
+        while self._level > 1 and self._header.forward[self._level - 1] is None:
+            self._level -= 1
+        node.forward = node.backward = node.width = _GROUND
+    
+    def _rebuild_positional(self):
+        """
+        Построение индекса заново за один проход (после splice/split_after).
+        Трудоемкость: O(n).
+        """
+        self._reset_header()
+        last = [self._header] * self.MAX_LEVEL
+        last_positions = [0] * self.MAX_LEVEL
+        position = 0
+        current = self.head
+        while current is not None:
+            position += 1
+            level = self._random_level()
+            if level > 1:
+                current.forward = [None] * level
+                current.backward = [None] * level
+                current.width = [1] * level
+                for i in range(1, level):
+                    prev = last[i]
+                    prev.forward[i] = current
+                    prev.width[i] = position - last_positions[i]
+                    current.backward[i] = prev
+                    last[i] = current
+                    last_positions[i] = position
+                self._level = max(self._level, level)
+            else:
+                current.forward = current.backward = current.width = _GROUND
+            current = current.next
+        
+        for i in range(1, self._level):
+            last[i].forward[i] = None
+            last[i].width[i] = position + 1 - last_positions[i]
+        self.size = position
+    
+    def _new_node(self, data):
+        """
+        Новый узел: из пула, если он задан. В индексированном режиме
+        узел сразу регистрируется в индексе. O(1).
+        """
+        if self.pool is not None:
+            node = self.pool.acquire(data)
+        else:
+            node = self._node_class(data)
+        if self.indexed:
+            self._index_add(node)
+        return node
     
     def pushFront(self, data):
         """
         Вставка элемента в начало списка.
-        Трудоемкость: O(1).
+        Трудоемкость: O(1); в позиционном режиме O(log n).
         """
-        new_node = DoublyNode(data)
+        new_node = self._new_node(data)
         
         if self.head is None:
             self.head = new_node
@@ -39,15 +304,17 @@ class DoublyLinkedList:
             self.head.prev = new_node
             self.head = new_node
         
-        self.size += 1
+        self._size += 1
+        if self.positional:
+            self._skip_insert(new_node, 0)
         return new_node
     
     def pushBack(self, data):
         """
         Вставка элемента в конец списка.
-        Трудоемкость: O(1).
+        Трудоемкость: O(1); в позиционном режиме O(log n).
         """
-        new_node = DoublyNode(data)
+        new_node = self._new_node(data)
         
         if self.head is None:
             self.head = new_node
@@ -57,13 +324,16 @@ class DoublyLinkedList:
             self.tail.next = new_node
             self.tail = new_node
         
-        self.size += 1
+        self._size += 1
+        if self.positional:
+            self._skip_insert(new_node, self._size - 1)
         return new_node
     
     def insertAfter(self, node, data):
         """
         Вставка элемента после заданного узла.
-        Трудоемкость: O(1) - если есть прямая ссылка на узел.
+        Трудоемкость: O(1) - если есть прямая ссылка на узел;
+        в позиционном режиме O(log n).
         
         Args:
             node: узел, после которого вставляем
@@ -75,7 +345,8 @@ class DoublyLinkedList:
         if node is None:
             raise ValueError("Узел не может быть None")
         
-        new_node = DoublyNode(data)
+        index = self.index_of(node) + 1 if self.positional else None
+        new_node = self._new_node(data)
         new_node.prev = node
         new_node.next = node.next
         
@@ -86,14 +357,16 @@ class DoublyLinkedList:
             self.tail = new_node
         
         node.next = new_node
-        self.size += 1
+        self._size += 1
+        if self.positional:
+            self._skip_insert(new_node, index)
         
         return new_node
     
     def insertBefore(self, node, data):
         """
         Вставка элемента перед заданным узлом.
-        Трудоемкость: O(1).
+        Трудоемкость: O(1); в позиционном режиме O(log n).
         
         Args:
             node: узел, перед которым вставляем
@@ -105,7 +378,8 @@ class DoublyLinkedList:
         if node is None:
             raise ValueError("Узел не может быть None")
         
-        new_node = DoublyNode(data)
+        index = self.index_of(node) if self.positional else None
+        new_node = self._new_node(data)
         new_node.next = node
         new_node.prev = node.prev
         
@@ -116,14 +390,17 @@ class DoublyLinkedList:
             self.head = new_node
         
         node.prev = new_node
-        self.size += 1
+        self._size += 1
+        if self.positional:
+            self._skip_insert(new_node, index)
         
         return new_node
     
     def removeNode(self, node):
         """
         Удаление узла без предварительного поиска.
-        Трудоемкость: O(1) - благодаря двусвязности достаточно обновить ссылки соседей.
+        Трудоемкость: O(1) - благодаря двусвязности достаточно обновить ссылки соседей;
+        в позиционном режиме O(log n) на обновление индекса.
         
         Args:
             node: узел для удаления
@@ -133,6 +410,8 @@ class DoublyLinkedList:
         """
         if node is None:
             raise ValueError("Узел не может быть None")
+        if self.positional:
+            self._skip_remove(node)
         
         # Обновляем ссылку предыдущего узла
         if node.prev is not None:
@@ -148,17 +427,292 @@ class DoublyLinkedList:
             # Удаляем хвост
             self.tail = node.prev
         
-        self.size -= 1
-        return node.data
+        self._size -= 1
+        data = node.data
+        if self.indexed:
+            self._index_discard(node)
+        if self.pool is not None:
+            self.pool.release(node)  # Обнуляет prev/next - цикл ссылок разорван
+        return data
+    
+    def moveToFront(self, node):
+        """
+        Перенос существующего узла в начало списка без выделения нового.
+        Трудоемкость: O(1) - перевязка ссылок соседей; в позиционном режиме O(log n).
+        
+        Args:
+            node: узел этого списка
+        
+        Returns:
+            Тот же узел
+        """
+        if node is None:
+            raise ValueError("Узел не может быть None")
+        if node is self.head:
+            return node
+        if self.positional:
+            self._skip_remove(node)
+        
+        # Исключаем узел из текущего места (он не голова, значит prev есть)
+        node.prev.next = node.next
+        if node.next is not None:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        
+        node.prev = None
+        node.next = self.head
+        self.head.prev = node
+        self.head = node
+        if self.positional:
+            self._skip_insert(node, 0)
+        return node
+    
+    def _move_index(self, source, first, last):
+        """
+        Перенос индекса узлов first..last из source в этот список
+        (для индексированных списков) с подсчетом их числа.
+        Трудоемкость: O(k), k - длина цепочки.
+        """
+        count = 0
+        node = first
+        while True:
+            if source.indexed:
+                source._index_discard(node)
+            if self.indexed:
+                self._index_add(node)
+            count += 1
+            if node is last:
+                return count
+            node = node.next
+    
+    def splice(self, dest_node, src_list, first_node, last_node=None):
+        """
+        Перенос цепочки узлов first_node..last_node из src_list в этот
+        список сразу после dest_node (dest_node=None - в начало).
+        Узлы не копируются: перевязываются только концы цепочки.
+        src_list может совпадать с этим списком (перемещение отрезка),
+        но dest_node не должен лежать внутри переносимой цепочки.
+        
+        Трудоемкость: O(1); размеры обоих списков пересчитываются лениво
+        (если цепочка - весь src_list, размер известен сразу). Для
+        индексированных списков - O(k): узлы переносятся между индексами;
+        позиционный индекс затронутых списков строится заново за O(n).
+        
+        Args:
+            dest_node: узел этого списка, после которого вставляется цепочка
+            src_list: список-источник
+            first_node: первый узел цепочки в src_list
+            last_node: последний узел цепочки (None - хвост src_list);
+                       должен лежать не раньше first_node
+        """
+        if first_node is None:
+            raise ValueError("Узел не может быть None")
+        if self.positional and not src_list.positional:
+            raise ValueError("В позиционный список переносятся только узлы позиционного списка")
+        if last_node is None:
+            last_node = src_list.tail
+        
+        # Исключаем цепочку из источника
+        before, after = first_node.prev, last_node.next
+        if before is not None:
+            before.next = after
+        else:
+            src_list.head = after
+        if after is not None:
+            after.prev = before
+        else:
+            src_list.tail = before
+        
+        # Вставляем после dest_node
+        following = self.head if dest_node is None else dest_node.next
+        first_node.prev = dest_node
+        last_node.next = following
+        if dest_node is not None:
+            dest_node.next = first_node
+        else:
+            self.head = first_node
+        if following is not None:
+            following.prev = last_node
+        else:
+            self.tail = last_node
+        
+        if src_list is not self:
+            if self.indexed or src_list.indexed:
+                moved = self._move_index(src_list, first_node, last_node)
+                self._size += moved
+                src_list._size -= moved
+            elif src_list.head is None and not src_list._size_stale:
+                # Перенесен весь источник - его размер известен
+                self._size += src_list._size
+                src_list.size = 0
+            else:
+                self._size_stale = True
+                src_list._size_stale = src_list.head is not None
+                if src_list.head is None:
+                    src_list._size = 0
+            if src_list.positional:
+                src_list._rebuild_positional()
+        if self.positional:
+            self._rebuild_positional()
+    
+    def split_after(self, node):
+        """
+        Отделение всех узлов после node в новый список (с тем же пулом
+        и режимами индексов). Узлы не копируются.
+        Трудоемкость: O(1), размеры пересчитываются лениво;
+        для индексированного списка - O(k) на перенос индекса,
+        для позиционного - O(n) на построение индексов обеих частей.
+        
+        Returns:
+            Новый DoublyLinkedList с узлами после node
+        """
+        if node is None:
+            raise ValueError("Узел не может быть None")
+        
+        tail_list = DoublyLinkedList(pool=self.pool, indexed=self.indexed, positional=self.positional)
+        first = node.next
+        if first is None:
+            return tail_list
+        
+        tail_list.head = first
+        tail_list.tail = self.tail
+        first.prev = None
+        node.next = None
+        self.tail = node
+        
+        if self.indexed:
+            moved = tail_list._move_index(self, first, tail_list.tail)
+            tail_list._size = moved
+            self._size -= moved
+        else:
+            self._size_stale = True
+            tail_list._size_stale = True
+        if self.positional:
+            self._rebuild_positional()
+            tail_list._rebuild_positional()
+        return tail_list
+    
+    def concat(self, other):
+        """
+        Присоединение всех узлов other в конец этого списка;
+        other становится пустым. Узлы не копируются.
+        Трудоемкость: O(1); для индексированных списков - O(k).
+        """
+        if other is self:
+            raise ValueError("Нельзя присоединить список к самому себе")
+        if other.head is None:
+            return
+        self.splice(self.tail, other, other.head, other.tail)
+    
+    def _check_index(self, index):
+        if not 0 <= index < self.size:
+            raise IndexError(f"Индекс {index} выходит за границы [0, {self.size - 1}]")
+    
+    def node_at(self, index):
+        """
+        Узел с порядковым номером index (с нуля).
+        Трудоемкость: O(log n) в среднем в позиционном режиме, иначе O(n)
+        (проход от ближайшего конца).
+        
+        Raises:
+            IndexError: если индекс вне диапазона
+        """
+        self._check_index(index)
+        if self.positional:
+            position = index + 1
+            update, positions = self._search_position(position)
+            node, current = (update[1], positions[1]) if self._level > 1 else (self._header, 0)
+            # На нижнем уровне - в среднем 1 / SKIP_P шагов
+            node = self.head if node is self._header else node.next
+            current += 1
+            while current < position:
+                node = node.next
+                current += 1
+            return node
+        
+        if index < self.size // 2:
+            node = self.head
+            for _ in range(index):
+                node = node.next
+        else:
+            node = self.tail
+            for _ in range(self.size - 1 - index):
+                node = node.prev
+        return node
+    
+    def get(self, index):
+        """Элемент с порядковым номером index. Трудоемкость - как у node_at."""
+        return self.node_at(index).data
+    
+    def index_of(self, node):
+        """
+        Порядковый номер узла (с нуля).
+        Трудоемкость: O(log n) в среднем в позиционном режиме - подъем
+        назад по башням с суммированием ширин ссылок; иначе O(n).
+        В позиционном режиме принадлежность узла списку не проверяется.
+        
+        Raises:
+            ValueError: если узел None (или, без индекса, не из этого списка)
+        """
+        if node is None:
+            raise ValueError("Узел не может быть None")
+        if self.positional:
+            offset = 0
+            current = node
+            while current is not self._header:
+                top = len(current.forward) - 1
+                previous = self._back(current)
+                offset += previous.width[top] if top else 1
+                current = previous
+            return offset - 1
+        
+        current = self.head
+        index = 0
+        while current is not None:
+            if current is node:
+                return index
+            current = current.next
+            index += 1
+        raise ValueError("Узел не принадлежит списку")
+    
+    def insert_at(self, index, data):
+        """
+        Вставка элемента так, чтобы он получил номер index (0..size).
+        Трудоемкость: O(log n) в среднем в позиционном режиме, иначе O(n).
+        
+        Returns:
+            Новый узел
+        
+        Raises:
+            IndexError: если индекс вне диапазона
+        """
+        if not 0 <= index <= self.size:
+            raise IndexError(f"Индекс {index} выходит за границы [0, {self.size}]")
+        if index == self.size:
+            return self.pushBack(data)
+        return self.insertBefore(self.node_at(index), data)
     
     def find(self, value):
         """
         Поиск узла по значению.
-        Трудоемкость: O(n).
+        Трудоемкость: O(n); в индексированном режиме O(1) в среднем
+        для уникального значения. При дубликатах - O(n): узлы значения
+        хранятся без учета порядка в списке, и первый из них ищется
+        проходом от головы.
         
         Returns:
             Узел с найденным значением или None
         """
+        if self.indexed:
+            entry = self._index.get(value)
+            if type(entry) is not dict:
+                return entry
+            current = self.head
+            while current not in entry:
+                current = current.next
+            return current
+        
         current = self.head
         while current is not None:
             if current.data == value:
@@ -166,6 +720,27 @@ class DoublyLinkedList:
             current = current.next
         return None
     
+    def removeByValue(self, value):
+        """
+        Удаление первого узла с заданным значением.
+        Трудоемкость: O(n) на поиск; в индексированном режиме O(1) в среднем
+        для уникального значения и O(n) при дубликатах (см. find).
+        
+        Returns:
+            True, если элемент найден и удален, иначе False.
+        """
+        node = self.find(value)
+        if node is None:
+            return False
+        self.removeNode(node)
+        return True
+    
+    def __contains__(self, value):
+        """Проверка вхождения: O(1) в среднем в индексированном режиме, иначе O(n)."""
+        if self.indexed:
+            return value in self._index
+        return self.find(value) is not None
+    
     def toList(self):
         """Преобразование в Python list."""
         result = []
@@ -184,15 +759,51 @@ class DoublyLinkedList:
             current = current.prev
         return result
     
+    def memory_footprint(self, include_data=False):
+        """
+        Память, занимаемая списком, по sys.getsizeof.
+        Трудоемкость: O(n) - обход всех узлов.
+        
+        Args:
+            include_data: учитывать ли сами хранимые объекты
+        
+        Returns:
+            Словарь с размером объекта списка, узлов, индекса, данных
+            и числом байт на элемент
+        """
+        return linked_memory_footprint(self, include_data)
+    
+    def index_memory(self):
+        """
+        Накладные расходы индексов в байтах: словарь и множества узлов
+        дубликатов (без самих ключей-значений), а в позиционном режиме -
+        списки башен узлов и сторожа.
+        Трудоемкость: O(число значений), в позиционном режиме O(n).
+        """
+        total = 0
+        if self.indexed:
+            total += sys.getsizeof(self._index) + sum(
+                sys.getsizeof(entry) for entry in self._index.values() if type(entry) is dict)
+        if self.positional:
+            node = self._header
+            while node is not None:
+                if node.forward is not _GROUND:
+                    total += (sys.getsizeof(node.forward) + sys.getsizeof(node.backward)
+                              + sys.getsizeof(node.width))
+                node = self.head if node is self._header else node.next
+        return total
+    
     def __str__(self):
         """Строковое представление списка."""
         if self.head is None:
             return "DoublyLinkedList([])"
         
-        elements = self.toList()
-        if len(elements) > 10:
-            return f"DoublyLinkedList([{', '.join(map(str, elements[:5]))} ... {', '.join(map(str, elements[-5:]))}], size={self.size})"
-        return f"DoublyLinkedList({elements})"
+        if self.size > 10:
+            # Первые 5 от головы и последние 5 от хвоста, без копии всего списка
+            head = ', '.join(map(str, islice(self, 5)))
+            tail = ', '.join(map(str, reversed(list(islice(self.reverse_iter(), 5)))))
+            return f"DoublyLinkedList([{head} ... {tail}], size={self.size})"
+        return f"DoublyLinkedList({self.toList()})"
     
     def __len__(self):
         return self.size
@@ -240,6 +851,97 @@ class DoublyLinkedListIterator:
         return data
 
 
+def benchmark_splice(N=200000, batch=50000):
+    """
+    Перенос пачки из batch элементов из середины одного списка в конец
+    другого: removeNode + pushBack по элементу против splice.
+    """
+    print(f"\n=== Перенос {batch} элементов между списками ({N} элементов) ===\n")
+    
+    def build():
+        source, target = DoublyLinkedList(), DoublyLinkedList()
+        for i in range(N):
+            source.pushBack(i)
+        first = source.head
+        for _ in range(N // 4):
+            first = first.next
+        last = first
+        for _ in range(batch - 1):
+            last = last.next
+        return source, target, first, last
+    
+    source, target, first, last = build()
+    start_time = time.perf_counter()
+    node = first
+    while True:
+        following = node.next
+        target.pushBack(source.removeNode(node))
+        if node is last:
+            break
+        node = following
+    loop_time = time.perf_counter() - start_time
+    expected = target.toList()
+    
+    source, target, first, last = build()
+    start_time = time.perf_counter()
+    target.splice(target.tail, source, first, last)
+    splice_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    sizes = (source.size, target.size)
+    recount_time = time.perf_counter() - start_time
+    
+    print(f"   removeNode + pushBack:    {loop_time * 1e3:10.3f} мс")
+    print(f"   splice:                   {splice_time * 1e3:10.3f} мс")
+    print(f"   Ленивый пересчет size:    {recount_time * 1e3:10.3f} мс (размеры {sizes})")
+    print(f"   Результаты совпадают: {target.toList() == expected}")
+
+
+def benchmark_positional(N=100000, operations=2000):
+    """
+    Доступ по номеру и вставка в случайную позицию: обычный список
+    (проход от ближайшего конца) против позиционного режима.
+    """
+    rng = random.Random(42)
+    indices = [rng.randrange(N) for _ in range(operations)]
+    print(f"\n=== Позиционный доступ ({N} элементов, {operations} операций, мкс/операцию) ===\n")
+    print(f"   {'Режим':<14}{'Построение, с':>14}{'get(i)':>10}{'index_of':>10}"
+          f"{'insert_at':>11}{'removeNode':>12}{'Индекс, Б/эл.':>15}")
+    
+    for positional in (False, True):
+        start_time = time.perf_counter()
+        linked = DoublyLinkedList(positional=positional)
+        for i in range(N):
+            linked.pushBack(i)
+        build_time = time.perf_counter() - start_time
+        
+        timings = []
+        start_time = time.perf_counter()
+        nodes = [linked.node_at(i) for i in indices]
+        timings.append(time.perf_counter() - start_time)
+        
+        start_time = time.perf_counter()
+        for node in nodes:
+            linked.index_of(node)
+        timings.append(time.perf_counter() - start_time)
+        
+        start_time = time.perf_counter()
+        inserted = [linked.insert_at(i, -1) for i in indices]
+        timings.append(time.perf_counter() - start_time)
+        
+        start_time = time.perf_counter()
+        for node in inserted:
+            linked.removeNode(node)
+        timings.append(time.perf_counter() - start_time)
+        
+        per_element = linked.index_memory() / N
+        mode = "positional" if positional else "обычный"
+        print(f"   {mode:<14}{build_time:>14.3f}"
+              + "".join(f"{t / operations * 1e6:>{w}.1f}" for t, w in zip(timings, (10, 10, 11, 12)))
+              + f"{per_element:>15.1f}")
+    
+    print("\n   Цена индекса: вставки и удаления по узлу становятся O(log n) вместо O(1).")
+
+
 # Тестирование
 if __name__ == "__main__":
     print("=== Тестирование двусвязного списка ===\n")
@@ -353,6 +1055,62 @@ if __name__ == "__main__":
     dll3.removeNode(middle_node)
     print(f"    Результат: {dll3}")
     
+    # Память списка
+    print("\n13. Занимаемая память (memory_footprint):")
+    footprint = dll2.memory_footprint()
+    print(f"    {footprint}")
+    print(f"    Байт на элемент (без данных): {footprint['bytes_per_element']:.1f}")
+    
+    # Индексированный режим
+    print("\n14. Индексированный режим (indexed=True):")
+    indexed_dll = DoublyLinkedList(indexed=True)
+    for value in ['a', 'b', 'c', 'b']:
+        indexed_dll.pushBack(value)
+    node_c = indexed_dll.find('c')  # O(1) - из индекса
+    indexed_dll.insertBefore(node_c, 'x')
+    print(f"    {indexed_dll}, 'x' in список = {'x' in indexed_dll}")
+    indexed_dll.removeByValue('b')  # Удаляется первое вхождение
+    print(f"    После removeByValue('b'): {indexed_dll}")
+    print(f"    {indexed_dll.memory_footprint()}")
+    
+    print("\n15. Перенос узла в начало (moveToFront):")
+    recent = DoublyLinkedList()
+    nodes = [recent.pushBack(page) for page in ['/home', '/docs', '/blog', '/about']]
+    recent.moveToFront(nodes[2])
+    recent.moveToFront(nodes[3])
+    print(f"    {recent}, обратный порядок: {recent.toListReverse()}")
+    
+    print("\n16. Перенос цепочек узлов: splice, split_after, concat:")
+    shard_a, shard_b = DoublyLinkedList(), DoublyLinkedList()
+    nodes_a = [shard_a.pushBack(f"a{i}") for i in range(6)]
+    for i in range(3):
+        shard_b.pushBack(f"b{i}")
+    shard_b.splice(shard_b.head, shard_a, nodes_a[1], nodes_a[3])
+    print(f"    splice(a1..a3 после b0): a = {shard_a.toList()}, b = {shard_b.toList()}")
+    print(f"    Размеры (пересчитаны лениво): {shard_a.size}, {shard_b.size}")
+    rest = shard_b.split_after(nodes_a[3])
+    print(f"    split_after(a3): b = {shard_b.toList()}, хвост = {rest.toList()}")
+    shard_a.concat(rest)
+    print(f"    a.concat(хвост): a = {shard_a}, хвост пуст: {len(rest) == 0}")
+    
+    print("\n17. Позиционный режим (positional=True):")
+    playlist = DoublyLinkedList(positional=True)
+    for track in ['intro', 'verse', 'chorus', 'outro']:
+        playlist.pushBack(track)
+    bridge = playlist.insert_at(3, 'bridge')
+    playlist.insertAfter(playlist.head, 'hook')
+    print(f"    {playlist}")
+    print(f"    get(2) = {playlist.get(2)}, index_of(bridge) = {playlist.index_of(bridge)}")
+    playlist.removeNode(playlist.node_at(1))
+    print(f"    После removeNode(node_at(1)): {playlist}, index_of(bridge) = {playlist.index_of(bridge)}")
+    try:
+        playlist.get(10)
+    except IndexError as e:
+        print(f"    get(10): Ошибка: {e}")
+    
+    benchmark_splice()
+    benchmark_positional()
+    
     print("\n=== Преимущества двусвязного списка ===")
     print("✓ Вставка после/перед узлом: O(1)")
     print("✓ Удаление узла без поиска: O(1)")
@@ -364,5 +1122,13 @@ if __name__ == "__main__":
     print("pushFront/pushBack:  O(1)")
     print("insertAfter/Before:  O(1) - при наличии ссылки на узел")
     print("removeNode:          O(1) - при наличии ссылки на узел")
-    print("find:                O(n) - поиск узла")
+    print("moveToFront:         O(1) - перевязка без нового узла")
+    print("splice/split/concat: O(1) - перевязка концов цепочки")
+    print("size после splice:   O(n) один раз - ленивый пересчет")
+    print("get/node_at:         O(log n) в позиционном режиме, иначе O(n)")
+    print("index_of:            O(log n) в позиционном режиме, иначе O(n)")
+    print("insert_at:           O(log n) в позиционном режиме, иначе O(n)")
+    print("find:                O(n) - поиск узла (с индексом - O(1) в среднем,\n"
+          "                     для дубликатов - O(n))")
+    print("removeByValue:       O(n) (с индексом - O(1) в среднем, для дубликатов - O(n))")
     print("Итерация:            O(n) - в обоих направлениях")
@@ -0,0 +1,521 @@
+"""
+Задание 4 (дополнение). Кэши LRU и LFU на двусвязном списке
+Кэш - словарь "ключ -> узел" плюс двусвязный список, задающий порядок
+вытеснения. Словарь находит узел за O(1), а двусвязный список за O(1)
+переносит его (moveToFront) и удаляет (removeNode) без поиска.
+
+- LRUCache: список упорядочен по времени последнего обращения,
+  вытесняется хвост - элемент, к которому дольше всего не обращались;
+- LFUCache: по отдельному двусвязному списку на каждую частоту
+  обращений, вытесняется самый давний элемент с наименьшей частотой.
+
+Емкость задается числом записей (max_entries), суммарным размером
+значений в байтах (max_bytes) или обоими ограничениями. Записи могут
+устаревать через ttl секунд. Декоратор memoize кэширует результаты
+функции.
+"""
+
+import functools
+import random
+import sys
+import time
+from collections import OrderedDict
+
+from zadanie_04_doubly_linked_list import DoublyLinkedList
+
+
+class _CacheEntry:
+    """Запись кэша - данные узла двусвязного списка."""
+    
+    __slots__ = ('key', 'value', 'size', 'expires', 'freq')
+    
+    def __init__(self, key, value, size, expires, freq=1):
+        self.key = key
+        self.value = value
+        self.size = size        # Размер значения в байтах (0 без max_bytes)
+        self.expires = expires  # Момент устаревания по clock или None
+        self.freq = freq        # Число обращений (используется LFUCache)
+
+
+_MISSING = object()  # Отличает промах от закэшированного None
+
+
+class LRUCache:
+    """Кэш с вытеснением давно не использованных записей (Least Recently Used)."""
+    
+    def __init__(self, max_entries=None, max_bytes=None, ttl=None,
+                 sizeof=sys.getsizeof, clock=time.monotonic):
+        """
+        Args:
+            max_entries: максимальное число записей
+            max_bytes: максимальный суммарный размер значений в байтах
+            ttl: время жизни записи в секундах (None - без устаревания)
+            sizeof: функция размера значения для max_bytes
+                    (по умолчанию sys.getsizeof - без вложенных объектов)
+            clock: источник времени для ttl
+        """
+        if max_entries is None and max_bytes is None:
+            raise ValueError("Нужно задать max_entries или max_bytes")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries должно быть положительным")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes должно быть положительным")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl должно быть положительным")
+        
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.clock = clock
+        self._nodes = {}  # Ключ -> узел списка с _CacheEntry
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0    # Вытеснено из-за нехватки места
+        self.expirations = 0  # Удалено по истечении ttl
+        self.rejected = 0     # Значение больше max_bytes - не закэшировано
+        self._init_order()
+    
+    # Порядок вытеснения: в LRUCache - один список, голова - самая свежая запись
+    
+    def _init_order(self):
+        self._order = DoublyLinkedList()
+    
+    def _link(self, entry):
+        """Добавление записи в порядок вытеснения. O(1)."""
+        return self._order.pushFront(entry)
+    
+    def _unlink_order(self, node):
+        """Исключение узла из порядка вытеснения. O(1)."""
+        self._order.removeNode(node)
+    
+    def _touch(self, node):
+        """Отметка обращения к записи. O(1)."""
+        self._order.moveToFront(node)
+    
+    def _victim(self):
+        """Узел-кандидат на вытеснение. O(1)."""
+        return self._order.tail
+    
+    def _unlink(self, node):
+        """Удаление записи из кэша: из словаря и из порядка вытеснения. O(1)."""
+        entry = node.data
+        self._unlink_order(node)
+        del self._nodes[entry.key]
+        self.bytes -= entry.size
+    
+    def _expired(self, entry):
+        return entry.expires is not None and entry.expires <= self.clock()
+    
+    def _make_room(self, size):
+        """
+        Вытеснение записей, пока новая запись размера size не поместится.
+        Трудоемкость: O(1) на вытесненную запись.
+        """
+        while self._nodes and (
+                (self.max_entries is not None and len(self._nodes) >= self.max_entries)
+                or (self.max_bytes is not None and self.bytes + size > self.max_bytes)):
+            victim = self._victim()
+            if self._expired(victim.data):
+                self.expirations += 1
+            else:
+                self.evictions += 1
+            self._unlink(victim)
+    
+    def get(self, key, default=None):
+        """
+        Значение по ключу; обращение делает запись самой свежей.
+        Устаревшая запись удаляется и считается промахом.
+        Трудоемкость: O(1) в среднем.
+        """
+        node = self._nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        
+        entry = node.data
+        if self._expired(entry):
+            self._unlink(node)
+            self.expirations += 1
+            self.misses += 1
+            return default
+        
+        self.hits += 1
+        self._touch(node)
+        return entry.value
+    
+    def put(self, key, value, ttl=None):
+        """
+        Добавление или замена значения с вытеснением при нехватке места.
+        Трудоемкость: O(1) в среднем + O(1) на каждую вытесненную запись.
+        
+        Args:
+            ttl: время жизни этой записи (по умолчанию - ttl кэша)
+        
+        Returns:
+            True, если значение закэшировано; False, если оно одно
+            больше max_bytes (прежнее значение ключа при этом удаляется)
+        """
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        freq = 1
+        node = self._nodes.get(key)
+        if node is not None:
+            # Замена: старая запись убирается, чтобы не вытеснить саму себя
+            freq = node.data.freq + 1
+            self._unlink(node)
+        
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.rejected += 1
+            return False
+        
+        self._make_room(size)
+        ttl = self.ttl if ttl is None else ttl
+        expires = self.clock() + ttl if ttl is not None else None
+        self._nodes[key] = self._link(_CacheEntry(key, value, size, expires, freq))
+        self.bytes += size
+        return True
+    
+    def delete(self, key):
+        """
+        Удаление записи по ключу. O(1) в среднем.
+        
+        Returns:
+            True, если ключ был в кэше
+        """
+        node = self._nodes.get(key)
+        if node is None:
+            return False
+        self._unlink(node)
+        return True
+    
+    def purge_expired(self):
+        """
+        Удаление всех устаревших записей (без обращения к ним get).
+        Трудоемкость: O(n).
+        
+        Returns:
+            Число удаленных записей
+        """
+        expired = [node for node in self._nodes.values() if self._expired(node.data)]
+        for node in expired:
+            self._unlink(node)
+        self.expirations += len(expired)
+        return len(expired)
+    
+    def clear(self):
+        """Удаление всех записей; счетчики сохраняются."""
+        self._nodes.clear()
+        self.bytes = 0
+        self._init_order()
+    
+    def stats(self):
+        """Счетчики кэша и доля попаданий."""
+        requests = self.hits + self.misses
+        return {
+            'entries': len(self._nodes),
+            'bytes': self.bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / requests if requests else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'rejected': self.rejected,
+        }
+    
+    def keys(self):
+        """Ключи в порядке вытеснения: первым - следующий кандидат. O(n)."""
+        return [entry.key for entry in self._order.reverse_iter()]
+    
+    def __contains__(self, key):
+        """Проверка наличия неустаревшей записи без отметки обращения. O(1)."""
+        node = self._nodes.get(key)
+        return node is not None and not self._expired(node.data)
+    
+    def __len__(self):
+        return len(self._nodes)
+    
+    def __str__(self):
+        keys = self.keys() if len(self._nodes) <= 10 else '...'
+        return (f"{type(self).__name__}({keys}, entries={len(self._nodes)}, "
+                f"bytes={self.bytes}, hits={self.hits}, misses={self.misses})")
+
+
+class LFUCache(LRUCache):
+    """
+    Кэш с вытеснением редко используемых записей (Least Frequently Used).
+    Для каждой частоты обращений - свой двусвязный список (корзина);
+    внутри корзины записи упорядочены по давности, как в LRUCache.
+    """
+    
+    def _init_order(self):
+        self._buckets = {}  # Частота -> DoublyLinkedList записей
+        self.min_freq = 0
+    
+    def _link(self, entry):
+        """Добавление записи в голову корзины ее частоты. O(1)."""
+        bucket = self._buckets.get(entry.freq)
+        if bucket is None:
+            bucket = self._buckets[entry.freq] = DoublyLinkedList()
+        if not self._nodes or entry.freq < self.min_freq:
+            self.min_freq = entry.freq
+        return bucket.pushFront(entry)
+    
+    def _unlink_order(self, node):
+        """
+        Исключение узла из корзины; пустая корзина удаляется.
+        Трудоемкость: O(1), если не опустела корзина минимальной частоты,
+        иначе O(число различных частот) на поиск новой минимальной.
+        """
+        freq = node.data.freq
+        bucket = self._buckets[freq]
+        bucket.removeNode(node)
+        if bucket.size == 0:
+            del self._buckets[freq]
+            if freq == self.min_freq:
+                self.min_freq = min(self._buckets) if self._buckets else 0
+    
+    def _touch(self, node):
+        """
+        Переход записи в корзину следующей частоты. O(1).
+        Узел пересоздается в другом списке, поэтому словарь обновляется.
+        """
+        entry = node.data
+        bucket = self._buckets[entry.freq]
+        bucket.removeNode(node)
+        if bucket.size == 0:
+            del self._buckets[entry.freq]
+            if entry.freq == self.min_freq:
+                self.min_freq += 1  # Запись переходит ровно в следующую корзину
+        entry.freq += 1
+        bucket = self._buckets.get(entry.freq)
+        if bucket is None:
+            bucket = self._buckets[entry.freq] = DoublyLinkedList()
+        self._nodes[entry.key] = bucket.pushFront(entry)
+    
+    def _victim(self):
+        """Самая давняя запись в корзине минимальной частоты. O(1)."""
+        return self._buckets[self.min_freq].tail
+    
+    def frequencies(self):
+        """Частота обращений каждого ключа. O(n)."""
+        return {key: node.data.freq for key, node in self._nodes.items()}
+    
+    def keys(self):
+        """Ключи в порядке вытеснения: по возрастанию частоты, затем давности. O(n)."""
+        return [entry.key
+                for freq in sorted(self._buckets)
+                for entry in self._buckets[freq].reverse_iter()]
+
+
+_FAST_KEY_TYPES = {int, str}  # Как в functools: сам аргумент - ключ только для точных int/str
+
+
+def _make_key(args, kwargs):
+    """
+    Хешируемый ключ вызова: кортеж позиционных аргументов и отсортированные
+    именованные. Единственный аргумент типа int или str служит ключом сам -
+    он не может совпасть с кортежем аргументов другого вызова.
+    """
+    if not kwargs:
+        if len(args) == 1 and type(args[0]) in _FAST_KEY_TYPES:
+            return args[0]
+        return args
+    return args + (_MISSING,) + tuple(sorted(kwargs.items()))
+
+
+def memoize(cache=None, **cache_options):
+    """
+    Декоратор кэширования результатов функции.
+    Аргументы вызова должны быть хешируемыми.
+    
+    Args:
+        cache: готовый кэш (LRUCache или LFUCache); если не задан,
+               создается LRUCache(**cache_options), по умолчанию на 128 записей
+    
+    Пример:
+        @memoize(max_entries=1000, ttl=60)
+        def load_user(user_id): ...
+        
+        load_user.cache.stats()
+    """
+    if cache is None:
+        cache_options.setdefault('max_entries', 128)
+        cache = LRUCache(**cache_options)
+    elif cache_options:
+        raise ValueError("Параметры кэша задаются либо cache, либо именованными аргументами")
+    
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs)
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                cache.put(key, result)
+            return result
+        
+        wrapper.cache = cache
+        return wrapper
+    
+    return decorator
+
+
+class _OrderedDictLRU:
+    """LRU на OrderedDict (для сравнения): move_to_end и popitem на C."""
+    
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.data = OrderedDict()
+    
+    def get(self, key, default=None):
+        try:
+            self.data.move_to_end(key)
+        except KeyError:
+            return default
+        return self.data[key]
+    
+    def put(self, key, value):
+        self.data[key] = value
+        self.data.move_to_end(key)
+        if len(self.data) > self.max_entries:
+            self.data.popitem(last=False)
+
+
+def _zipf_keys(count, universe, s=1.1, seed=42):
+    """Последовательность ключей с распределением Ципфа: немногие ключи популярны."""
+    rng = random.Random(seed)
+    weights = [1 / (rank ** s) for rank in range(1, universe + 1)]
+    keys = list(range(universe))
+    rng.shuffle(keys)
+    return rng.choices(keys, weights, k=count)
+
+
+def benchmark_caches(requests=200000, universe=20000, capacity=1000):
+    """
+    Нагрузка "прочитать, при промахе - записать" на ключах Ципфа:
+    доля попаданий и время на запрос для LRUCache, LFUCache,
+    LRU на OrderedDict и functools.lru_cache.
+    Затем - сканирование (однократный проход по редким ключам посреди
+    популярных), на котором LFU сохраняет популярные ключи, а LRU - нет.
+    """
+    keys = _zipf_keys(requests, universe)
+    print(f"\n=== Кэши: {requests} запросов, {universe} ключей (Ципф), емкость {capacity} ===\n")
+    print(f"   {'Кэш':<24}{'Попадания':>11}{'мкс/запрос':>12}")
+    
+    def run(cache):
+        start_time = time.perf_counter()
+        hits = 0
+        for key in keys:
+            if cache.get(key, _MISSING) is _MISSING:
+                cache.put(key, key)
+            else:
+                hits += 1
+        return hits / requests, (time.perf_counter() - start_time) / requests * 1e6
+    
+    for name, cache in (("LRUCache", LRUCache(max_entries=capacity)),
+                        ("LFUCache", LFUCache(max_entries=capacity)),
+                        ("OrderedDict LRU", _OrderedDictLRU(capacity))):
+        hit_rate, per_request = run(cache)
+        print(f"   {name:<24}{hit_rate:>11.1%}{per_request:>12.2f}")
+    
+    @functools.lru_cache(maxsize=capacity)
+    def identity(key):
+        return key
+    
+    start_time = time.perf_counter()
+    for key in keys:
+        identity(key)
+    per_request = (time.perf_counter() - start_time) / requests * 1e6
+    info = identity.cache_info()
+    print(f"   {'functools.lru_cache':<24}{info.hits / requests:>11.1%}{per_request:>12.2f}")
+    
+    # Сканирование: популярные ключи, затем проход по 5 * capacity редких
+    hot = list(range(capacity // 2))
+    scan = list(range(universe, universe + 5 * capacity))
+    workload = hot * 5 + scan + hot
+    print(f"\n   Сканирование {len(scan)} редких ключей между обращениями к {len(hot)} популярным:")
+    for name, cache in (("LRUCache", LRUCache(max_entries=capacity)),
+                        ("LFUCache", LFUCache(max_entries=capacity))):
+        for key in workload[:-len(hot)]:
+            if cache.get(key, _MISSING) is _MISSING:
+                cache.put(key, key)
+        survived = sum(key in cache for key in hot)
+        print(f"   {name:<24}популярных ключей в кэше после сканирования: {survived}/{len(hot)}")
+    
+    print("\n   OrderedDict и lru_cache реализованы на C и быстрее в разы;")
+    print("   LRUCache/LFUCache добавляют ограничение по байтам, ttl и LFU-вытеснение.")
+
+
+# Тестирование
+if __name__ == "__main__":
+    print("=== Тестирование кэшей LRU и LFU ===\n")
+    
+    print("1. LRUCache на 3 записи:")
+    lru = LRUCache(max_entries=3)
+    for key in ['a', 'b', 'c']:
+        lru.put(key, key.upper())
+    print(f"   {lru}")
+    print(f"   get('a') = {lru.get('a')} - 'a' становится самой свежей")
+    lru.put('d', 'D')
+    print(f"   put('d'): вытеснена 'b' -> {lru}")
+    print(f"   get('b') = {lru.get('b')}, {lru.stats()}")
+    
+    print("\n2. LFUCache на 3 записи:")
+    lfu = LFUCache(max_entries=3)
+    for key in ['a', 'b', 'c']:
+        lfu.put(key, key.upper())
+    for key in ['a', 'a', 'b']:
+        lfu.get(key)
+    print(f"   Частоты: {lfu.frequencies()}")
+    lfu.put('d', 'D')
+    print(f"   put('d'): вытеснена 'c' (частота 1) -> {lfu}")
+    
+    print("\n3. Ограничение по байтам:")
+    sized = LRUCache(max_bytes=300, sizeof=len)
+    for name, payload in [('x', b'1' * 100), ('y', b'2' * 150), ('z', b'3' * 120)]:
+        sized.put(name, payload)
+        print(f"   put('{name}', {len(payload)} байт): ключи {sized.keys()}, {sized.bytes} байт")
+    print(f"   put('big', 500 байт) = {sized.put('big', b'0' * 500)}, rejected = {sized.rejected}")
+    
+    print("\n4. Время жизни записей (ttl):")
+    now = [0.0]
+    timed = LRUCache(max_entries=10, ttl=5, clock=lambda: now[0])
+    timed.put('session', 'token-1')
+    timed.put('config', 'v2', ttl=60)
+    now[0] = 6.0
+    print(f"   Через 6 с: get('session') = {timed.get('session')}, get('config') = {timed.get('config')}")
+    print(f"   expirations = {timed.expirations}")
+    
+    print("\n5. Декоратор memoize:")
+    calls = []
+    
+    @memoize(max_entries=100)
+    def slow_square(x):
+        calls.append(x)
+        return x * x
+    
+    results = [slow_square(x) for x in [2, 3, 2, 2, 3, 4]]
+    print(f"   Результаты: {results}, реальных вызовов: {calls}")
+    print(f"   {slow_square.cache.stats()}")
+    
+    @memoize(cache=LFUCache(max_entries=2))
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+    
+    print(f"   fib(30) с LFU-кэшем на 2 записи = {fib(30)}, {fib.cache.stats()['hits']} попаданий")
+    
+    @memoize(max_entries=10)
+    def pack(*args):
+        return args
+    
+    print(f"   pack((1, 2)) = {pack((1, 2))}, pack(1, 2) = {pack(1, 2)} - разные ключи")
+    
+    benchmark_caches()
+    
+    print("\n=== Анализ трудоемкости ===")
+    print("get/put (LRU):       O(1) - словарь + moveToFront/removeNode")
+    print("get/put (LFU):       O(1) - переход в корзину следующей частоты")
+    print("Вытеснение:          O(1) на запись")
+    print("purge_expired:       O(n)")
+    print("Память:              словарь + узел списка + запись на ключ")
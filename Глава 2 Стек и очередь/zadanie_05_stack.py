@@ -66,16 +66,22 @@ class Node:
 class StackLinkedList:
     """Стек на основе связного списка."""
     
-    def __init__(self):
+    def __init__(self, pool=None):
+        """
+        Args:
+            pool: необязательный пул узлов с методами acquire(data) и
+                  release(node) - снятые с вершины узлы используются повторно
+        """
         self.head = None
         self._size = 0
+        self.pool = pool
     
     def push(self, value):
         """
         Добавление элемента на вершину стека.
         Трудоемкость: O(1).
         """
-        new_node = Node(value)
+        new_node = Node(value) if self.pool is None else self.pool.acquire(value)
         new_node.next = self.head
         self.head = new_node
         self._size += 1
@@ -91,9 +97,12 @@ class StackLinkedList:
         if self.isEmpty():
             raise IndexError("Стек пуст")
         
-        value = self.head.data
-        self.head = self.head.next
+        node = self.head
+        value = node.data
+        self.head = node.next
         self._size -= 1
+        if self.pool is not None:
+            self.pool.release(node)
         return value
     
     def peek(self):